@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+플래시카드 메모리 사용량 벤치마크
+
+생성기가 만드는 것과 같은 모양의 카드(질문, 답변, LLM 태그 + source 태그)를
+Flashcard 리스트, CompactFlashcard 리스트, CardCollection에 담아 카드당 메모리를 비교합니다.
+질문/답변 문자열은 세 방식이 공유하므로 측정값은 카드 객체와 태그가 차지하는 오버헤드입니다.
+"""
+import sys
+import os
+import gc
+import time
+import random
+import argparse
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.Entity.flashcard import Flashcard, CompactFlashcard
+from src.Entity.card_collection import CardCollection
+
+
+TAG_POOL = ["프로그래밍", "언어", "파이썬", "알고리즘", "자료구조", "역사", "이론", "생물학", "세포", "에너지"]
+
+
+def make_raw_cards(count: int, files: int, seed: int = 42):
+    """(질문, 답변, 'Tags:' 줄의 텍스트, 파일 이름) 목록"""
+    rng = random.Random(seed)
+    raw = []
+    for i in range(count):
+        tags_text = ", ".join(rng.sample(TAG_POOL, rng.randint(1, 3)))
+        raw.append((f"질문 {i}: {rng.choice(TAG_POOL)}은 무엇인가?",
+                    f"답변 {i}: " + " ".join(rng.choice(TAG_POOL) for _ in range(12)),
+                    tags_text, f"document_{i % files}.pdf"))
+    return raw
+
+
+def build_flashcards(raw):
+    """기존 파서처럼 카드마다 새 태그 리스트와 문자열 생성"""
+    return [
+        Flashcard(question=q, answer=a, tags=[tag.strip() for tag in tags_text.split(',')] + [f"source:{file_name}"])
+        for q, a, tags_text, file_name in raw
+    ]
+
+
+def build_compact(raw):
+    return [
+        CompactFlashcard(q, a, [tag.strip() for tag in tags_text.split(',')] + [f"source:{file_name}"])
+        for q, a, tags_text, file_name in raw
+    ]
+
+
+def build_collection(raw):
+    collection = CardCollection()
+    for q, a, tags_text, file_name in raw:
+        collection.append(CompactFlashcard(q, a, [tag.strip() for tag in tags_text.split(',')] + [f"source:{file_name}"]))
+    return collection
+
+
+def measure(builder, raw):
+    """구조를 만든 뒤 남아 있는 메모리(바이트)와 걸린 시간"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    cards = builder(raw)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cards
+    return current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='플래시카드 메모리 사용량 벤치마크')
+    parser.add_argument('--cards', type=int, default=200000, help='카드 수')
+    parser.add_argument('--files', type=int, default=50, help='원본 파일 수 (source 태그 종류)')
+    args = parser.parse_args()
+
+    raw = make_raw_cards(args.cards, args.files)
+    print(f"카드 수: {args.cards}, 원본 파일 수: {args.files}")
+
+    baseline = None
+    for name, builder in (("Flashcard 리스트", build_flashcards),
+                          ("CompactFlashcard 리스트", build_compact),
+                          ("CardCollection", build_collection)):
+        size, elapsed = measure(builder, raw)
+        baseline = baseline or size
+        print(f"{name}: {size / (1024 * 1024):.1f}MB (카드당 {size / args.cards:.0f}바이트, "
+              f"기존 대비 {size / baseline:.2f}배), {elapsed:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
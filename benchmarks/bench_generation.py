@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+카드 생성 처리량 벤치마크 (오프라인, 모의 LLM 서버 사용)
+
+benchmarks/mock_llm_server.py의 모의 서버를 띄우고, 크기를 늘려 가며 만든 합성 PDF/Markdown/텍스트
+문서마다 FlashcardGeneratorService.generate_cards_from_pdf로 모든 섹션을 처리해
+섹션/초, 카드/초, LLM 호출 지연 시간(p50/p99), 최대 RSS를 보고합니다.
+각 문서는 별도 프로세스에서 처리하므로 최대 RSS는 문서마다 따로 측정됩니다.
+
+    python benchmarks/bench_generation.py --sizes 20,80,320 --latency 0.05 --max-concurrency 8
+    python benchmarks/bench_generation.py --json-out before.json   # 변경 전후 비교용
+    python benchmarks/bench_generation.py --endpoints 4 --backend-parallel 2 --max-concurrency 8   # 엔드포인트 풀
+"""
+import sys
+import os
+import json
+import math
+import logging
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.mock_llm_server import MockLLMServer
+
+
+WORDS = ["learning", "memory", "neuron", "protein", "algorithm", "history", "theory", "energy",
+         "cell", "structure", "network", "signal", "enzyme", "gradient", "evolution", "language",
+         "compiler", "function", "market", "climate", "molecule", "pattern", "record", "system"]
+
+
+def make_paragraphs(size_kb: int, seed: int = 42) -> List[str]:
+    """size_kb 크기의 영문 합성 문단 목록 (PDF 기본 글꼴로 표현할 수 있도록 ASCII만 사용)"""
+    rng = random.Random(seed)
+    target = size_kb * 1024
+    paragraphs, size = [], 0
+    while size < target:
+        sentences = []
+        for _ in range(rng.randint(3, 6)):
+            sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 18)))
+            sentences.append(sentence.capitalize() + rng.choice(".!?"))
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return paragraphs
+
+
+def write_text(path: str, paragraphs: List[str]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n\n".join(paragraphs))
+
+
+def write_markdown(path: str, paragraphs: List[str]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for i, paragraph in enumerate(paragraphs):
+            if i % 5 == 0:
+                f.write(f"## Chapter {i // 5 + 1}\n\n")
+            f.write(paragraph + "\n\n")
+
+
+def write_pdf(path: str, paragraphs: List[str], line_chars: int = 90, lines_per_page: int = 60) -> None:
+    """기본 Helvetica 글꼴로 텍스트만 담은 최소 PDF 작성 (PyPDF2로 텍스트 추출 가능)"""
+    lines: List[str] = []
+    for paragraph in paragraphs:
+        line = ""
+        for word in paragraph.split():
+            if len(line) + len(word) + 1 > line_chars:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.extend([line, ""])
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_lines in pages:
+        escaped = (line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') for line in page_lines)
+        stream = "BT /F1 10 Tf 12 TL 50 800 Td " + " ".join(f"({line}) '" for line in escaped) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode('latin-1')
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+WRITERS = {'pdf': write_pdf, 'md': write_markdown, 'txt': write_text}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """최근접 순위 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(file_path: str, base_url: str, env: Dict[str, str]) -> Dict:
+    """문서 하나를 처리하고 측정값 반환 (별도 프로세스에서 실행)"""
+    os.environ.update(env)
+
+    from src.Config.llm_config import LLMConfig
+    from src.Service.llm_service import LLMService
+    from src.Service.pdf_reader_service import FileReaderService
+    from src.Service.flashcard_generator_service import FlashcardGeneratorService
+
+    class TimedLLMService(LLMService):
+        """호출마다 재시도와 대기를 포함한 지연 시간 기록"""
+
+        def __init__(self, config: LLMConfig):
+            super().__init__(config)
+            self.latencies: List[float] = []
+
+        async def acall_api_with_retry(self, messages):
+            start = time.perf_counter()
+            try:
+                return await super().acall_api_with_retry(messages)
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+        async def astream_api_with_retry(self, messages):
+            start = time.perf_counter()
+            try:
+                async for chunk in super().astream_api_with_retry(messages):
+                    yield chunk
+            finally:
+                self.latencies.append(time.perf_counter() - start)
+
+    # 재시도 경고 등 로그가 결과 표를 가리지 않도록 오류만 출력
+    logging.getLogger().setLevel(logging.ERROR)
+
+    config = LLMConfig()
+    config.ollama_base_url = base_url
+    config.openrouter_base_url = base_url
+    llm_service = TimedLLMService(config)
+    generator = FlashcardGeneratorService(llm_service, FileReaderService(config), config)
+
+    start = time.perf_counter()
+    cards = generator.generate_cards_from_pdf(file_path, process_all=True)
+    elapsed = time.perf_counter() - start
+    llm_service.close()
+
+    stats = generator.stats.snapshot()
+    return {
+        'sections': stats['sections_done'],
+        'failed_sections': stats['sections_failed'],
+        'cards': len(cards),
+        'llm_calls': len(llm_service.latencies),
+        'elapsed_seconds': elapsed,
+        'sections_per_second': stats['sections_done'] / elapsed,
+        'cards_per_second': len(cards) / elapsed,
+        'latency_p50': percentile(llm_service.latencies, 0.50),
+        'latency_p99': percentile(llm_service.latencies, 0.99),
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def total_stats(servers: List[MockLLMServer]) -> Dict[str, int]:
+    """모든 모의 서버의 요청/오류 수 합계"""
+    stats = [backend.get_stats() for backend in servers]
+    return {'requests': sum(s['requests'] for s in stats), 'errors': sum(s['errors'] for s in stats)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='카드 생성 처리량 벤치마크 (모의 LLM 서버)')
+    parser.add_argument('--sizes', default='20,80,320', help='문서 크기 목록 (KB, 쉼표 구분)')
+    parser.add_argument('--formats', default='pdf,md,txt', help='문서 형식 (pdf, md, txt)')
+    parser.add_argument('--provider', default='ollama', choices=['ollama', 'openrouter'],
+                        help='모의 서버에 사용할 프로토콜 (openrouter: OpenAI 호환 /chat/completions)')
+    parser.add_argument('--latency', type=float, default=0.05, help='모의 응답 지연 시간 (초)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='지연 시간 변동 폭 (±초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 응답 비율 (0-1)')
+    parser.add_argument('--endpoints', type=int, default=1,
+                        help='모의 서버 수 (2 이상이면 LLM_ENDPOINTS 풀로 분산)')
+    parser.add_argument('--backend-parallel', type=int, default=0,
+                        help='모의 서버 하나가 동시에 처리하는 요청 수 (0이면 제한 없음)')
+    parser.add_argument('--max-concurrency', type=int, default=4, help='동시 LLM 요청 수')
+    parser.add_argument('--streaming', action='store_true', help='스트리밍 응답 사용 (LLM_STREAMING)')
+    parser.add_argument('--packing', action='store_true', help='작은 섹션 묶음 요청 사용 (SECTION_PACKING_ENABLED)')
+    parser.add_argument('--heuristic-filter', action='store_true',
+                        help='휴리스틱 필터 사용 (기본값은 모든 카드를 LLM으로 평가)')
+    parser.add_argument('--json-out', help='결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    unknown = set(formats) - set(WRITERS)
+    if unknown:
+        parser.error(f"지원하지 않는 형식: {', '.join(sorted(unknown))}")
+
+    # 캐시와 작업 저널은 끄고 매번 처음부터 처리
+    env = {
+        'LLM_PROVIDER': args.provider,
+        'MAX_CONCURRENCY': str(args.max_concurrency),
+        'LLM_STREAMING': str(args.streaming).lower(),
+        'HEURISTIC_FILTER_ENABLED': str(args.heuristic_filter).lower(),
+        'SECTION_PACKING_ENABLED': str(args.packing).lower(),
+        'LLM_CACHE_ENABLED': 'false',
+        'TEXT_CACHE_ENABLED': 'false',
+        'JOB_JOURNAL_ENABLED': 'false',
+        'RETRY_DELAY': '0',
+    }
+
+    results = []
+    spawn = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as corpus_dir, contextlib.ExitStack() as stack:
+        servers = [
+            stack.enter_context(MockLLMServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                                              seed=42 + i, parallel=args.backend_parallel))
+            for i in range(max(1, args.endpoints))
+        ]
+        server = servers[0]
+        if len(servers) > 1:
+            env['LLM_ENDPOINTS'] = ','.join(f"{args.provider}@{backend.base_url}" for backend in servers)
+        print(f"모의 서버 {len(servers)}개: {', '.join(backend.base_url for backend in servers)} "
+              f"(지연 {args.latency}±{args.jitter}초, 오류율 {args.error_rate}, "
+              f"서버당 동시 처리 {args.backend_parallel or '제한 없음'}), "
+              f"제공자 {args.provider}, 동시 요청 {args.max_concurrency}개")
+        print(f"{'형식':<5}{'크기(KB)':>9}{'섹션':>7}{'카드':>7}{'시간(초)':>10}{'섹션/초':>9}{'카드/초':>9}"
+              f"{'p50(초)':>9}{'p99(초)':>9}{'RSS(MB)':>9}")
+
+        for size_kb in sizes:
+            paragraphs = make_paragraphs(size_kb)
+            for fmt in formats:
+                file_path = os.path.join(corpus_dir, f"corpus_{size_kb}kb.{fmt}")
+                WRITERS[fmt](file_path, paragraphs)
+
+                before = total_stats(servers)
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                    result = pool.submit(run_case, file_path, server.base_url, env).result()
+                after = total_stats(servers)
+                result.update(format=fmt, size_kb=size_kb,
+                              requests=after['requests'] - before['requests'],
+                              injected_errors=after['errors'] - before['errors'])
+                results.append(result)
+
+                rss = f"{result['peak_rss_mb']:.1f}" if result['peak_rss_mb'] is not None else '-'
+                print(f"{fmt:<5}{size_kb:>9}{result['sections']:>7}{result['cards']:>7}"
+                      f"{result['elapsed_seconds']:>10.2f}{result['sections_per_second']:>9.2f}"
+                      f"{result['cards_per_second']:>9.1f}{result['latency_p50']:>9.3f}"
+                      f"{result['latency_p99']:>9.3f}{rss:>9}")
+
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump({'settings': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장됨: {args.json_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+텍스트 분할(TextProcessor.smart_divide_text) 벤치마크
+
+문장마다 인코딩을 조회하고 토큰화하던 기존 방식과, 인코딩을 한 번만 로드하고
+문장을 배치로 토큰화하는 현재 방식을 같은 텍스트로 비교합니다.
+"""
+import re
+import sys
+import os
+import time
+import random
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tiktoken
+
+from src.Utils.text_processor import TextProcessor
+
+
+def legacy_estimate_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+    """기존 구현: 호출할 때마다 인코딩 조회"""
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return len(encoding.encode(text))
+
+
+def legacy_smart_divide_text(text: str, max_tokens: int = 1500):
+    """기존 구현: 문장마다 estimate_tokens 호출"""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sections, current_section, current_tokens = [], [], 0
+    for sentence in sentences:
+        sentence_tokens = legacy_estimate_tokens(sentence)
+        if current_tokens + sentence_tokens > max_tokens and current_section:
+            sections.append(' '.join(current_section))
+            current_section, current_tokens = [sentence], sentence_tokens
+        else:
+            current_section.append(sentence)
+            current_tokens += sentence_tokens
+    if current_section:
+        sections.append(' '.join(current_section))
+    return sections
+
+
+def make_text(size_mb: float, seed: int = 42) -> str:
+    """영문/한글이 섞인 합성 문서 생성"""
+    rng = random.Random(seed)
+    words = ["learning", "memory", "neuron", "protein", "algorithm", "history", "theory", "energy",
+             "학습", "기억", "신경", "단백질", "알고리즘", "역사", "이론", "에너지", "세포", "구조"]
+    target = int(size_mb * 1024 * 1024)
+    parts = []
+    size = 0
+    while size < target:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(5, 25)))
+        sentence = sentence.capitalize() + rng.choice(".!?")
+        parts.append(sentence)
+        size += len(sentence.encode('utf-8')) + 1
+    return " ".join(parts)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='텍스트 분할 벤치마크')
+    parser.add_argument('--size-mb', type=float, default=4.0, help='합성 텍스트 크기 (MB)')
+    parser.add_argument('--max-tokens', type=int, default=1500, help='섹션당 최대 토큰 수')
+    parser.add_argument('--skip-legacy', action='store_true', help='기존 방식 측정 생략')
+    args = parser.parse_args()
+
+    text = make_text(args.size_mb)
+    print(f"텍스트 크기: {len(text.encode('utf-8')) / (1024 * 1024):.2f}MB")
+
+    # 인코딩 로드 시간은 양쪽 측정에서 제외
+    TextProcessor._get_encoding("gpt-3.5-turbo")
+
+    sections, current = timed(TextProcessor.smart_divide_text, text, args.max_tokens)
+    print(f"현재 방식: {current:.2f}초 ({len(sections)}개 섹션)")
+
+    if not args.skip_legacy:
+        legacy_sections, legacy = timed(legacy_smart_divide_text, text, args.max_tokens)
+        print(f"기존 방식: {legacy:.2f}초 ({len(legacy_sections)}개 섹션)")
+        print(f"속도 향상: {legacy / current:.1f}배")
+        print(f"결과 일치: {'예' if sections == legacy_sections else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 로컬 모의 LLM 서버
+
+Ollama `/api/chat`·`/api/generate`와 OpenAI 호환 `/chat/completions` 요청에 결정적인 응답을 돌려줍니다.
+- 카드 생성 요청: 프롬프트의 텍스트에서 단어를 골라 만든 카드 블록 (같은 텍스트면 같은 카드)
+- 품질 평가 요청(배치/개별): 고정 점수
+지연 시간, 지터, 오류(503) 비율을 설정할 수 있으며 `stream: true` 요청은 조각으로 나누어 보냅니다.
+parallel을 지정하면 한 번에 그 수만큼만 처리하고 나머지는 대기시켜 용량이 정해진 백엔드를 흉내 냅니다.
+
+단독 실행하면 실제 앱을 연결해 볼 수 있습니다:
+    python benchmarks/mock_llm_server.py --port 11434 --latency 0.5
+"""
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+
+SECTION_PATTERN = re.compile(r'텍스트:\n(.*?)\n\n중요한 지침', re.DOTALL)
+PACKED_SECTION_PATTERN = re.compile(r'^\[섹션 (\d+)\]\n.*?텍스트:\n(.*?)(?=\n\n\[섹션 \d+\]|\n\n중요한 지침)',
+                                    re.DOTALL | re.MULTILINE)
+CARD_COUNT_PATTERN = re.compile(r'(\d+)개의 Anki 플래시카드')
+BATCH_CARD_PATTERN = re.compile(r'^\[\d+\]$', re.MULTILINE)
+WORD_PATTERN = re.compile(r'[A-Za-z가-힣]{3,}')
+
+
+class MockLLMServer:
+    """모의 LLM 서버 (with 문 또는 start()/stop()으로 사용, 포트 0이면 빈 포트 사용)"""
+
+    def __init__(self, port: int = 0, latency: float = 0.05, jitter: float = 0.0,
+                 error_rate: float = 0.0, score: int = 8, seed: int = 42, stream_chunk_chars: int = 40,
+                 parallel: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.score = score
+        self.stream_chunk_chars = stream_chunk_chars
+        self._rng = random.Random(seed)
+        self.slots = threading.BoundedSemaphore(parallel) if parallel > 0 else None
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        handler = type('MockLLMHandler', (_MockLLMHandler,), {'server_state': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> 'MockLLMServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 실행 (Ctrl+C로 종료)"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {'requests': self.requests, 'errors': self.errors, 'max_in_flight': self.max_in_flight}
+
+    def __enter__(self) -> 'MockLLMServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def begin_request(self) -> Tuple[float, bool]:
+        """(지연 시간, 오류 응답 여부) 결정 및 진행 중 요청 수 갱신"""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self._rng.random() < self.error_rate
+            self.errors += failed
+        return delay, failed
+
+    def end_request(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def respond(self, prompt: str) -> str:
+        """프롬프트 종류에 맞는 응답 텍스트"""
+        if '"번호: 점수"' in prompt:
+            count = len(BATCH_CARD_PATTERN.findall(prompt))
+            return "\n".join(f"{i + 1}: {self.score}" for i in range(count))
+        if '평가해주세요' in prompt:
+            return str(self.score)
+        return self.make_cards(prompt)
+
+    @classmethod
+    def make_cards(cls, prompt: str) -> str:
+        """섹션 텍스트의 단어로 만든 카드 블록 (답변이 원문에 있어 휴리스틱 필터도 통과)
+
+        여러 섹션을 묶은 요청이면 섹션마다 카드를 만들고 각 카드 앞에 "Section: 번호" 줄을 붙입니다.
+        """
+        count_match = CARD_COUNT_PATTERN.search(prompt) or re.search(r'(\d+)개씩', prompt)
+        count = int(count_match.group(1)) if count_match else 5
+
+        packed = PACKED_SECTION_PATTERN.findall(prompt)
+        if packed:
+            return "\n".join(
+                "\n".join(f"Section: {number}\n{block}" for block in cls._card_blocks(text, count))
+                for number, text in packed
+            )
+        section = SECTION_PATTERN.search(prompt)
+        return "\n".join(cls._card_blocks(section.group(1) if section else prompt, count))
+
+    @staticmethod
+    def _card_blocks(text: str, count: int) -> List[str]:
+        words = WORD_PATTERN.findall(text) or ['empty']
+        rng = random.Random(hashlib.sha256(text.encode('utf-8')).digest())
+        blocks = []
+        for _ in range(count):
+            start = rng.randrange(len(words))
+            answer = " ".join(words[start:start + 8])
+            key_terms = " ".join(rng.sample(words, min(3, len(words))))
+            blocks.append(f"Q: What does the text say about {key_terms}?\nA: {answer}\nTags: {words[start]}, benchmark\n---")
+        return blocks
+
+
+class _MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_state: MockLLMServer = None
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        state = self.server_state
+        if state.slots:
+            state.slots.acquire()
+        delay, failed = state.begin_request()
+        try:
+            time.sleep(delay)
+            if failed:
+                self._send(503, b'{"error": "overloaded"}', 'application/json')
+                return
+
+            if self.path.endswith('/api/generate'):
+                prompt = body.get('prompt', '')
+                self._reply_ollama(body, state.respond(prompt), len(prompt))
+            elif self.path.endswith('/api/chat'):
+                messages = body.get('messages', [])
+                if not messages:
+                    # 메시지 없는 요청은 모델 로드(워밍업)
+                    self._send_json({'message': {'role': 'assistant', 'content': ''}, 'done': True, 'done_reason': 'load'})
+                    return
+                prompt = "\n".join(message.get('content', '') for message in messages)
+                self._reply_ollama(body, state.respond(prompt), len(prompt), chat=True)
+            elif self.path.endswith('/chat/completions'):
+                prompt = "\n".join(message.get('content', '') for message in body.get('messages', []))
+                self._reply_openai(body, state.respond(prompt), len(prompt))
+            else:
+                self._send(404, b'{"error": "not found"}', 'application/json')
+        finally:
+            state.end_request()
+            if state.slots:
+                state.slots.release()
+
+    def _reply_ollama(self, body: Dict, content: str, prompt_chars: int, chat: bool = False) -> None:
+        usage = {'prompt_eval_count': prompt_chars // 4, 'eval_count': len(content) // 4}
+
+        def part(text: str) -> Dict:
+            return {'message': {'role': 'assistant', 'content': text}} if chat else {'response': text}
+
+        if not body.get('stream'):
+            self._send_json({**part(content), 'done': True, **usage})
+            return
+        lines = [json.dumps({**part(chunk), 'done': False}) for chunk in self._chunks(content)]
+        lines.append(json.dumps({**part(''), 'done': True, **usage}))
+        self._send(200, ('\n'.join(lines) + '\n').encode('utf-8'), 'application/x-ndjson')
+
+    def _reply_openai(self, body: Dict, content: str, prompt_chars: int) -> None:
+        usage = {'prompt_tokens': prompt_chars // 4, 'completion_tokens': len(content) // 4}
+        if not body.get('stream'):
+            self._send_json({'choices': [{'message': {'role': 'assistant', 'content': content}}], 'usage': usage})
+            return
+        events = [{'choices': [{'delta': {'content': chunk}}]} for chunk in self._chunks(content)]
+        events.append({'choices': [{'delta': {}}], 'usage': usage})
+        payload = ''.join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+        self._send(200, payload.encode('utf-8'), 'text/event-stream')
+
+    def _chunks(self, content: str) -> List[str]:
+        size = max(1, self.server_state.stream_chunk_chars)
+        return [content[i:i + size] for i in range(0, len(content), size)] or ['']
+
+    def _send_json(self, data: Dict) -> None:
+        self._send(200, json.dumps(data, ensure_ascii=False).encode('utf-8'), 'application/json')
+
+    def _send(self, status: int, payload: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모의 LLM 서버 (Ollama / OpenAI 호환)')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--latency', type=float, default=0.5, help='응답 지연 시간 (초)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='지연 시간 변동 폭 (±초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='503 응답 비율 (0-1)')
+    parser.add_argument('--parallel', type=int, default=0, help='동시에 처리하는 요청 수 (0이면 제한 없음)')
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.port, args.latency, args.jitter, args.error_rate, parallel=args.parallel)
+    print(f"모의 LLM 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """
 엔티티 모듈
 """
-from .flashcard import Flashcard
+from .flashcard import Flashcard, CompactFlashcard, intern_tags
+from .card_collection import CardCollection
 
-__all__ = ['Flashcard'] 
\ No newline at end of file
+__all__ = ['Flashcard', 'CompactFlashcard', 'intern_tags', 'CardCollection']
@@ -0,0 +1,70 @@
+"""
+열 단위 플래시카드 컬렉션
+"""
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+from .flashcard import Flashcard, CompactFlashcard, intern_tags
+
+
+class CardCollection:
+    """카드를 질문/답변/태그 조합 ID 열로 저장하는 컬렉션
+    
+    카드마다 객체를 두지 않고 태그 조합은 한 번만 저장해 ID(array('I'))로 참조하므로
+    코퍼스 전체의 카드를 메모리에 둘 때 카드당 오버헤드가 작습니다.
+    메모는 대부분 비어 있으므로 값이 있는 카드만 따로 저장합니다.
+    순회하면 CompactFlashcard를 하나씩 만들어 돌려줍니다.
+    """
+    
+    def __init__(self, cards: Iterable[Union[Flashcard, CompactFlashcard]] = ()):
+        self._questions: List[str] = []
+        self._answers: List[str] = []
+        self._notes: Dict[int, str] = {}
+        self._tag_ids = array('I')
+        self._tag_sets: List[Tuple[str, ...]] = []
+        self._tag_index: Dict[Tuple[str, ...], int] = {}
+        self.extend(cards)
+    
+    def append(self, card: Union[Flashcard, CompactFlashcard]) -> None:
+        """카드 추가"""
+        # 태그 조합은 이 컬렉션 안에서만 공유 (전역 인터닝 테이블 없음)
+        tags = tuple(card.tags)
+        tag_id = self._tag_index.get(tags)
+        if tag_id is None:
+            tags = intern_tags(tags)
+            tag_id = self._tag_index[tags] = len(self._tag_sets)
+            self._tag_sets.append(tags)
+        
+        if card.notes:
+            self._notes[len(self._questions)] = card.notes
+        self._questions.append(card.question)
+        self._answers.append(card.answer)
+        self._tag_ids.append(tag_id)
+    
+    def extend(self, cards: Iterable[Union[Flashcard, CompactFlashcard]]) -> None:
+        """여러 카드 추가"""
+        for card in cards:
+            self.append(card)
+    
+    def tag_counts(self) -> Dict[str, int]:
+        """태그별 카드 수 (태그 조합 ID로 집계)"""
+        counts: Counter = Counter()
+        for tag_id, count in Counter(self._tag_ids).items():
+            for tag in self._tag_sets[tag_id]:
+                counts[tag] += count
+        return dict(counts)
+    
+    def __len__(self) -> int:
+        return len(self._questions)
+    
+    def __getitem__(self, index: int) -> CompactFlashcard:
+        index = range(len(self))[index]
+        return CompactFlashcard(
+            self._questions[index], self._answers[index],
+            self._tag_sets[self._tag_ids[index]], self._notes.get(index, "")
+        )
+    
+    def __iter__(self) -> Iterator[CompactFlashcard]:
+        for index in range(len(self)):
+            yield self[index]
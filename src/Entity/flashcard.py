@@ -2,8 +2,9 @@
 플래시카드 엔티티 정의
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Dict, Optional, Iterable, Tuple
 import re
+import sys
 
 
 @dataclass
@@ -27,7 +28,26 @@ class Flashcard:
         """LLM을 사용하여 카드 품질 점수 계산 (0-1)"""
         if not llm_client:
             return 0.5  # 기본 점수
-            
+        
+        try:
+            response = llm_client.call_api_with_retry(self._build_quality_messages())
+            return self._parse_quality_score(response)
+        except:
+            return 0.5  # 오류 시 중간 점수
+    
+    async def acalculate_quality_score(self, llm_client=None) -> float:
+        """LLM을 사용하여 카드 품질 점수 비동기 계산 (0-1)"""
+        if not llm_client:
+            return 0.5  # 기본 점수
+        
+        try:
+            response = await llm_client.acall_api_with_retry(self._build_quality_messages())
+            return self._parse_quality_score(response)
+        except:
+            return 0.5  # 오류 시 중간 점수
+    
+    def _build_quality_messages(self) -> List[Dict]:
+        """품질 평가 요청 메시지"""
         validation_prompt = f"""
 다음 플래시카드의 품질을 0-10 점수로 평가해주세요.
 
@@ -42,18 +62,62 @@ class Flashcard:
 
 점수만 숫자로 답변하세요 (예: 8).
 """
-        
-        try:
-            messages = [
-                {"role": "system", "content": "당신은 교육 콘텐츠 품질 평가 전문가입니다."},
-                {"role": "user", "content": validation_prompt}
-            ]
-            
-            response = llm_client.call_api_with_retry(messages)
-            match = re.search(r'\d+', response)
-            if match:
-                score = float(match.group()) / 10.0
-                return min(max(score, 0.0), 1.0)  # 0-1 범위로 제한
-            return 0.5
-        except:
-            return 0.5  # 오류 시 중간 점수 
\ No newline at end of file
+        return [
+            {"role": "system", "content": "당신은 교육 콘텐츠 품질 평가 전문가입니다."},
+            {"role": "user", "content": validation_prompt}
+        ]
+    
+    @staticmethod
+    def _parse_quality_score(response: str) -> float:
+        """평가 응답에서 0-1 점수 추출"""
+        match = re.search(r'\d+', response)
+        if match:
+            score = float(match.group()) / 10.0
+            return min(max(score, 0.0), 1.0)  # 0-1 범위로 제한
+        return 0.5
+
+
+def intern_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """태그 문자열을 인터닝한 튜플 반환
+    
+    태그 조합(튜플) 자체는 전역으로 보관하지 않습니다. 조합 공유는 CardCollection이
+    컬렉션 단위로 하므로, 컬렉션이 사라지면 태그 조합도 함께 해제됩니다.
+    """
+    return tuple(sys.intern(tag) for tag in tags)
+
+
+class CompactFlashcard:
+    """메모리 절약형 플래시카드 (__slots__ 사용, 인스턴스별 __dict__와 태그 리스트 없음)
+    
+    태그는 문자열을 인터닝한 불변 튜플이며 (튜플을 넘기면 그대로 공유, 예: CardCollection의 태그 조합),
+    Flashcard와 같은 to_anki_format / is_valid를 제공합니다.
+    """
+    
+    __slots__ = ('question', 'answer', 'tags', 'notes')
+    
+    def __init__(self, question: str, answer: str, tags: Iterable[str] = (), notes: str = ""):
+        self.question = question
+        self.answer = answer
+        self.tags = tags if type(tags) is tuple else intern_tags(tags)
+        self.notes = notes
+    
+    to_anki_format = Flashcard.to_anki_format
+    is_valid = Flashcard.is_valid
+    
+    @classmethod
+    def from_flashcard(cls, card: Flashcard) -> 'CompactFlashcard':
+        """Flashcard에서 변환"""
+        return cls(card.question, card.answer, card.tags, card.notes)
+    
+    def to_flashcard(self) -> Flashcard:
+        """Flashcard로 변환 (태그는 새 리스트)"""
+        return Flashcard(question=self.question, answer=self.answer, tags=list(self.tags), notes=self.notes)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (CompactFlashcard, Flashcard)):
+            return NotImplemented
+        return (self.question, self.answer, tuple(self.tags), self.notes) == \
+            (other.question, other.answer, tuple(other.tags), other.notes)
+    
+    def __repr__(self) -> str:
+        return f"CompactFlashcard(question={self.question!r}, answer={self.answer!r}, tags={self.tags!r})"
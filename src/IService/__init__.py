@@ -5,10 +5,12 @@ from .llm_service_interface import ILLMService
 from .pdf_reader_interface import IFileReaderService
 from .flashcard_generator_interface import IFlashcardGeneratorService
 from .export_service_interface import IExportService
+from .quality_scorer_interface import IQualityScorerService
 
 __all__ = [
     'ILLMService',
     'IFileReaderService',
     'IFlashcardGeneratorService',
-    'IExportService'
+    'IExportService',
+    'IQualityScorerService'
 ] 
\ No newline at end of file
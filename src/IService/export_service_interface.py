@@ -2,7 +2,7 @@
 플래시카드 내보내기 서비스 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Optional
 from src.Entity.flashcard import Flashcard
 
 
@@ -10,16 +10,33 @@ class IExportService(ABC):
     """플래시카드 내보내기 서비스 인터페이스"""
     
     @abstractmethod
-    def export_to_anki_txt(self, cards: List[Flashcard], output_path: str) -> None:
+    def export_to_anki_txt(self, cards: Iterable[Flashcard], output_path: str) -> None:
         """Anki 텍스트 형식으로 내보내기"""
         pass
     
     @abstractmethod
-    def export_to_csv(self, cards: List[Flashcard], output_path: str) -> None:
+    def export_to_csv(self, cards: Iterable[Flashcard], output_path: str) -> None:
         """CSV 형식으로 내보내기"""
         pass
     
     @abstractmethod
-    def export_to_json(self, cards: List[Flashcard], output_path: str) -> None:
+    def export_to_json(self, cards: Iterable[Flashcard], output_path: str) -> None:
         """JSON 형식으로 내보내기"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def export_to_jsonl(self, cards: Iterable[Flashcard], output_path: str) -> None:
+        """JSON Lines 형식으로 내보내기"""
+        pass
+    
+    @abstractmethod
+    def export_to_apkg(self, cards: Iterable[Flashcard], output_path: str, deck_name: str = "Flashcards") -> int:
+        """Anki 패키지(.apkg)로 내보내기"""
+        pass
+    
+    @abstractmethod
+    def open_writer(self, anki_path: Optional[str] = None, csv_path: Optional[str] = None,
+                    json_path: Optional[str] = None, jsonl_path: Optional[str] = None,
+                    apkg_path: Optional[str] = None, deck_name: str = "Flashcards"):
+        """카드를 생성되는 즉시 주어진 형식들에 이어 쓰는 writer 열기 (write_cards / close 지원)"""
+        pass
@@ -2,7 +2,7 @@
 플래시카드 생성 서비스 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional, Callable, AsyncIterator, Any
 from src.Entity.flashcard import Flashcard
 
 
@@ -15,6 +15,38 @@ class IFlashcardGeneratorService(ABC):
         pass
     
     @abstractmethod
-    def generate_cards_from_pdf(self, pdf_path: str, process_all: bool = False) -> List[Flashcard]:
+    def generate_cards_from_pdf(self, pdf_path: str, process_all: bool = False,
+                                on_cards: Optional[Callable[[List[Flashcard]], None]] = None,
+                                on_error: Optional[Callable[[int], None]] = None) -> List[Flashcard]:
         """PDF 파일에서 플래시카드 생성"""
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def agenerate_cards_from_section(self, text: str, context: Dict) -> List[Flashcard]:
+        """텍스트 섹션에서 플래시카드 비동기 생성"""
+        pass
+    
+    @abstractmethod
+    async def agenerate_cards_from_pdf(self, pdf_path: str, process_all: bool = False,
+                                       on_cards: Optional[Callable[[List[Flashcard]], None]] = None,
+                                       on_error: Optional[Callable[[int], None]] = None) -> List[Flashcard]:
+        """PDF 파일에서 플래시카드 비동기 생성"""
+        pass
+    
+    @abstractmethod
+    def astream_cards_from_pdf(self, pdf_path: str,
+                               process_all: bool = False) -> AsyncIterator[Tuple[int, Optional[List[Flashcard]]]]:
+        """섹션 순서대로 (섹션 번호, 카드)를 생성하는 비동기 이터레이터 (실패한 섹션은 None)"""
+        pass
+    
+    @abstractmethod
+    def generate_cards_from_files(self, file_paths: List[str], process_all: bool = False, max_parallel_files: int = 4,
+                                  on_cards: Optional[Callable[[str, List[Flashcard]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 파일에서 플래시카드 생성 (파일별 카드 수, 실패한 섹션, 오류 반환)"""
+        pass
+    
+    @abstractmethod
+    async def agenerate_cards_from_files(self, file_paths: List[str], process_all: bool = False, max_parallel_files: int = 4,
+                                         on_cards: Optional[Callable[[str, List[Flashcard]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 파일에서 플래시카드 비동기 생성 (모든 파일이 같은 동시 요청 제한을 공유)"""
+        pass
@@ -1,8 +1,27 @@
 """
 LLM 서비스 인터페이스
 """
+import contextvars
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, AsyncIterator, Optional
+
+# 현재 요청의 최대 응답 토큰 (None이면 설정의 MAX_TOKENS)
+_MAX_TOKENS: contextvars.ContextVar = contextvars.ContextVar('llm_max_tokens', default=None)
+
+
+@contextmanager
+def llm_max_tokens(max_tokens: Optional[int]) -> Iterator[None]:
+    """이 블록 안의 LLM 요청에 쓸 최대 응답 토큰 지정 (예: 여러 섹션을 묶은 요청, 비동기 작업에도 전달됨)"""
+    token = _MAX_TOKENS.set(max_tokens)
+    try:
+        yield
+    finally:
+        _MAX_TOKENS.reset(token)
+
+
+def current_llm_max_tokens(default: int) -> int:
+    return _MAX_TOKENS.get() or default
 
 
 class ILLMService(ABC):
@@ -13,6 +32,23 @@ class ILLMService(ABC):
         """재시도 로직이 포함된 API 호출"""
         pass
     
+    @abstractmethod
+    async def acall_api_with_retry(self, messages: List[Dict]) -> str:
+        """재시도 로직이 포함된 비동기 API 호출"""
+        pass
+    
+    def stream_api_with_retry(self, messages: List[Dict]) -> Iterator[str]:
+        """응답을 조각 단위로 반환 (스트리밍 미지원 구현은 전체 응답을 한 번에 반환)"""
+        yield self.call_api_with_retry(messages)
+    
+    async def astream_api_with_retry(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """응답을 조각 단위로 비동기 반환 (스트리밍 미지원 구현은 전체 응답을 한 번에 반환)"""
+        yield await self.acall_api_with_retry(messages)
+    
+    async def aclose(self) -> None:
+        """비동기 자원 정리 (필요한 구현에서만 재정의)"""
+        pass
+    
     @abstractmethod
     def generate_prompt(self, system_prompt: str, user_prompt: str) -> List[Dict]:
         """프롬프트 생성"""
@@ -2,7 +2,7 @@
 파일 리더 서비스 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Iterator
 
 
 class IFileReaderService(ABC):
@@ -11,4 +11,12 @@ class IFileReaderService(ABC):
     @abstractmethod
     def read_file(self, file_path: str) -> Tuple[str, Dict]:
         """파일을 읽고 텍스트와 메타데이터 반환"""
-        pass 
\ No newline at end of file
+        pass
+    
+    def iter_text(self, file_path: str) -> Tuple[Iterator[str], Dict]:
+        """텍스트를 이어 붙이면 read_file의 텍스트가 되는 조각 이터레이터와 메타데이터 반환
+        
+        기본 구현은 파일 전체를 읽어 한 조각으로 반환합니다. 필요한 만큼만 읽는 구현은 이를 재정의합니다.
+        """
+        text, metadata = self.read_file(file_path)
+        return iter([text]), metadata
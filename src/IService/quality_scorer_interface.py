@@ -0,0 +1,20 @@
+"""
+카드 품질 평가 서비스 인터페이스
+"""
+from abc import ABC, abstractmethod
+from typing import List
+from src.Entity.flashcard import Flashcard
+
+
+class IQualityScorerService(ABC):
+    """카드 품질 평가 서비스 인터페이스"""
+    
+    @abstractmethod
+    def score_cards(self, cards: List[Flashcard]) -> List[float]:
+        """카드 목록의 품질 점수(0-1) 계산"""
+        pass
+    
+    @abstractmethod
+    async def ascore_cards(self, cards: List[Flashcard]) -> List[float]:
+        """카드 목록의 품질 점수(0-1) 비동기 계산"""
+        pass
@@ -4,46 +4,227 @@
 import csv
 import json
 import logging
-from typing import List
+import textwrap
+from typing import Dict, Iterable, Optional
 
 from src.Entity.flashcard import Flashcard
 from src.IService.export_service_interface import IExportService
+from src.Utils.anki_package import AnkiPackageWriter
+
+
+# 내보내기 형식별 파일 이름 접미사
+EXPORT_SUFFIXES = {
+    'txt': '_anki.txt',
+    'csv': '.csv',
+    'json': '.json',
+    'jsonl': '.jsonl',
+    'apkg': '.apkg'
+}
 
 
 class ExportService(IExportService):
-    """플래시카드 내보내기 서비스"""
-    
-    def export_to_anki_txt(self, cards: List[Flashcard], output_path: str) -> None:
+    """플래시카드 내보내기 서비스
+
+    모든 형식은 카드를 한 장씩 읽어 바로 파일에 쓰므로 카드 수와 관계없이 메모리가 일정합니다.
+    """
+
+    def export_to_anki_txt(self, cards: Iterable[Flashcard], output_path: str) -> None:
         """Anki 텍스트 형식으로 내보내기"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for card in cards:
-                f.write(card.to_anki_format() + '\n')
+        self._export({'txt': output_path}, cards)
         logging.info(f"Anki 텍스트 파일 저장됨: {output_path}")
-    
-    def export_to_csv(self, cards: List[Flashcard], output_path: str) -> None:
+
+    def export_to_csv(self, cards: Iterable[Flashcard], output_path: str) -> None:
         """CSV 형식으로 내보내기"""
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Question', 'Answer', 'Tags'])
-            
-            for card in cards:
-                tags_str = ' '.join(card.tags) if card.tags else ''
-                writer.writerow([card.question, card.answer, tags_str])
-        
+        self._export({'csv': output_path}, cards)
         logging.info(f"CSV 파일 저장됨: {output_path}")
-    
-    def export_to_json(self, cards: List[Flashcard], output_path: str) -> None:
-        """JSON 형식으로 내보내기"""
-        cards_data = []
+
+    def export_to_json(self, cards: Iterable[Flashcard], output_path: str) -> None:
+        """JSON 형식으로 내보내기 (json.dump(indent=2)와 같은 배열)"""
+        self._export({'json': output_path}, cards)
+        logging.info(f"JSON 파일 저장됨: {output_path}")
+
+    def export_to_jsonl(self, cards: Iterable[Flashcard], output_path: str) -> None:
+        """JSON Lines 형식으로 내보내기 (한 줄에 카드 하나)"""
+        self._export({'jsonl': output_path}, cards)
+        logging.info(f"JSON Lines 파일 저장됨: {output_path}")
+
+    def export_to_apkg(self, cards: Iterable[Flashcard], output_path: str, deck_name: str = "Flashcards") -> int:
+        """Anki 패키지(.apkg)로 내보내고 저장된 카드 수 반환 (카드는 한 장씩 읽어 배치로 기록)"""
+        with AnkiPackageWriter(output_path, deck_name) as writer:
+            writer.write_cards(cards)
+        return writer.count
+
+    def open_writer(self, anki_path: Optional[str] = None, csv_path: Optional[str] = None,
+                    json_path: Optional[str] = None, jsonl_path: Optional[str] = None,
+                    apkg_path: Optional[str] = None, deck_name: str = "Flashcards") -> 'StreamingExportWriter':
+        """카드가 생성되는 즉시 주어진 형식들에 한 번에 이어 쓰는 writer 열기"""
+        paths = {'txt': anki_path, 'csv': csv_path, 'json': json_path, 'jsonl': jsonl_path, 'apkg': apkg_path}
+        return StreamingExportWriter({fmt: path for fmt, path in paths.items() if path}, deck_name)
+
+    @staticmethod
+    def _export(paths: Dict[str, str], cards: Iterable[Flashcard]) -> None:
+        with StreamingExportWriter(paths, log=False) as writer:
+            writer.write_cards(cards)
+
+
+def card_to_dict(card: Flashcard) -> Dict:
+    """JSON 내보내기용 카드 사전"""
+    return {
+        'question': card.question,
+        'answer': card.answer,
+        'tags': card.tags,
+        'notes': card.notes
+    }
+
+
+class _AnkiTxtSink:
+    """Anki 텍스트 (탭 구분) 파일"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, card: Flashcard) -> None:
+        self._file.write(card.to_anki_format() + '\n')
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def abort(self) -> None:
+        """마무리 없이 닫기 (이미 쓴 줄은 그대로 남음)"""
+        self._file.close()
+
+
+class _CsvSink(_AnkiTxtSink):
+    """CSV 파일 (머리글 포함)"""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(['Question', 'Answer', 'Tags'])
+
+    def write(self, card: Flashcard) -> None:
+        self._writer.writerow([card.question, card.answer, ' '.join(card.tags) if card.tags else ''])
+
+
+class _JsonLinesSink(_AnkiTxtSink):
+    """JSON Lines 파일 (한 줄에 카드 하나, 추가만 하므로 중간에 중단되어도 읽을 수 있음)"""
+
+    def write(self, card: Flashcard) -> None:
+        self._file.write(json.dumps(card_to_dict(card), ensure_ascii=False) + '\n')
+
+
+class _JsonArraySink(_AnkiTxtSink):
+    """기존 JSON 배열 파일 (json.dump(indent=2)와 같은 형식, 배열은 close()에서 닫힘)"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file.write('[')
+        self._empty = True
+
+    def write(self, card: Flashcard) -> None:
+        # json.dump(indent=2)의 배열 항목과 같은 들여쓰기
+        item = json.dumps(card_to_dict(card), ensure_ascii=False, indent=2)
+        self._file.write((',\n' if not self._empty else '\n') + textwrap.indent(item, '  '))
+        self._empty = False
+
+    def close(self) -> None:
+        self._file.write(']' if self._empty else '\n]')
+        self._file.close()
+
+
+class StreamingExportWriter:
+    """카드 묶음을 한 번만 순회하면서 여러 형식의 파일에 동시에 추가하는 writer
+
+    paths는 {형식: 경로}이며 형식은 EXPORT_SUFFIXES의 키(txt, csv, json, jsonl, apkg)입니다.
+    write_cards()마다 파일을 flush하므로 실행이 중간에 중단되어도 그때까지의 카드가 디스크에 남습니다
+    (JSON 배열은 close()에서 닫히고, .apkg는 close()에서 완성됩니다).
+    close() 후의 결과는 형식별 export_to_* 메서드와 같습니다. 실패한 실행은 abort()로 끝내며,
+    이때 .apkg는 만들지 않고 JSON 배열은 닫지 않아 잘린 결과가 완성된 파일처럼 보이지 않습니다.
+    """
+
+    def __init__(self, paths: Dict[str, str], deck_name: str = "Flashcards", log: bool = True):
+        unknown = set(paths) - set(EXPORT_SUFFIXES)
+        if unknown:
+            raise ValueError(f"지원하지 않는 내보내기 형식: {', '.join(sorted(unknown))}")
+
+        self.paths = dict(paths)
+        self.count = 0
+        self._log = log
+        self._closed = False
+        self._sinks = []
+        try:
+            for fmt, path in self.paths.items():
+                self._sinks.append(self._open_sink(fmt, path, deck_name))
+        except Exception:
+            self._close_sinks(abort=True)
+            raise
+        self.flush()
+
+    @staticmethod
+    def _open_sink(fmt: str, path: str, deck_name: str):
+        if fmt == 'apkg':
+            return AnkiPackageWriter(path, deck_name)
+        sink_types = {'txt': _AnkiTxtSink, 'csv': _CsvSink, 'json': _JsonArraySink, 'jsonl': _JsonLinesSink}
+        return sink_types[fmt](path)
+
+    def write_cards(self, cards: Iterable[Flashcard]) -> int:
+        """카드를 모든 형식에 추가하고 쓴 카드 수 반환"""
+        written = 0
         for card in cards:
-            cards_data.append({
-                'question': card.question,
-                'answer': card.answer,
-                'tags': card.tags,
-                'notes': card.notes
-            })
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(cards_data, f, ensure_ascii=False, indent=2)
-        
-        logging.info(f"JSON 파일 저장됨: {output_path}") 
\ No newline at end of file
+            for sink in self._sinks:
+                sink.write(card)
+            written += 1
+
+        self.count += written
+        if written:
+            self.flush()
+        return written
+
+    def flush(self) -> None:
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        """JSON 배열을 닫고 파일 정리"""
+        if self._closed:
+            return
+        self._closed = True
+        self._close_sinks()
+        if self._log:
+            logging.info(f"{self.count}개 카드 저장됨: {', '.join(self.paths.values())}")
+
+    def abort(self) -> None:
+        """실패한 실행의 writer 정리 (.apkg와 JSON 배열은 완성하지 않음)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._close_sinks(abort=True)
+        if self._log:
+            logging.warning(f"내보내기 중단됨 ({self.count}개 카드 기록): {', '.join(self.paths.values())}")
+
+    def _close_sinks(self, abort: bool = False) -> None:
+        # 한 파일에서 오류가 나도 나머지 파일은 닫고, 첫 오류를 다시 발생시킴
+        error = None
+        for sink in self._sinks:
+            try:
+                if abort:
+                    sink.abort()
+                else:
+                    sink.close()
+            except Exception as e:
+                logging.error(f"내보내기 파일 닫기 실패: {e}")
+                error = error or e
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> 'StreamingExportWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -2,30 +2,86 @@
 플래시카드 생성 서비스 구현
 """
 import re
+import json
+import sys
+import time
 import hashlib
+import asyncio
 import logging
-from typing import List, Dict, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Awaitable, TypeVar, AsyncIterator, Callable, Deque, Iterable, Iterator, Any
 
 from src.Entity.flashcard import Flashcard
 from src.IService.flashcard_generator_interface import IFlashcardGeneratorService
-from src.IService.llm_service_interface import ILLMService
+from src.IService.llm_service_interface import ILLMService, llm_max_tokens
 from src.IService.pdf_reader_interface import IFileReaderService
+from src.IService.quality_scorer_interface import IQualityScorerService
 from src.Config.llm_config import LLMConfig
+from src.Service.quality_scorer_service import QualityScorerService
 from src.Utils.text_processor import TextProcessor
+from src.Utils.card_filter import CardHeuristicFilter
+from src.Utils.dedup_index import NearDuplicateIndex
+from src.Utils.card_stream_parser import IncrementalCardParser
+from src.Utils.job_journal import JobJournal
+from src.Utils.run_stats import RunStatistics
+from src.Utils.section_packer import SectionPacker
+from src.Utils import metrics
+
+
+T = TypeVar('T')
+
+# 묶음 요청 응답에서 카드가 나온 섹션 번호 줄 (예: "Section: 2")
+SECTION_LABEL_PATTERN = re.compile(r'^\s*(?:Section|섹션)\s*[:：]?\s*\[?(\d+)\]?\s*$', re.MULTILINE | re.IGNORECASE)
+
+GENERATION_GUIDELINES = """중요한 지침:
+1. 질문을 만들기 전에 텍스트에서 명확한 답변을 먼저 찾으세요
+2. 답변이 텍스트에 명시되어 있지 않으면 해당 질문을 만들지 마세요
+3. 모든 답변은 주어진 텍스트를 기반으로 해야 합니다
+4. "모르겠다", "언급되지 않음" 같은 답변은 절대 사용하지 마세요"""
 
 
 class FlashcardGeneratorService(IFlashcardGeneratorService):
     """플래시카드 생성 서비스"""
     
-    def __init__(self, llm_service: ILLMService, file_service: IFileReaderService, config: LLMConfig):
+    def __init__(self, llm_service: ILLMService, file_service: IFileReaderService, config: LLMConfig,
+                 quality_scorer: Optional[IQualityScorerService] = None):
         self.llm_service = llm_service
         self.file_service = file_service
         self.config = config
-        self.generated_cards: Set[str] = set()  # 중복 방지용
+        self.quality_scorer = quality_scorer or QualityScorerService(llm_service, config)
+        self.card_filter: Optional[CardHeuristicFilter] = (
+            CardHeuristicFilter.from_config(config) if config.heuristic_filter_enabled else None
+        )
+        self.dedup_index = NearDuplicateIndex.from_config(config)  # 유사 중복 방지용
+        self.journal: Optional[JobJournal] = (
+            JobJournal(config.job_journal_path) if config.job_journal_enabled else None
+        )
+        self.stats = RunStatistics()  # 실행 중 누적 통계 (새 실행마다 reset_stats()로 교체)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._packer: Optional[SectionPacker] = None
+        self._packer_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def generate_cards_from_section(self, text: str, context: Dict) -> List[Flashcard]:
-        """텍스트 섹션에서 플래시카드 생성"""
+        """텍스트 섹션에서 플래시카드 생성 (비동기 구현의 동기 래퍼)"""
+        return self._run_sync(self.agenerate_cards_from_section(text, context))
+    
+    def generate_cards_from_pdf(self, file_path: str, process_all: bool = False,
+                                on_cards: Optional[Callable[[List[Flashcard]], None]] = None,
+                                on_error: Optional[Callable[[int], None]] = None) -> List[Flashcard]:
+        """파일에서 플래시카드 생성 (비동기 구현의 동기 래퍼)"""
+        return self._run_sync(self.agenerate_cards_from_pdf(file_path, process_all, on_cards, on_error))
+    
+    async def agenerate_cards_from_section(self, text: str, context: Dict) -> List[Flashcard]:
+        """텍스트 섹션에서 플래시카드 비동기 생성 (묶음 모드에서는 작은 섹션을 다른 섹션과 함께 요청)"""
+        packer = self._get_packer()
+        if packer:
+            tokens = TextProcessor.estimate_tokens(text)
+            if packer.accepts(tokens):
+                cards = await packer.submit((text, context), tokens)
+                return await self._afinalize_candidates(cards, text)
+        
         prompt = self._create_generation_prompt(text, context)
         
         messages = [
@@ -33,63 +89,421 @@ class FlashcardGeneratorService(IFlashcardGeneratorService):
             {"role": "user", "content": prompt}
         ]
         
-        response = self.llm_service.call_api_with_retry(messages)
-        cards = self._parse_flashcards(response, context)
+        if self.config.llm_streaming:
+            return await self._agenerate_streaming(messages, text, context)
+        
+        async with self._get_semaphore():
+            response = await self.llm_service.acall_api_with_retry(messages)
+        return await self._afinalize_candidates(self._parse_flashcards(response, context), text)
+    
+    async def _afinalize_candidates(self, cards: List[Flashcard], text: str) -> List[Flashcard]:
+        """파싱된 후보 카드를 중복 확인과 품질 평가를 거쳐 통과한 카드만 반환"""
+        # 이미 채택된 카드와 겹치는 후보는 평가 전에 걸러 비용을 아끼고,
+        # 인덱스에는 평가를 통과한 카드만 넣음 (탈락한 카드가 다른 섹션의 비슷한 카드를 막지 않도록)
+        seen: List[str] = []
+        candidates = [card for card in cards if self._is_new_candidate(card, seen)]
+        
+        valid_cards = await self._afinalize_scored(candidates, text)
+        self._record_cards(len(cards), len(valid_cards))
+        return valid_cards
+    
+    async def _agenerate_packed(self, sections: List[Tuple[str, Dict]]) -> List[List[Flashcard]]:
+        """여러 섹션을 번호를 붙여 한 번에 요청하고 섹션별 후보 카드 반환"""
+        if len(sections) == 1:
+            text, context = sections[0]
+            prompt = self._create_generation_prompt(text, context)
+        else:
+            prompt = self._create_packed_prompt(sections)
+        
+        messages = [
+            {"role": "system", "content": self._get_system_prompt()},
+            {"role": "user", "content": prompt}
+        ]
+        async with self._get_semaphore():
+            with llm_max_tokens(self._packed_max_tokens(len(sections))):
+                response = await self.llm_service.acall_api_with_retry(messages)
+        
+        if len(sections) == 1:
+            return [self._parse_flashcards(response, sections[0][1])]
+        return self._parse_packed_flashcards(response, [context for _, context in sections])
+    
+    def _packed_max_tokens(self, section_count: int) -> int:
+        """묶음 요청의 최대 응답 토큰 (섹션마다 카드를 요청하므로 섹션 수만큼 늘리되 PACK_MAX_OUTPUT_TOKENS로 제한)"""
+        budget = self.config.max_tokens * section_count
+        return min(budget, max(self.config.max_tokens, self.config.pack_max_output_tokens))
+    
+    async def _agenerate_streaming(self, messages: List[Dict], text: str, context: Dict) -> List[Flashcard]:
+        """스트리밍 응답에서 카드가 완성되는 즉시 중복 확인 후 평가를 시작"""
+        parser = IncrementalCardParser()
+        batch_size = max(1, self.config.stream_score_batch_size)
+        pending: List[Flashcard] = []
+        seen: List[str] = []
+        accepted_ids: List[int] = []
+        scoring_tasks = []
+        candidates = 0
+        
+        def collect(blocks: List[str]) -> None:
+            nonlocal pending, candidates
+            for block in blocks:
+                card = self._parse_card_block(block, context)
+                candidates += card is not None
+                if card is None or not self._is_new_candidate(card, seen):
+                    continue
+                pending.append(card)
+                if len(pending) >= batch_size:
+                    scoring_tasks.append(asyncio.create_task(self._afinalize_scored(pending, text, accepted_ids)))
+                    pending = []
+        
+        try:
+            async with self._get_semaphore():
+                async for chunk in self.llm_service.astream_api_with_retry(messages):
+                    collect(parser.feed(chunk))
+            collect(parser.close())
+            if pending:
+                scoring_tasks.append(asyncio.create_task(self._afinalize_scored(pending, text, accepted_ids)))
+        except BaseException:
+            # 생성이 실패하면 이미 시작한 평가를 정리하고, 먼저 채택된 카드도 인덱스에서 제거
+            for task in scoring_tasks:
+                task.cancel()
+            await asyncio.gather(*scoring_tasks, return_exceptions=True)
+            for card_id in accepted_ids:
+                self.dedup_index.remove(card_id)
+            raise
+        
+        results = await asyncio.gather(*scoring_tasks)
+        valid_cards = [card for cards in results for card in cards]
+        self._record_cards(candidates, len(valid_cards))
+        return valid_cards
+    
+    async def _afinalize_scored(self, cards: List[Flashcard], source_text: str,
+                                accepted_ids: Optional[List[int]] = None) -> List[Flashcard]:
+        """후보 카드를 평가하고, 통과한 카드를 중복 인덱스에 넣은 뒤 반환
+        
+        평가하는 동안 다른 섹션에서 비슷한 카드가 먼저 채택되었으면 중복으로 제외합니다.
+        accepted_ids가 주어지면 인덱스에 넣은 항목 ID를 추가합니다.
+        """
+        scores = await self._ascore_candidates(cards, source_text)
         
-        # 품질 검증 및 중복 제거
         valid_cards = []
-        for card in cards:
-            if card.is_valid() and self._is_unique(card):
-                # LLM 기반 품질 평가
-                quality_score = card.calculate_quality_score(self.llm_service)
-                if quality_score >= self.config.min_card_quality:
-                    valid_cards.append(card)
-                    self._add_to_generated(card)
-                else:
+        for card, quality_score in zip(cards, scores):
+            if quality_score is None or quality_score < self.config.min_card_quality:
+                if quality_score is not None:
                     logging.warning(f"낮은 품질로 카드 제외 (점수: {quality_score:.2f}): {card.question[:50]}...")
+                continue
+            
+            card_id = self.dedup_index.add_if_unique(self._dedup_text(card))
+            if card_id is None:
+                logging.debug(f"먼저 채택된 카드와 중복되어 제외: {card.question[:50]}...")
+                continue
+            if accepted_ids is not None:
+                accepted_ids.append(card_id)
+            valid_cards.append(card)
         
         return valid_cards
     
-    def generate_cards_from_pdf(self, file_path: str, process_all: bool = False) -> List[Flashcard]:
-        """파일에서 플래시카드 생성 (PDF, Markdown, Text 지원)"""
+    async def agenerate_cards_from_pdf(self, file_path: str, process_all: bool = False,
+                                       on_cards: Optional[Callable[[List[Flashcard]], None]] = None,
+                                       on_error: Optional[Callable[[int], None]] = None) -> List[Flashcard]:
+        """파일에서 플래시카드 비동기 생성 (PDF, Markdown, Text 지원)
+        
+        on_cards가 주어지면 섹션이 끝날 때마다 통과한 카드로 호출합니다 (예: 파일에 바로 저장).
+        on_error는 처리에 실패한 섹션 번호로 호출됩니다.
+        """
+        all_cards = []
+        section_count = 0
+        self.stats.add_files(1)
+        try:
+            async for section_idx, cards in self.astream_cards_from_pdf(file_path, process_all):
+                section_count += 1
+                if cards is None:
+                    if on_error:
+                        on_error(section_idx)
+                    continue
+                if on_cards and cards:
+                    on_cards(cards)
+                all_cards.extend(cards)
+        except Exception:
+            self.stats.file_finished(failed=True)
+            raise
+        self.stats.file_finished()
+        
+        logging.info(f"총 {section_count}개 섹션에서 {len(all_cards)}개 플래시카드 생성 완료")
+        if self.card_filter:
+            logging.info(f"휴리스틱 필터 통계: {self.card_filter.get_stats()}")
+        return all_cards
+    
+    def generate_cards_from_files(self, file_paths: List[str], process_all: bool = False, max_parallel_files: int = 4,
+                                  on_cards: Optional[Callable[[str, List[Flashcard]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 파일에서 플래시카드 생성 (비동기 구현의 동기 래퍼)"""
+        return self._run_sync(self.agenerate_cards_from_files(file_paths, process_all, max_parallel_files, on_cards))
+    
+    async def agenerate_cards_from_files(self, file_paths: List[str], process_all: bool = False, max_parallel_files: int = 4,
+                                         on_cards: Optional[Callable[[str, List[Flashcard]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 파일을 동시에 처리하고 파일별 결과(카드 수, 실패한 섹션, 오류) 반환
+        
+        모든 파일의 섹션이 같은 동시 요청 제한(세마포어)과 제공자 속도 제한을 공유하므로
+        느린 파일이 있어도 다른 파일의 섹션이 빈 슬롯을 채웁니다. 동시에 여는 파일 수는
+        max_parallel_files로 제한하며, 카드는 on_cards(파일 경로, 카드)로 전달되고 모아 두지 않습니다.
+        """
+        file_slots = asyncio.Semaphore(max(1, max_parallel_files))
+        results: Dict[str, Dict[str, Any]] = {}
+        self.stats.add_files(len(file_paths))
+        
+        async def process(file_path: str) -> None:
+            result: Dict[str, Any] = {'cards': 0, 'failed_sections': [], 'error': None}
+            results[file_path] = result
+            async with file_slots:
+                try:
+                    async for section_idx, cards in self.astream_cards_from_pdf(file_path, process_all):
+                        if cards is None:
+                            result['failed_sections'].append(section_idx)
+                            continue
+                        result['cards'] += len(cards)
+                        if on_cards and cards:
+                            on_cards(file_path, cards)
+                except Exception as e:
+                    logging.error(f"파일 처리 오류 ({file_path}): {e}")
+                    result['error'] = str(e)
+            self.stats.file_finished(failed=result['error'] is not None)
+            logging.info(f"{file_path}: {result['cards']}개 플래시카드 생성 완료")
+        
+        await asyncio.gather(*(process(file_path) for file_path in file_paths))
+        
+        if self.card_filter:
+            logging.info(f"휴리스틱 필터 통계: {self.card_filter.get_stats()}")
+        if self._packer:
+            logging.info(f"섹션 묶음 통계: {self._packer.get_stats()}")
+        return {file_path: results[file_path] for file_path in file_paths}
+    
+    async def astream_cards_from_pdf(self, file_path: str,
+                                     process_all: bool = False) -> AsyncIterator[Tuple[int, Optional[List[Flashcard]]]]:
+        """섹션을 필요할 때만 분할해 처리하고 섹션 순서대로 (섹션 번호, 통과한 카드) 반환
+        
+        진행 중인 섹션은 pipeline_max_pending_sections개로 제한되므로 문서 크기와 관계없이
+        메모리 사용량이 일정합니다. 실패한 섹션은 로그를 남기고 카드 대신 None을 반환합니다.
+        """
         logging.info(f"파일 처리 시작: {file_path}")
         
-        # 파일 읽기
-        text, metadata = self.file_service.read_file(file_path)
+        # 파일 읽기 (CPU 작업은 이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+        # 일부 섹션만 필요하면 페이지를 필요한 만큼만 추출하는 이터레이터 사용
+        if process_all:
+            text, metadata = await asyncio.to_thread(self.file_service.read_file, file_path)
+        else:
+            text, metadata = await asyncio.to_thread(self.file_service.iter_text, file_path)
         logging.info(f"파일 메타데이터: {metadata}")
         
-        # 텍스트 분할
-        sections = TextProcessor.smart_divide_text(text)
-        logging.info(f"총 {len(sections)}개 섹션으로 분할됨")
-        
-        # 처리할 섹션 결정
+        # 텍스트 분할은 섹션이 필요할 때마다 진행
+        sections = TextProcessor.iter_divide_text(text)
         if not process_all:
-            sections = sections[:3]  # 처음 3개 섹션만
+            sections = islice(sections, 3)  # 처음 3개 섹션만
             logging.info("처음 3개 섹션만 처리합니다")
         
-        # 병렬 처리로 플래시카드 생성
-        all_cards = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_section = {
-                executor.submit(
-                    self.generate_cards_from_section,
-                    section,
-                    metadata
-                ): i
-                for i, section in enumerate(sections)
-            }
+        # 진행률 계산용 텍스트 크기 (미리보기는 분할된 섹션만 처리 대상)
+        expected_chars = len(text) if isinstance(text, str) and process_all else 0
+        queued_chars = 0
+        self.stats.add_text(expected_chars)
+        
+        file_key = JobJournal.file_key(file_path)
+        fingerprint = self._generation_fingerprint() if self.journal else ''
+        failed_sections = 0
+        window = max(1, self.config.pipeline_max_pending_sections)
+        pending: Deque[Tuple[int, int, asyncio.Task]] = deque()
+        try:
+            section_idx = 0
+            while True:
+                section = await asyncio.to_thread(self._next_section, sections)
+                if section is None:
+                    break
+                if not expected_chars:
+                    self.stats.add_text(len(section))
+                self.stats.section_queued(len(section))
+                queued_chars += len(section)
+                task = asyncio.create_task(
+                    self._agenerate_journaled(section, metadata, file_key, section_idx, fingerprint)
+                )
+                pending.append((section_idx, len(section), task))
+                section_idx += 1
+                
+                # 창이 가득 차면 가장 오래된 섹션 결과를 내보낸 뒤 다음 섹션 분할
+                if len(pending) >= window:
+                    result = await self._finish_section(*pending.popleft())
+                    failed_sections += result[1] is None
+                    yield result
             
-            for future in as_completed(future_to_section):
-                section_idx = future_to_section[future]
-                try:
-                    cards = future.result()
-                    all_cards.extend(cards)
-                    logging.info(f"섹션 {section_idx + 1}: {len(cards)}개 카드 생성됨")
-                except Exception as e:
-                    logging.error(f"섹션 {section_idx + 1} 처리 오류: {e}")
+            # 분할 과정에서 줄어든 공백 등 예상 크기와의 차이 보정
+            if expected_chars:
+                self.stats.add_text(queued_chars - expected_chars)
+                expected_chars = 0
+            
+            while pending:
+                result = await self._finish_section(*pending.popleft())
+                failed_sections += result[1] is None
+                yield result
+            
+            # 모든 섹션이 성공한 파일은 재개할 일이 없으므로 저널 기록 삭제
+            if self.journal and not failed_sections:
+                self.journal.clear(file_key)
+        finally:
+            # 소비자가 중간에 멈추면 진행 중인 섹션 취소
+            for _, chars, task in pending:
+                task.cancel()
+                self.stats.section_finished(chars, None)
+                metrics.SECTIONS.inc(status='cancelled')
+            if pending:
+                await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
+            if expected_chars:
+                self.stats.add_text(queued_chars - expected_chars)
+            # 끝까지 읽지 않은 파일 닫기
+            if hasattr(text, 'close'):
+                await asyncio.to_thread(text.close)
+    
+    async def _agenerate_journaled(self, section: str, metadata: Dict, file_key: str, section_idx: int,
+                                   fingerprint: str = '') -> List[Flashcard]:
+        """저널에 완료 기록이 있으면 카드를 재사용하고, 없으면 생성 후 결과를 기록"""
+        if not self.journal:
+            return await self.agenerate_cards_from_section(section, metadata)
         
-        logging.info(f"총 {len(all_cards)}개 플래시카드 생성 완료")
-        return all_cards
+        section_hash = JobJournal.section_hash(section, fingerprint)
+        cards = self.journal.get_done(file_key, section_idx, section_hash)
+        if cards is not None:
+            # 이후 섹션이 재사용한 카드와 중복되지 않도록 인덱스에 등록
+            for card in cards:
+                self._register_valid(card)
+            logging.info(f"섹션 {section_idx + 1}: 작업 저널의 카드 {len(cards)}개 재사용")
+            return cards
+        
+        try:
+            cards = await self.agenerate_cards_from_section(section, metadata)
+        except Exception as e:
+            self.journal.record_failed(file_key, section_idx, section_hash, str(e))
+            raise
+        self.journal.record_done(file_key, section_idx, section_hash, cards)
+        return cards
+    
+    async def _finish_section(self, section_idx: int, chars: int,
+                              task: 'asyncio.Task[List[Flashcard]]') -> Tuple[int, Optional[List[Flashcard]]]:
+        """섹션 결과를 기다려 통계에 반영"""
+        section_idx, cards = await self._await_section(section_idx, task)
+        self.stats.section_finished(chars, cards)
+        metrics.SECTIONS.inc(status='failed' if cards is None else 'done')
+        return section_idx, cards
+    
+    @staticmethod
+    def _next_section(sections: Iterator[str]) -> Optional[str]:
+        """다음 섹션 분할 (분할 시간 지표 기록, 지연 추출 중인 PDF는 페이지 추출 시간 포함)"""
+        start = time.perf_counter()
+        section = next(sections, None)
+        if section is not None:
+            metrics.SECTION_SPLIT_SECONDS.observe(time.perf_counter() - start)
+        return section
+    
+    def _record_cards(self, candidates: int, accepted: int) -> None:
+        """파싱된 카드 수와 통과/제외된 카드 수 기록"""
+        self.stats.record_rejected(candidates - accepted)
+        metrics.CARDS.inc(candidates, stage='parsed')
+        metrics.CARDS.inc(accepted, stage='accepted')
+        metrics.CARDS.inc(candidates - accepted, stage='rejected')
+    
+    async def _await_section(self, section_idx: int,
+                             task: 'asyncio.Task[List[Flashcard]]') -> Tuple[int, Optional[List[Flashcard]]]:
+        """섹션 작업 결과 대기 (오류는 로그만 남기고 None)"""
+        try:
+            cards = await task
+        except Exception as e:
+            logging.error(f"섹션 {section_idx + 1} 처리 오류: {e}")
+            return section_idx, None
+        logging.info(f"섹션 {section_idx + 1}: {len(cards)}개 카드 생성됨")
+        return section_idx, cards
+    
+    async def _ascore_candidates(self, cards: List[Flashcard], source_text: str) -> List[Optional[float]]:
+        """휴리스틱 판정 후 남은 카드만 LLM 평가 (휴리스틱으로 제외된 카드는 None)"""
+        if not self.card_filter:
+            return list(await self._ascore_cards(cards))
+        
+        results = self.card_filter.evaluate_cards(cards, source_text)
+        uncertain = [card for card, result in zip(cards, results) if result.verdict == 'uncertain']
+        llm_scores = iter(await self._ascore_cards(uncertain))
+        
+        scores: List[Optional[float]] = []
+        for card, result in zip(cards, results):
+            if result.verdict == 'reject':
+                logging.info(f"휴리스틱 규칙({result.rule})으로 카드 제외: {card.question[:50]}...")
+                scores.append(None)
+            else:
+                scores.append(1.0 if result.verdict == 'accept' else next(llm_scores))
+        
+        return scores
+    
+    def register_existing_cards(self, cards: Iterable[Flashcard]) -> int:
+        """이미 덱에 있는 카드를 중복 인덱스에 등록 (새 카드가 이들과 중복되지 않도록), 등록된 수 반환"""
+        return sum(1 for card in cards if self._register_valid(card) is not None)
+    
+    def reset_stats(self) -> None:
+        """새 실행을 위해 누적 통계를 비움 (경과 시간은 처음 파일이 추가될 때부터)"""
+        self.stats = RunStatistics()
+    
+    def get_filter_stats(self) -> Dict:
+        """휴리스틱 필터의 판정/규칙별 제외 통계"""
+        return self.card_filter.get_stats() if self.card_filter else {}
+    
+    def get_packing_stats(self) -> Dict:
+        """마지막 실행의 묶음 요청 통계 (묶음 모드가 아니면 빈 딕셔너리)"""
+        return self._packer.get_stats() if self._packer else {}
+    
+    async def _ascore_cards(self, cards: List[Flashcard]) -> List[float]:
+        """동시 요청 제한 안에서 카드 품질 일괄 평가"""
+        if not cards:
+            return []
+        async with self._get_semaphore():
+            return await self.quality_scorer.ascore_cards(cards)
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 동시 요청 제한 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    def _get_packer(self) -> Optional[SectionPacker]:
+        """현재 이벤트 루프의 섹션 묶음 처리기 (SECTION_PACKING_ENABLED가 아니면 None)"""
+        if not self.config.section_packing_enabled:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._packer is None or self._packer_loop is not loop:
+            self._packer = SectionPacker(
+                self._agenerate_packed,
+                max_tokens=self.config.pack_max_tokens,
+                max_sections=self.config.pack_max_sections,
+                linger_seconds=self.config.pack_linger_seconds
+            )
+            self._packer_loop = loop
+        return self._packer
+    
+    def _run_sync(self, coro: Awaitable[T]) -> T:
+        """코루틴을 새 이벤트 루프에서 실행하고 비동기 자원 정리"""
+        async def runner() -> T:
+            try:
+                return await coro
+            finally:
+                await self.llm_service.aclose()
+        
+        return asyncio.run(runner())
+    
+    def _generation_fingerprint(self) -> str:
+        """저널 기록을 재사용해도 되는지 판단하는 생성 설정 지문 (제공자, 모델, 생성/평가 설정, 프롬프트)"""
+        config = self.config
+        model = {
+            'openai': config.openai_model,
+            'ollama': config.ollama_model,
+            'openrouter': config.openrouter_model
+        }.get(config.provider, '')
+        settings = [
+            config.provider, model, config.llm_endpoints, config.temperature, config.max_tokens,
+            config.cards_per_section, config.min_card_quality,
+            self._get_system_prompt(), self._create_generation_prompt('', {})
+        ]
+        return hashlib.sha1(json.dumps(settings, ensure_ascii=False).encode('utf-8')).hexdigest()
     
     def _get_system_prompt(self) -> str:
         """시스템 프롬프트 생성"""
@@ -122,16 +536,55 @@ class FlashcardGeneratorService(IFlashcardGeneratorService):
 텍스트:
 {text}
 
-중요한 지침:
-1. 질문을 만들기 전에 텍스트에서 명확한 답변을 먼저 찾으세요
-2. 답변이 텍스트에 명시되어 있지 않으면 해당 질문을 만들지 마세요
-3. 모든 답변은 주어진 텍스트를 기반으로 해야 합니다
-4. "모르겠다", "언급되지 않음" 같은 답변은 절대 사용하지 마세요
+{GENERATION_GUIDELINES}
 
 각 카드는 위에서 설명한 형식을 정확히 따라주세요."""
         
         return prompt
     
+    def _create_packed_prompt(self, sections: List[Tuple[str, Dict]]) -> str:
+        """번호를 붙인 여러 섹션의 묶음 생성 프롬프트"""
+        parts = []
+        for number, (text, _) in enumerate(sections, start=1):
+            key_concepts = TextProcessor.extract_key_concepts(text)
+            parts.append(f"""[섹션 {number}]
+주요 개념: {', '.join(key_concepts) if key_concepts else '자동 감지'}
+
+텍스트:
+{text}""")
+        sections_text = "\n\n".join(parts)
+        
+        return f"""다음 {len(sections)}개의 텍스트 섹션 각각에서 {self.config.cards_per_section}개씩 Anki 플래시카드를 생성하세요.
+각 카드의 첫 줄에는 카드를 만든 섹션 번호를 "Section: 번호" 형식으로 적으세요.
+
+{sections_text}
+
+{GENERATION_GUIDELINES}
+5. 한 카드에는 한 섹션의 내용만 사용하세요
+
+각 카드는 "Section: 번호" 줄 다음에 위에서 설명한 형식을 정확히 따라주세요."""
+    
+    def _parse_packed_flashcards(self, response: str, contexts: List[Dict]) -> List[List[Flashcard]]:
+        """묶음 응답의 카드를 섹션 번호에 따라 나누고 각 섹션의 출처 태그 추가"""
+        cards: List[List[Flashcard]] = [[] for _ in contexts]
+        unlabeled = 0
+        for card_text in re.split(r'---+', response):
+            match = SECTION_LABEL_PATTERN.search(card_text)
+            index = int(match.group(1)) - 1 if match else -1
+            context = contexts[index] if 0 <= index < len(contexts) else {}
+            card = self._parse_card_block(SECTION_LABEL_PATTERN.sub('', card_text, count=1), context)
+            if card is None:
+                continue
+            if 0 <= index < len(contexts):
+                cards[index].append(card)
+            else:
+                unlabeled += 1
+        
+        if unlabeled:
+            logging.warning(f"섹션 번호가 없거나 잘못된 카드 {unlabeled}개 제외")
+            self._record_cards(unlabeled, 0)
+        return cards
+    
     def _parse_flashcards(self, response: str, context: Dict) -> List[Flashcard]:
         """응답에서 플래시카드 파싱"""
         cards = []
@@ -140,42 +593,62 @@ class FlashcardGeneratorService(IFlashcardGeneratorService):
         card_texts = re.split(r'---+', response)
         
         for card_text in card_texts:
-            if not card_text.strip():
-                continue
-                
-            # Q&A 추출
-            q_match = re.search(r'Q:\s*(.+?)(?=A:|$)', card_text, re.DOTALL)
-            a_match = re.search(r'A:\s*(.+?)(?=Tags:|$)', card_text, re.DOTALL)
-            tags_match = re.search(r'Tags:\s*(.+?)$', card_text, re.DOTALL)
-            
-            if q_match and a_match:
-                question = q_match.group(1).strip()
-                answer = a_match.group(1).strip()
-                
-                tags = []
-                if tags_match:
-                    tags_text = tags_match.group(1).strip()
-                    tags = [tag.strip() for tag in re.split(r'[,，]', tags_text)]
-                
-                # 컨텍스트 태그 추가
-                if context.get('file_name'):
-                    tags.append(f"source:{context['file_name']}")
-                
-                card = Flashcard(
-                    question=question,
-                    answer=answer,
-                    tags=tags
-                )
+            card = self._parse_card_block(card_text, context)
+            if card:
                 cards.append(card)
         
         return cards
     
-    def _is_unique(self, card: Flashcard) -> bool:
-        """카드 중복 확인"""
-        card_hash = hashlib.md5(f"{card.question}:{card.answer}".encode()).hexdigest()
-        return card_hash not in self.generated_cards
+    def _parse_card_block(self, card_text: str, context: Dict) -> Optional[Flashcard]:
+        """'---'로 구분된 카드 블록 하나를 파싱"""
+        if not card_text.strip():
+            return None
+            
+        # Q&A 추출
+        q_match = re.search(r'Q:\s*(.+?)(?=A:|$)', card_text, re.DOTALL)
+        a_match = re.search(r'A:\s*(.+?)(?=Tags:|$)', card_text, re.DOTALL)
+        tags_match = re.search(r'Tags:\s*(.+?)$', card_text, re.DOTALL)
+        
+        if not (q_match and a_match):
+            return None
+        
+        question = q_match.group(1).strip()
+        answer = a_match.group(1).strip()
+        
+        tags = []
+        if tags_match:
+            tags_text = tags_match.group(1).strip()
+            tags = [sys.intern(tag.strip()) for tag in re.split(r'[,，]', tags_text)]
+        
+        # 컨텍스트 태그 추가 (같은 태그 문자열은 모든 카드가 공유)
+        if context.get('file_name'):
+            tags.append(sys.intern(f"source:{context['file_name']}"))
+        
+        return Flashcard(
+            question=question,
+            answer=answer,
+            tags=tags
+        )
+    
+    def _register_valid(self, card: Flashcard) -> Optional[int]:
+        """이미 채택된 카드(저널 재사용, 기존 덱)를 유사 중복이 없으면 인덱스에 등록 (아니면 None)"""
+        if not card.is_valid():
+            return None
+        return self.dedup_index.add_if_unique(self._dedup_text(card))
+    
+    def _is_new_candidate(self, card: Flashcard, seen: List[str]) -> bool:
+        """유효하고, 채택된 카드나 같은 응답의 앞선 후보(seen)와 유사 중복이 아닌지 확인 (인덱스는 바꾸지 않음)"""
+        if not card.is_valid():
+            return False
+        text = self._dedup_text(card)
+        if self.dedup_index.find_similar(text) is not None:
+            return False
+        threshold = self.dedup_index.threshold
+        if any(text == other or self.dedup_index.similarity(text, other) >= threshold for other in seen):
+            return False
+        seen.append(text)
+        return True
     
-    def _add_to_generated(self, card: Flashcard):
-        """생성된 카드 기록"""
-        card_hash = hashlib.md5(f"{card.question}:{card.answer}".encode()).hexdigest()
-        self.generated_cards.add(card_hash) 
\ No newline at end of file
+    @staticmethod
+    def _dedup_text(card: Flashcard) -> str:
+        return f"{card.question} {card.answer}"
@@ -1,47 +1,505 @@
 """
 LLM 서비스 구현
 """
+import copy
+import hashlib
 import time
+import json
+import asyncio
 import logging
-import requests
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Tuple, Union, Mapping, Iterator, AsyncIterator, Iterable
+import aiohttp
 import openai
+import requests
 
-from src.IService.llm_service_interface import ILLMService
+from src.IService.llm_service_interface import ILLMService, current_llm_max_tokens
 from src.Config.llm_config import LLMConfig
+from src.Utils.llm_cache import LLMResponseCache
+from src.Utils.http_pool import PooledHTTPSession
+from src.Utils import metrics
+from src.Utils.endpoint_pool import CircuitBreaker, EndpointPool, LLMEndpoint, parse_endpoint_specs
+from src.Utils.rate_limiter import ProviderRateLimiter, compute_backoff, parse_retry_after
+from src.Utils.text_processor import TextProcessor
 
 
 class LLMService(ILLMService):
     """통합 LLM 서비스"""
     
+    # 제공자 과부하로 보고 동시성 한도를 줄이는 HTTP 상태 코드
+    OVERLOAD_STATUS_CODES = {429, 503}
+    
     def __init__(self, config: LLMConfig):
         self.config = config
         if config.provider == 'openai':
             openai.api_key = config.openai_api_key
+        
+        # Ollama / OpenRouter 요청이 공유하는 keep-alive 연결 풀
+        self.http = PooledHTTPSession(
+            pool_size=config.http_pool_size,
+            connect_timeout=config.http_connect_timeout,
+            read_timeout=config.http_read_timeout
+        )
+        
+        self.cache: Optional[LLMResponseCache] = None
+        if config.llm_cache_enabled:
+            self.cache = LLMResponseCache(
+                config.llm_cache_path,
+                max_size_mb=config.llm_cache_max_size_mb,
+                max_age_days=config.llm_cache_max_age_days,
+                mode=config.llm_cache_mode
+            )
+        
+        # 엔드포인트별 적응형 동시성과 자격 증명별 속도 제한 (동기·비동기·품질 평가 호출이 모두 공유)
+        self._rate_limiters: Dict[str, ProviderRateLimiter] = {}
+        self._quota_limiters: Dict[str, ProviderRateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        
+        # 비동기 호출용 aiohttp 세션 (이벤트 루프마다 생성)
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # 요청마다 고르는 엔드포인트 풀 (LLM_ENDPOINTS가 비어 있으면 이 서비스 자신이 유일한 엔드포인트)
+        endpoint_specs = parse_endpoint_specs(config.llm_endpoints)
+        if endpoint_specs:
+            endpoints = [self._create_endpoint(provider, base_url, model) for provider, base_url, model in endpoint_specs]
+        else:
+            endpoints = [LLMEndpoint(config.provider, config.provider, self._current_model(), self,
+                                     breaker=self._create_breaker())]
+        self.pool = EndpointPool(endpoints, config.lb_strategy)
+        
+        # 첫 요청이 모델 로드를 기다리지 않도록 생성 시 백그라운드에서 미리 로드 (풀의 엔드포인트는 각자 로드)
+        self._warmup_thread: Optional[threading.Thread] = None
+        if config.provider == 'ollama' and config.ollama_warmup and not endpoint_specs:
+            self._warmup_thread = threading.Thread(target=self.warm_up, name="ollama-warmup", daemon=True)
+            self._warmup_thread.start()
+    
+    def warm_up(self) -> bool:
+        """Ollama 모델을 메모리에 로드 (실패해도 첫 요청에서 다시 로드되므로 로그만 남김)"""
+        url, payload = self._build_ollama_request([])
+        payload.pop("options", None)
+        start = time.time()
+        try:
+            response = self.http.post(url, json=payload)
+            response.raise_for_status()
+        except Exception as e:
+            logging.info(f"Ollama 모델 미리 로드 실패 ({self.config.ollama_model}): {str(e)}")
+            return False
+        logging.info(f"Ollama 모델 미리 로드 완료 ({self.config.ollama_model}, {time.time() - start:.2f}초)")
+        return True
     
     def call_api_with_retry(self, messages: List[Dict]) -> str:
-        """재시도 로직이 포함된 API 호출"""
+        """재시도 로직이 포함된 API 호출 (응답 캐시 우선 조회)"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._make_cache_key(messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        response = self._call_provider_with_retry(messages)
+        
+        # 빈 응답은 캐시하지 않음
+        if self.cache and cache_key and response:
+            self.cache.set(cache_key, response)
+        
+        return response
+    
+    async def acall_api_with_retry(self, messages: List[Dict]) -> str:
+        """재시도 로직이 포함된 비동기 API 호출 (응답 캐시 우선 조회)"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._make_cache_key(messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        response = await self._acall_provider_with_retry(messages)
+        
+        if self.cache and cache_key and response:
+            self.cache.set(cache_key, response)
+        
+        return response
+    
+    def stream_api_with_retry(self, messages: List[Dict]) -> Iterator[str]:
+        """응답을 생성되는 대로 조각(청크) 단위로 반환
+
+        첫 청크를 받기 전에 실패하면 재시도하고, 일부를 이미 돌려준 뒤의 실패는 그대로 전파합니다.
+        완료된 응답은 캐시에 저장되며 캐시 적중 시에는 전체 응답을 한 번에 돌려줍니다.
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = self._make_cache_key(messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        failed: List[LLMEndpoint] = []
         for attempt in range(self.config.max_retries):
+            endpoint = self.pool.acquire(exclude=failed)
+            limiter = self._get_rate_limiter(endpoint)
+            wait = limiter.reserve(self._estimate_request_tokens(messages, limiter))
+            if wait > 0:
+                time.sleep(wait)
+            
+            limiter.concurrency.acquire()
+            start = time.monotonic()
+            received: List[str] = []
             try:
-                if self.config.provider == 'openai':
-                    return self._call_openai(messages)
-                elif self.config.provider == 'ollama':
-                    return self._call_ollama(messages)
-                elif self.config.provider == 'openrouter':
-                    return self._call_openrouter(messages)
-                else:
-                    raise ValueError(f"지원되지 않는 LLM 제공자: {self.config.provider}")
-                    
+                for chunk in endpoint.client._stream_dispatch(messages):
+                    received.append(chunk)
+                    yield chunk
+            except Exception as e:
+                limiter.concurrency.release(overloaded=self._is_overload_error(e))
+                self._record_attempt(endpoint, start, 'error', e)
+                failed.append(endpoint)
+                logging.warning(f"스트리밍 API 호출 실패 ({endpoint.name}, 시도 {attempt+1}/{self.config.max_retries}): {e}")
+                if received or attempt == self.config.max_retries - 1:
+                    raise
+                self._record_retry(endpoint)
+                time.sleep(self._failover_delay(attempt, e, failed))
+                continue
+            except BaseException:
+                limiter.concurrency.release()
+                self.pool.release(endpoint, None)
+                raise
+            
+            limiter.concurrency.release(latency=self._record_attempt(endpoint, start, 'success'))
+            response = ''.join(received)
+            if self.cache and cache_key and response:
+                self.cache.set(cache_key, response)
+            return
+    
+    async def astream_api_with_retry(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """응답을 생성되는 대로 조각(청크) 단위로 비동기 반환 (재시도/캐시 규칙은 동기 버전과 동일)"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._make_cache_key(messages)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        failed: List[LLMEndpoint] = []
+        for attempt in range(self.config.max_retries):
+            endpoint, limiter = await self._aacquire_endpoint(messages, failed)
+            start = time.monotonic()
+            received: List[str] = []
+            try:
+                async for chunk in endpoint.client._astream_dispatch(messages):
+                    received.append(chunk)
+                    yield chunk
+            except Exception as e:
+                limiter.concurrency.release(overloaded=self._is_overload_error(e))
+                self._record_attempt(endpoint, start, 'error', e)
+                failed.append(endpoint)
+                logging.warning(f"스트리밍 API 호출 실패 ({endpoint.name}, 시도 {attempt+1}/{self.config.max_retries}): {e}")
+                if received or attempt == self.config.max_retries - 1:
+                    raise
+                self._record_retry(endpoint)
+                await asyncio.sleep(self._failover_delay(attempt, e, failed))
+                continue
+            except BaseException:
+                limiter.concurrency.release()
+                self.pool.release(endpoint, None)
+                raise
+            
+            limiter.concurrency.release(latency=self._record_attempt(endpoint, start, 'success'))
+            response = ''.join(received)
+            if self.cache and cache_key and response:
+                self.cache.set(cache_key, response)
+            return
+    
+    async def aclose(self) -> None:
+        """비동기 HTTP 세션 종료"""
+        for client in self._endpoint_clients():
+            await client.aclose()
+        if self._async_session is not None:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+    
+    def get_cache_stats(self) -> Dict:
+        """응답 캐시 통계 (캐시 비활성화 시 빈 딕셔너리)"""
+        return self.cache.get_stats() if self.cache else {}
+    
+    def get_connection_stats(self) -> Dict:
+        """HTTP 연결 재사용 통계"""
+        return self.http.get_stats()
+    
+    def get_endpoint_stats(self) -> Dict:
+        """엔드포인트별 요청/실패 수, 진행 중 요청, 평균 지연, 서킷 상태"""
+        return self.pool.get_stats()
+    
+    def _stream_dispatch(self, messages: List[Dict]) -> Iterator[str]:
+        """설정된 제공자로 스트리밍 요청"""
+        if self.config.provider == 'openai':
+            return self._stream_openai(messages)
+        elif self.config.provider == 'ollama':
+            return self._stream_ollama(messages)
+        elif self.config.provider == 'openrouter':
+            return self._stream_openrouter(messages)
+        else:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {self.config.provider}")
+    
+    def _astream_dispatch(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """설정된 제공자로 비동기 스트리밍 요청"""
+        if self.config.provider == 'openai':
+            return self._astream_openai(messages)
+        elif self.config.provider == 'ollama':
+            return self._astream_ollama(messages)
+        elif self.config.provider == 'openrouter':
+            return self._astream_openrouter(messages)
+        else:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {self.config.provider}")
+    
+    def get_rate_limit_stats(self) -> Dict:
+        """제공자별 동시성 한도 현황"""
+        with self._rate_limiters_lock:
+            limiters = dict(self._rate_limiters)
+        return {
+            provider: {
+                'concurrency_limit': limiter.concurrency.limit,
+                'in_flight': limiter.concurrency.in_flight,
+                'increases': limiter.concurrency.increases,
+                'decreases': limiter.concurrency.decreases
+            }
+            for provider, limiter in limiters.items()
+        }
+    
+    def close(self) -> None:
+        """연결 풀과 캐시 정리"""
+        for client in self._endpoint_clients():
+            client.close()
+        self.http.close()
+        if self.cache:
+            self.cache.close()
+    
+    def _call_provider_with_retry(self, messages: List[Dict]) -> str:
+        """제공자 API 호출 (엔드포인트 선택, 속도 제한, 적응형 동시성, 재시도/장애 조치 포함)"""
+        failed: List[LLMEndpoint] = []
+        for attempt in range(self.config.max_retries):
+            endpoint = self.pool.acquire(exclude=failed)
+            limiter = self._get_rate_limiter(endpoint)
+            wait = limiter.reserve(self._estimate_request_tokens(messages, limiter))
+            if wait > 0:
+                time.sleep(wait)
+            
+            limiter.concurrency.acquire()
+            start = time.monotonic()
+            try:
+                response = endpoint.client._dispatch(messages)
             except Exception as e:
-                logging.warning(f"API 호출 실패 (시도 {attempt+1}/{self.config.max_retries}): {e}")
+                limiter.concurrency.release(overloaded=self._is_overload_error(e))
+                self._record_attempt(endpoint, start, 'error', e)
+                failed.append(endpoint)
+                logging.warning(f"API 호출 실패 ({endpoint.name}, 시도 {attempt+1}/{self.config.max_retries}): {e}")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (attempt + 1))
+                    self._record_retry(endpoint)
+                    time.sleep(self._failover_delay(attempt, e, failed))
                 else:
                     raise
+            except BaseException:
+                limiter.concurrency.release()
+                self.pool.release(endpoint, None)
+                raise
+            else:
+                limiter.concurrency.release(latency=self._record_attempt(endpoint, start, 'success'))
+                return response
         
         # 모든 시도가 실패한 경우 (이론적으로 도달하지 않음)
         raise RuntimeError("모든 API 호출 시도가 실패했습니다.")
     
+    async def _acall_provider_with_retry(self, messages: List[Dict]) -> str:
+        """제공자 API 비동기 호출 (엔드포인트 선택, 속도 제한, 적응형 동시성, 재시도/장애 조치 포함)"""
+        failed: List[LLMEndpoint] = []
+        for attempt in range(self.config.max_retries):
+            endpoint, limiter = await self._aacquire_endpoint(messages, failed)
+            start = time.monotonic()
+            try:
+                response = await endpoint.client._adispatch(messages)
+            except Exception as e:
+                limiter.concurrency.release(overloaded=self._is_overload_error(e))
+                self._record_attempt(endpoint, start, 'error', e)
+                failed.append(endpoint)
+                logging.warning(f"API 호출 실패 ({endpoint.name}, 시도 {attempt+1}/{self.config.max_retries}): {e}")
+                if attempt < self.config.max_retries - 1:
+                    self._record_retry(endpoint)
+                    await asyncio.sleep(self._failover_delay(attempt, e, failed))
+                else:
+                    raise
+            except BaseException:
+                # 취소 시에도 슬롯 반환
+                limiter.concurrency.release()
+                self.pool.release(endpoint, None)
+                raise
+            else:
+                limiter.concurrency.release(latency=self._record_attempt(endpoint, start, 'success'))
+                return response
+        
+        raise RuntimeError("모든 API 호출 시도가 실패했습니다.")
+    
+    def _dispatch(self, messages: List[Dict]) -> str:
+        """설정된 제공자로 요청"""
+        if self.config.provider == 'openai':
+            return self._call_openai(messages)
+        elif self.config.provider == 'ollama':
+            return self._call_ollama(messages)
+        elif self.config.provider == 'openrouter':
+            return self._call_openrouter(messages)
+        else:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {self.config.provider}")
+    
+    async def _adispatch(self, messages: List[Dict]) -> str:
+        """설정된 제공자로 비동기 요청"""
+        if self.config.provider == 'openai':
+            return await self._acall_openai(messages)
+        elif self.config.provider == 'ollama':
+            return await self._acall_ollama(messages)
+        elif self.config.provider == 'openrouter':
+            return await self._acall_openrouter(messages)
+        else:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {self.config.provider}")
+    
+    def _get_rate_limiter(self, endpoint: LLMEndpoint) -> ProviderRateLimiter:
+        """엔드포인트별 제한기 (모든 호출자가 공유)
+        
+        동시성 한도는 엔드포인트마다 따로 조절하고, 분당 요청/토큰 버킷은 같은 API 키를 쓰는 엔드포인트끼리 공유합니다.
+        """
+        with self._rate_limiters_lock:
+            limiter = self._rate_limiters.get(endpoint.name)
+            if limiter is None:
+                quota_key = self._quota_key(endpoint)
+                limiter = ProviderRateLimiter.from_config(self.config, quota=self._quota_limiters.get(quota_key))
+                self._quota_limiters.setdefault(quota_key, limiter)
+                self._rate_limiters[endpoint.name] = limiter
+            return limiter
+    
+    @staticmethod
+    def _quota_key(endpoint: LLMEndpoint) -> str:
+        """속도 제한 할당량 단위: 제공자 + API 키 (키가 없는 Ollama는 서버 URL)"""
+        config = endpoint.client.config
+        if endpoint.provider == 'openai':
+            credential = config.openai_api_key
+        elif endpoint.provider == 'openrouter':
+            credential = config.openrouter_api_key
+        else:
+            credential = config.ollama_base_url
+        digest = hashlib.sha256((credential or '').encode('utf-8')).hexdigest()[:16]
+        return f"{endpoint.provider}:{digest}"
+    
+    def _create_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(self.config.circuit_failure_threshold, self.config.circuit_reset_seconds)
+    
+    def _create_endpoint(self, provider: str, base_url: str, model: str) -> LLMEndpoint:
+        """풀 엔드포인트 하나 (요청은 해당 제공자/URL/모델 설정을 가진 하위 서비스가 보냄)"""
+        config = copy.copy(self.config)
+        config.provider = provider
+        config.llm_endpoints = ''
+        config.llm_cache_enabled = False  # 응답 캐시는 풀 앞에서 한 번만 조회
+        if provider == 'ollama':
+            config.ollama_base_url = base_url or config.ollama_base_url
+            config.ollama_model = model or config.ollama_model
+        elif provider == 'openrouter':
+            config.openrouter_base_url = base_url or config.openrouter_base_url
+            config.openrouter_model = model or config.openrouter_model
+        else:
+            config.openai_model = model or config.openai_model
+        
+        client = LLMService(config)
+        name = f"{provider}@{base_url}" if base_url else provider
+        if model:
+            name += f"#{model}"
+        return LLMEndpoint(name, provider, client._current_model(), client, base_url, self._create_breaker())
+    
+    def _endpoint_clients(self) -> List['LLMService']:
+        """풀 엔드포인트용 하위 서비스 목록 (자기 자신 제외)"""
+        return [endpoint.client for endpoint in self.pool.endpoints if endpoint.client is not self]
+    
+    def _estimate_request_tokens(self, messages: List[Dict], limiter: ProviderRateLimiter) -> int:
+        """분당 토큰 제한용 요청 토큰 추정 (프롬프트 + 최대 응답 토큰)"""
+        if not limiter.tokens.enabled:
+            return 0
+        prompt_tokens = sum(TextProcessor.estimate_tokens(msg.get('content', '')) for msg in messages)
+        return prompt_tokens + self._max_tokens()
+    
+    async def _aacquire_endpoint(self, messages: List[Dict],
+                                 failed: List[LLMEndpoint]) -> Tuple[LLMEndpoint, ProviderRateLimiter]:
+        """엔드포인트를 고르고 그 엔드포인트의 속도 제한/동시성 슬롯을 확보 (기다리다 취소되면 선택 취소)"""
+        endpoint = self.pool.acquire(exclude=failed)
+        limiter = self._get_rate_limiter(endpoint)
+        try:
+            wait = limiter.reserve(self._estimate_request_tokens(messages, limiter))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await limiter.concurrency.aacquire()
+        except BaseException:
+            self.pool.release(endpoint, None)
+            raise
+        return endpoint, limiter
+    
+    def _record_attempt(self, endpoint: LLMEndpoint, start: float, outcome: str,
+                        error: Optional[Exception] = None) -> float:
+        """시도 한 번의 결과를 엔드포인트 풀과 제공자/목적별 지표에 기록하고 지연 시간 반환
+        
+        요청 자체의 문제(4xx)나 공유 키의 속도 제한(429)은 엔드포인트 장애로 세지 않습니다.
+        """
+        latency = time.monotonic() - start
+        if outcome == 'success':
+            self.pool.release(endpoint, True, latency)
+        else:
+            self.pool.release(endpoint, False if self._is_endpoint_failure(error) else None)
+        metrics.LLM_REQUEST_SECONDS.observe(
+            latency, provider=endpoint.provider, purpose=metrics.current_llm_purpose(), outcome=outcome
+        )
+        metrics.LLM_ENDPOINT_REQUESTS.inc(endpoint=endpoint.name, outcome=outcome)
+        return latency
+    
+    def _record_retry(self, endpoint: LLMEndpoint) -> None:
+        metrics.LLM_RETRIES.inc(provider=endpoint.provider, purpose=metrics.current_llm_purpose())
+    
+    def _failover_delay(self, attempt: int, error: Exception, failed: List[LLMEndpoint]) -> float:
+        """다른 정상 엔드포인트가 있으면 기다리지 않고 넘기고, 없으면 백오프 후 재시도"""
+        if self.pool.has_alternative(failed):
+            return 0.0
+        return self._retry_delay(attempt, error)
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Retry-After를 우선하는 지터 지수 백오프"""
+        _, headers = self._error_status_and_headers(error)
+        retry_after = parse_retry_after(headers.get('Retry-After')) if headers else None
+        return compute_backoff(attempt, self.config.retry_delay, self.config.retry_max_delay, retry_after)
+    
+    @classmethod
+    def _is_overload_error(cls, error: Exception) -> bool:
+        """429/503 응답이나 타임아웃처럼 제공자 과부하를 뜻하는 오류인지"""
+        if isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+            return True
+        status, _ = cls._error_status_and_headers(error)
+        return status in cls.OVERLOAD_STATUS_CODES
+    
+    @classmethod
+    def _is_endpoint_failure(cls, error: Optional[Exception]) -> bool:
+        """연결 실패, 타임아웃, 5xx처럼 엔드포인트가 정상이 아님을 뜻하는 오류인지 (서킷 브레이커에 반영)"""
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                              aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionError)):
+            return True
+        status, _ = cls._error_status_and_headers(error)
+        return status is not None and status >= 500
+    
+    @staticmethod
+    def _error_status_and_headers(error: Exception) -> Tuple[Optional[int], Optional[Mapping]]:
+        """requests / aiohttp / openai 오류에서 HTTP 상태 코드와 헤더 추출"""
+        response = getattr(error, 'response', None)
+        if response is not None and hasattr(response, 'status_code'):
+            return response.status_code, response.headers
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status, error.headers
+        status = getattr(error, 'http_status', None)
+        headers = getattr(error, 'headers', None)
+        return status, headers if isinstance(headers, Mapping) else None
+    
     def generate_prompt(self, system_prompt: str, user_prompt: str) -> List[Dict]:
         """프롬프트 생성"""
         return [
@@ -49,38 +507,210 @@ class LLMService(ILLMService):
             {"role": "user", "content": user_prompt}
         ]
     
+    def _record_usage(self, data: Mapping) -> None:
+        """응답의 토큰 사용량 기록 (OpenAI 호환: usage, Ollama: prompt_eval_count/eval_count)"""
+        usage = data.get('usage')
+        if usage:
+            metrics.record_llm_tokens(self.config.provider, usage.get('prompt_tokens'), usage.get('completion_tokens'))
+        else:
+            metrics.record_llm_tokens(self.config.provider, data.get('prompt_eval_count'), data.get('eval_count'))
+    
+    def _current_model(self) -> str:
+        """현재 제공자의 모델 이름"""
+        if self.config.provider == 'openai':
+            return self.config.openai_model
+        elif self.config.provider == 'ollama':
+            return self.config.ollama_model
+        elif self.config.provider == 'openrouter':
+            return self.config.openrouter_model
+        return ''
+    
+    def _max_tokens(self) -> int:
+        """이번 요청의 최대 응답 토큰 (llm_max_tokens로 지정하지 않았으면 MAX_TOKENS)"""
+        return current_llm_max_tokens(self.config.max_tokens)
+    
+    def _make_cache_key(self, messages: List[Dict]) -> str:
+        """요청 내용 기반 캐시 키 (풀이면 엔드포인트들의 제공자/모델 조합 기준)"""
+        provider, model = self.config.provider, self._current_model()
+        if self._endpoint_clients():
+            identities = sorted({(endpoint.provider, endpoint.model) for endpoint in self.pool.endpoints})
+            provider = ','.join(identity[0] for identity in identities)
+            model = ','.join(identity[1] for identity in identities)
+        return LLMResponseCache.make_key(
+            provider,
+            model,
+            self.config.temperature,
+            self._max_tokens(),
+            messages,
+            # /api/chat과 /api/generate는 프롬프트 구성이 달라 응답도 다름
+            self.config.ollama_api if 'ollama' in provider.split(',') else ''
+        )
+    
     def _call_openai(self, messages: List[Dict]) -> str:
         """OpenAI API 호출"""
         response = openai.ChatCompletion.create(
             model=self.config.openai_model,
             messages=messages,
             temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens
+            max_tokens=self._max_tokens()
         )
+        self._record_usage(response)
         return response['choices'][0]['message']['content']
     
-    def _call_ollama(self, messages: List[Dict]) -> str:
-        """Ollama API 호출"""
-        prompt = self._format_messages_to_prompt(messages)
+    async def _acall_openai(self, messages: List[Dict]) -> str:
+        """OpenAI API 비동기 호출"""
+        response = await openai.ChatCompletion.acreate(
+            model=self.config.openai_model,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self._max_tokens()
+        )
+        self._record_usage(response)
+        return response['choices'][0]['message']['content']
+    
+    def _stream_openai(self, messages: List[Dict]) -> Iterator[str]:
+        """OpenAI API 스트리밍 호출"""
+        for chunk in openai.ChatCompletion.create(
+            model=self.config.openai_model,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self._max_tokens(),
+            stream=True
+        ):
+            content = chunk['choices'][0].get('delta', {}).get('content')
+            if content:
+                yield content
+    
+    async def _astream_openai(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """OpenAI API 비동기 스트리밍 호출"""
+        async for chunk in await openai.ChatCompletion.acreate(
+            model=self.config.openai_model,
+            messages=messages,
+            temperature=self.config.temperature,
+            max_tokens=self._max_tokens(),
+            stream=True
+        ):
+            content = chunk['choices'][0].get('delta', {}).get('content')
+            if content:
+                yield content
+    
+    def _build_ollama_request(self, messages: List[Dict]) -> Tuple[str, Dict]:
+        """Ollama 요청 URL과 페이로드"""
+        if self.config.ollama_api == 'generate':
+            url = f"{self.config.ollama_base_url}/api/generate"
+            payload = {"model": self.config.ollama_model, "prompt": self._format_messages_to_prompt(messages)}
+        else:
+            url = f"{self.config.ollama_base_url}/api/chat"
+            payload = {"model": self.config.ollama_model, "messages": self._stable_messages(messages)}
         
-        url = f"{self.config.ollama_base_url}/api/generate"
-        payload = {
-            "model": self.config.ollama_model,
-            "prompt": prompt,
+        payload.update({
             "stream": False,
             "options": {
                 "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens
+                "num_predict": self._max_tokens()
             }
-        }
+        })
+        keep_alive = self._ollama_keep_alive()
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        return url, payload
+    
+    def _ollama_keep_alive(self) -> Optional[Union[int, str]]:
+        """keep_alive 값 (숫자는 초 단위 정수로, 빈 값이면 서버 기본값 사용)"""
+        value = (self.config.ollama_keep_alive or '').strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    
+    @staticmethod
+    def _stable_messages(messages: List[Dict]) -> List[Dict]:
+        """시스템 메시지를 앞에 두고 role/content만 남긴 메시지 목록
+        
+        호출마다 같은 시스템 프롬프트가 같은 위치에 오므로 Ollama가 이전 요청의 KV 캐시를 재사용하고
+        가변 텍스트부터만 평가합니다.
+        """
+        ordered = sorted(messages, key=lambda msg: msg["role"] != "system")
+        return [{"role": msg["role"], "content": msg["content"]} for msg in ordered]
+    
+    @staticmethod
+    def _ollama_content(data: Mapping) -> str:
+        """/api/chat(message.content) 또는 /api/generate(response) 응답 텍스트"""
+        message = data.get('message')
+        if message is not None:
+            return message.get('content') or ''
+        return data.get('response') or ''
+    
+    def _call_ollama(self, messages: List[Dict]) -> str:
+        """Ollama API 호출"""
+        url, payload = self._build_ollama_request(messages)
         
-        response = requests.post(url, json=payload, timeout=120)
+        response = self.http.post(url, json=payload)
         response.raise_for_status()
         
-        return response.json().get('response', '')
+        data = response.json()
+        self._record_usage(data)
+        return self._ollama_content(data)
     
-    def _call_openrouter(self, messages: List[Dict]) -> str:
-        """OpenRouter API 호출"""
+    async def _acall_ollama(self, messages: List[Dict]) -> str:
+        """Ollama API 비동기 호출"""
+        url, payload = self._build_ollama_request(messages)
+        
+        session = await self._aget_async_session()
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+        
+        self._record_usage(data)
+        return self._ollama_content(data)
+    
+    def _stream_ollama(self, messages: List[Dict]) -> Iterator[str]:
+        """Ollama API 스트리밍 호출 (줄 단위 JSON)"""
+        url, payload = self._build_ollama_request(messages)
+        payload["stream"] = True
+        
+        with self.http.post(url, json=payload, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                content, done = self._parse_ollama_stream_line(line)
+                if content:
+                    yield content
+                if done:
+                    break
+    
+    async def _astream_ollama(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """Ollama API 비동기 스트리밍 호출 (줄 단위 JSON)"""
+        url, payload = self._build_ollama_request(messages)
+        payload["stream"] = True
+        
+        session = await self._aget_async_session()
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                content, done = self._parse_ollama_stream_line(line)
+                if content:
+                    yield content
+                if done:
+                    break
+    
+    @classmethod
+    def _parse_ollama_stream_line(cls, line: bytes) -> Tuple[str, bool]:
+        """Ollama 스트림 한 줄에서 (텍스트, 완료 여부) 추출"""
+        line = line.strip()
+        if not line:
+            return '', False
+        data = json.loads(line)
+        if data.get('error'):
+            raise RuntimeError(f"Ollama 오류: {data['error']}")
+        done = bool(data.get('done'))
+        if done:
+            metrics.record_llm_tokens('ollama', data.get('prompt_eval_count'), data.get('eval_count'))
+        return cls._ollama_content(data), done
+    
+    def _build_openrouter_request(self, messages: List[Dict]) -> Tuple[str, Dict, Dict]:
+        """OpenRouter 요청 URL, 페이로드, 헤더"""
         url = f"{self.config.openrouter_base_url}/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.config.openrouter_api_key}",
@@ -91,13 +721,117 @@ class LLMService(ILLMService):
             "model": self.config.openrouter_model,
             "messages": messages,
             "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens
+            "max_tokens": self._max_tokens()
         }
+        return url, payload, headers
+    
+    def _call_openrouter(self, messages: List[Dict]) -> str:
+        """OpenRouter API 호출"""
+        url, payload, headers = self._build_openrouter_request(messages)
         
-        response = requests.post(url, json=payload, headers=headers, timeout=120)
+        response = self.http.post(url, json=payload, headers=headers)
         response.raise_for_status()
         
-        return response.json()['choices'][0]['message']['content']
+        data = response.json()
+        self._record_usage(data)
+        return data['choices'][0]['message']['content']
+    
+    async def _acall_openrouter(self, messages: List[Dict]) -> str:
+        """OpenRouter API 비동기 호출"""
+        url, payload, headers = self._build_openrouter_request(messages)
+        
+        session = await self._aget_async_session()
+        async with session.post(url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+        
+        self._record_usage(data)
+        return data['choices'][0]['message']['content']
+    
+    def _stream_openrouter(self, messages: List[Dict]) -> Iterator[str]:
+        """OpenRouter(OpenAI 호환) API 스트리밍 호출 (SSE)"""
+        url, payload, headers = self._build_openrouter_request(messages)
+        payload["stream"] = True
+        
+        with self.http.post(url, json=payload, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            yield from self._iter_sse_content(response.iter_lines())
+    
+    async def _astream_openrouter(self, messages: List[Dict]) -> AsyncIterator[str]:
+        """OpenRouter(OpenAI 호환) API 비동기 스트리밍 호출 (SSE)"""
+        url, payload, headers = self._build_openrouter_request(messages)
+        payload["stream"] = True
+        
+        session = await self._aget_async_session()
+        async with session.post(url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                content, done = self._parse_sse_line(line)
+                if content:
+                    yield content
+                if done:
+                    break
+    
+    @classmethod
+    def _iter_sse_content(cls, lines: Iterable[bytes]) -> Iterator[str]:
+        """SSE 줄들에서 응답 텍스트 조각 추출"""
+        for line in lines:
+            content, done = cls._parse_sse_line(line)
+            if content:
+                yield content
+            if done:
+                break
+    
+    @staticmethod
+    def _parse_sse_line(line: bytes) -> Tuple[str, bool]:
+        """OpenAI 호환 SSE 한 줄에서 (텍스트, 완료 여부) 추출"""
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        line = line.strip()
+        if not line.startswith('data:'):
+            return '', False
+        data = line[len('data:'):].strip()
+        if data == '[DONE]':
+            return '', True
+        chunk = json.loads(data)
+        if chunk.get('error'):
+            raise RuntimeError(f"스트리밍 오류: {chunk['error']}")
+        if chunk.get('usage'):
+            metrics.record_llm_tokens('openrouter', chunk['usage'].get('prompt_tokens'),
+                                      chunk['usage'].get('completion_tokens'))
+        choices = chunk.get('choices') or [{}]
+        return (choices[0].get('delta') or {}).get('content') or '', False
+    
+    async def _aget_async_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프용 aiohttp 세션 (keep-alive 연결 풀 공유, 다른 루프에서 만든 세션은 닫고 교체)"""
+        loop = asyncio.get_running_loop()
+        if self._async_session is not None and not self._async_session.closed and self._async_session_loop is loop:
+            return self._async_session
+        
+        # 새 세션을 먼저 걸어 두어 닫기를 기다리는 동안 들어온 요청도 같은 세션을 사용
+        stale, stale_loop = self._async_session, self._async_session_loop
+        connector = aiohttp.TCPConnector(limit=max(self.config.http_pool_size, self.config.max_concurrency))
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=self.config.http_connect_timeout,
+            sock_read=self.config.http_read_timeout
+        )
+        self._async_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        self._async_session_loop = loop
+        if stale is not None and not stale.closed:
+            await self._close_stale_session(stale, stale_loop)
+        return self._async_session
+    
+    @staticmethod
+    async def _close_stale_session(session: aiohttp.ClientSession,
+                                   loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """다른 이벤트 루프에서 만든 세션 닫기 (그 루프가 다른 스레드에서 돌고 있으면 그 루프에서 닫음)"""
+        try:
+            if loop is not None and loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                await session.close()
+        except Exception as e:
+            logging.debug(f"이전 비동기 세션 종료 실패: {e}")
     
     def _format_messages_to_prompt(self, messages: List[Dict]) -> str:
         """메시지를 프롬프트로 변환"""
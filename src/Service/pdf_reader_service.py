@@ -3,19 +3,132 @@
 """
 import os
 import re
+import time
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Tuple, Dict
+from typing import Tuple, Dict, List, Optional, Iterable, Iterator
 import PyPDF2
 
+from src.Config.llm_config import LLMConfig
 from src.IService.pdf_reader_interface import IFileReaderService
+from src.Utils.text_extract_cache import ExtractedTextCache
+from src.Utils.metrics import FILE_READ_SECONDS, PDF_PAGE_EXTRACT_SECONDS
+
+
+# (페이지 번호, 추출된 텍스트, 소요 시간(초), 오류 메시지)
+PageResult = Tuple[int, str, float, Optional[str]]
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> List[PageResult]:
+    """[start, end) 범위 페이지 텍스트 추출 (프로세스 풀 작업 함수)"""
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return [_extract_page(reader, i) for i in range(start, end)]
+
+
+def _extract_page(reader: PyPDF2.PdfReader, index: int) -> PageResult:
+    """페이지 한 장 추출 (실패해도 예외 대신 오류 메시지 반환)"""
+    started = time.perf_counter()
+    try:
+        text = reader.pages[index].extract_text() or ""
+        error = None
+    except Exception as e:
+        text, error = "", str(e)
+    return index, text, time.perf_counter() - started, error
 
 
 class FileReaderService(IFileReaderService):
     """다양한 파일 형식을 지원하는 파일 리더 서비스"""
     
+    # 작업 하나가 맡는 페이지 범위 수 (작업자당), 페이지마다 비용이 달라도 부하가 고르게 분산됨
+    CHUNKS_PER_WORKER = 4
+    
+    # 작업자 프로세스 시작 방식: 스레드(HTTP 연결 풀, 워밍업 등)가 도는 프로세스를 fork하면
+    # 잠긴 락이 복사되어 멈출 수 있으므로 spawn 사용
+    START_METHOD = 'spawn'
+    
+    # 하이픈이 아닌 문자 뒤에 오는 공백 (이 공백 앞에서 잘라도 정리 결과가 바뀌지 않음)
+    _SAFE_BREAK = re.compile(r'[^\s-](?=\s)')
+    
+    def __init__(self, config: Optional[LLMConfig] = None):
+        config = config or LLMConfig()
+        self.extract_workers = config.pdf_extract_workers or os.cpu_count() or 1
+        self.parallel_min_pages = config.pdf_parallel_min_pages
+        self.last_page_timings: List[float] = []  # 마지막으로 읽은 PDF의 페이지별 추출 시간(초)
+        self.text_cache: Optional[ExtractedTextCache] = None
+        if config.text_cache_enabled:
+            self.text_cache = ExtractedTextCache(config.text_cache_path, max_size_mb=config.text_cache_max_size_mb)
+        # 프로세스 풀은 처음 필요할 때 만들고 close()까지 모든 파일에서 재사용 (spawn 시작 비용은 한 번만)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """프로세스 풀과 텍스트 캐시 정리"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown()
+        if self.text_cache:
+            self.text_cache.close()
+    
     def read_file(self, file_path: str) -> Tuple[str, Dict]:
         """파일을 읽고 메타데이터 추출"""
+        file_extension, metadata = self._initial_metadata(file_path)
+        
+        try:
+            with FILE_READ_SECONDS.time(format=file_extension.lstrip('.') or 'unknown'):
+                if file_extension == '.pdf':
+                    return self._read_pdf(file_path, metadata)
+                elif file_extension in ['.md', '.markdown']:
+                    return self._read_markdown(file_path, metadata)
+                elif file_extension in ['.txt', '.text']:
+                    return self._read_text(file_path, metadata)
+                else:
+                    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
+                
+        except Exception as e:
+            logging.error(f"파일 읽기 오류 ({file_path}): {e}")
+            raise
+    
+    def iter_text(self, file_path: str) -> Tuple[Iterator[str], Dict]:
+        """PDF는 페이지를 필요할 때마다 추출하는 텍스트 조각 이터레이터 반환
+        
+        조각을 모두 이어 붙이면 read_file의 텍스트와 같습니다. 앞부분만 소비하면 나머지 페이지는
+        추출하지 않으며, 끝까지 소비한 경우에만 추출 캐시에 저장합니다.
+        Markdown/Text 파일은 전체를 한 조각으로 반환합니다.
+        """
+        file_extension, metadata = self._initial_metadata(file_path)
+        if file_extension != '.pdf':
+            text, metadata = self.read_file(file_path)
+            return iter([text]), metadata
+        
+        try:
+            cached = self.text_cache.get(file_path) if self.text_cache else None
+            if cached:
+                pages, cached_metadata = cached
+                metadata.update(cached_metadata)
+                logging.info(f"텍스트 추출 캐시 사용: {file_path}")
+                return self._iter_clean_text(pages), metadata
+            
+            file = open(file_path, 'rb')
+            try:
+                reader = PyPDF2.PdfReader(file)
+                self._read_pdf_metadata(reader, metadata)
+            except Exception:
+                file.close()
+                raise
+        except Exception as e:
+            logging.error(f"파일 읽기 오류 ({file_path}): {e}")
+            raise
+        
+        return self._iter_clean_text(self._iter_pdf_pages(file_path, file, reader, metadata)), metadata
+    
+    def _initial_metadata(self, file_path: str) -> Tuple[str, Dict]:
+        """파일 확장자와 기본 메타데이터"""
         file_path_obj = Path(file_path)
         file_extension = file_path_obj.suffix.lower()
         
@@ -26,47 +139,158 @@ class FileReaderService(IFileReaderService):
             'file_name': file_path_obj.name,
             'file_type': file_extension
         }
-        
-        try:
-            if file_extension == '.pdf':
-                return self._read_pdf(file_path, metadata)
-            elif file_extension in ['.md', '.markdown']:
-                return self._read_markdown(file_path, metadata)
-            elif file_extension in ['.txt', '.text']:
-                return self._read_text(file_path, metadata)
-            else:
-                raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
-                
-        except Exception as e:
-            logging.error(f"파일 읽기 오류 ({file_path}): {e}")
-            raise
+        return file_extension, metadata
     
     def _read_pdf(self, file_path: str, metadata: Dict) -> Tuple[str, Dict]:
-        """PDF 파일 읽기"""
+        """PDF 파일 읽기 (내용이 같은 파일은 추출 캐시 사용)"""
+        cached = self.text_cache.get(file_path) if self.text_cache else None
+        if cached:
+            pages, cached_metadata = cached
+            metadata.update(cached_metadata)
+            logging.info(f"텍스트 추출 캐시 사용: {file_path}")
+        else:
+            pages = self._extract_pdf_pages(file_path, metadata)
+            if self.text_cache:
+                self.text_cache.set(file_path, pages, metadata)
+        
+        text = " ".join(page for page in pages if page)
+        text = self._clean_text(text)
+        
+        return text, metadata
+    
+    def _extract_pdf_pages(self, file_path: str, metadata: Dict) -> List[str]:
+        """메타데이터를 채우고 페이지별 텍스트 목록 반환 (실패한 페이지는 빈 문자열)"""
         with open(file_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
             
-            # 메타데이터 추출
-            if reader.metadata:
-                metadata['title'] = reader.metadata.get('/Title', metadata['title'])
-                metadata['author'] = reader.metadata.get('/Author', '')
-            
-            metadata['pages'] = len(reader.pages)
+            self._read_pdf_metadata(reader, metadata)
             
-            # 텍스트 추출
-            text_parts = []
-            for i, page in enumerate(reader.pages):
+            # 텍스트 추출 (큰 파일은 여러 프로세스에서 페이지 범위를 나누어 추출)
+            results = None
+            if self._use_process_pool(metadata['pages']):
                 try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+                    results = self._extract_pages_parallel(file_path, metadata['pages'])
                 except Exception as e:
-                    logging.warning(f"PDF 페이지 {i+1} 읽기 실패: {e}")
-            
-            text = " ".join(text_parts)
-            text = self._clean_text(text)
-            
-            return text, metadata
+                    logging.warning(f"병렬 PDF 추출 실패, 순차 추출로 전환: {e}")
+            if results is None:
+                results = [_extract_page(reader, i) for i in range(metadata['pages'])]
+        
+        for i, _, _, error in results:
+            if error:
+                logging.warning(f"PDF 페이지 {i+1} 읽기 실패: {error}")
+        self._record_timings(file_path, results)
+        
+        return [page_text for _, page_text, _, _ in results]
+    
+    def _read_pdf_metadata(self, reader: PyPDF2.PdfReader, metadata: Dict) -> None:
+        """PDF 메타데이터 추출"""
+        if reader.metadata:
+            metadata['title'] = reader.metadata.get('/Title', metadata['title'])
+            metadata['author'] = reader.metadata.get('/Author', '')
+        
+        metadata['pages'] = len(reader.pages)
+    
+    def _iter_pdf_pages(self, file_path: str, file, reader: PyPDF2.PdfReader, metadata: Dict) -> Iterator[str]:
+        """페이지 텍스트를 한 장씩 추출 (끝까지 읽으면 추출 시간 기록 및 캐시 저장)"""
+        results: List[PageResult] = []
+        try:
+            for i in range(metadata['pages']):
+                result = _extract_page(reader, i)
+                results.append(result)
+                if result[3]:
+                    logging.warning(f"PDF 페이지 {i+1} 읽기 실패: {result[3]}")
+                yield result[1]
+        finally:
+            file.close()
+        
+        self._record_timings(file_path, results)
+        if self.text_cache:
+            self.text_cache.set(file_path, [page_text for _, page_text, _, _ in results], metadata)
+    
+    def _iter_clean_text(self, pages: Iterable[str]) -> Iterator[str]:
+        """페이지를 공백으로 이어 _clean_text를 적용한 결과를 조각 단위로 생성
+        
+        하이픈이 앞에 오지 않는 마지막 공백 직전까지만 정리해 내보내므로,
+        페이지 경계에 걸친 공백 통합과 하이픈 단어 재결합도 한 번에 정리한 것과 같습니다.
+        """
+        pending = ""
+        emitted = False
+        try:
+            for page in pages:
+                if not page:
+                    continue
+                pending = f"{pending} {page}" if pending else page
+                cut = self._safe_cut(pending)
+                if cut:
+                    piece = self._clean_text(pending[:cut])
+                    yield (' ' if emitted else '') + piece
+                    emitted = True
+                    pending = pending[cut:]
+        finally:
+            # 중간에 닫히면 페이지 이터레이터(열린 PDF 파일)도 닫기
+            if hasattr(pages, 'close'):
+                pages.close()
+        
+        piece = self._clean_text(pending)
+        if piece:
+            yield (' ' if emitted else '') + piece
+    
+    def _safe_cut(self, text: str) -> int:
+        """text를 나누어 정리해도 되는 마지막 위치 (없으면 0)"""
+        cut = 0
+        for match in self._SAFE_BREAK.finditer(text):
+            cut = match.end()
+        return cut
+    
+    def _use_process_pool(self, page_count: int) -> bool:
+        """프로세스 풀 시작 비용을 감수할 만큼 페이지가 많은지 확인"""
+        return self.extract_workers > 1 and self.parallel_min_pages > 0 and page_count >= self.parallel_min_pages
+    
+    def _extract_pages_parallel(self, file_path: str, page_count: int) -> List[PageResult]:
+        """페이지 범위를 프로세스 풀에 나누어 추출하고 페이지 순서대로 합치기"""
+        workers = min(self.extract_workers, page_count)
+        chunk_size = max(1, -(-page_count // (workers * self.CHUNKS_PER_WORKER)))
+        ranges = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+        
+        executor = self._get_executor()
+        try:
+            futures = [executor.submit(_extract_page_range, file_path, start, end) for start, end in ranges]
+            # 제출 순서대로 결과를 모으므로 페이지 순서가 유지됨
+            return [result for future in futures for result in future.result()]
+        except BrokenProcessPool:
+            # 작업자가 비정상 종료된 풀은 버리고 다음 파일에서 새로 만듦
+            self._discard_executor(executor)
+            raise
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.extract_workers,
+                    mp_context=multiprocessing.get_context(self.START_METHOD)
+                )
+            return self._executor
+    
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+    
+    def _record_timings(self, file_path: str, results: List[PageResult]) -> None:
+        """페이지별 추출 시간 기록 및 요약 로그"""
+        self.last_page_timings = [elapsed for _, _, elapsed, _ in results]
+        if not results:
+            return
+        for elapsed in self.last_page_timings:
+            PDF_PAGE_EXTRACT_SECONDS.observe(elapsed)
+        slowest = sorted(results, key=lambda result: result[2], reverse=True)[:3]
+        logging.info(
+            f"PDF 텍스트 추출: {len(results)}페이지, 페이지 합계 {sum(self.last_page_timings):.2f}초, "
+            f"가장 느린 페이지 {', '.join(f'{i+1}({elapsed:.2f}초)' for i, _, elapsed, _ in slowest)} ({file_path})"
+        )
+        for i, _, elapsed, _ in results:
+            logging.debug(f"PDF 페이지 {i+1} 추출 시간: {elapsed:.3f}초")
     
     def _read_markdown(self, file_path: str, metadata: Dict) -> Tuple[str, Dict]:
         """Markdown 파일 읽기"""
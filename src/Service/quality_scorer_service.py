@@ -0,0 +1,199 @@
+"""
+카드 품질 평가 서비스 구현 (여러 카드를 한 번의 LLM 호출로 평가)
+"""
+import re
+import json
+import asyncio
+import logging
+from typing import List, Dict, Optional
+
+from src.Entity.flashcard import Flashcard
+from src.IService.quality_scorer_interface import IQualityScorerService
+from src.IService.llm_service_interface import ILLMService
+from src.Config.llm_config import LLMConfig
+from src.Utils.text_processor import TextProcessor
+from src.Utils.metrics import llm_purpose
+
+
+class QualityScorerService(IQualityScorerService):
+    """배치 품질 평가 서비스
+
+    카드들을 토큰 예산 안에서 묶어 한 번에 평가하고, 응답에서 점수를 찾지 못한
+    카드만 기존 카드별 평가(Flashcard.calculate_quality_score)로 다시 평가합니다.
+    """
+
+    SYSTEM_PROMPT = "당신은 교육 콘텐츠 품질 평가 전문가입니다."
+
+    # "1: 8", "[2] 7", "[3]: 9", "4번 - 9", "카드 5 = 6.5" 같은 줄 형식 (구분 기호가 없으면 공백으로 구분)
+    SCORE_LINE_PATTERN = re.compile(
+        r'^\s*(?:카드|card)?\s*[\[#(]?\s*(\d+)\s*[\])]?\s*(?:번)?(?:\s*[:.)=\-]\s*|\s+)(\d+(?:\.\d+)?)',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+    def __init__(self, llm_service: ILLMService, config: LLMConfig):
+        self.llm_service = llm_service
+        self.config = config
+
+    def score_cards(self, cards: List[Flashcard]) -> List[float]:
+        """카드 목록의 품질 점수 계산"""
+        with llm_purpose('scoring'):
+            scores: List[Optional[float]] = [None] * len(cards)
+
+            for batch in self._make_batches(cards):
+                batch_cards = [cards[i] for i in batch]
+                try:
+                    response = self.llm_service.call_api_with_retry(self._build_batch_messages(batch_cards))
+                    parsed = self.parse_batch_scores(response, len(batch_cards))
+                except Exception as e:
+                    logging.warning(f"배치 품질 평가 실패, 카드별 평가로 전환: {e}")
+                    parsed = [None] * len(batch_cards)
+
+                for i, score in zip(batch, parsed):
+                    scores[i] = score
+
+            # 점수를 찾지 못한 카드만 개별 평가
+            return [
+                score if score is not None else cards[i].calculate_quality_score(self.llm_service)
+                for i, score in enumerate(scores)
+            ]
+
+    async def ascore_cards(self, cards: List[Flashcard]) -> List[float]:
+        """카드 목록의 품질 점수 비동기 계산"""
+        with llm_purpose('scoring'):
+            batches = self._make_batches(cards)
+            results = await asyncio.gather(
+                *(self._ascore_batch([cards[i] for i in batch]) for batch in batches)
+            )
+
+            scores: List[Optional[float]] = [None] * len(cards)
+            for batch, parsed in zip(batches, results):
+                for i, score in zip(batch, parsed):
+                    scores[i] = score
+
+            # 점수를 찾지 못한 카드만 개별 평가
+            missing = [i for i, score in enumerate(scores) if score is None]
+            if missing:
+                logging.info(f"배치 응답에서 점수를 찾지 못한 카드 {len(missing)}개를 개별 평가합니다")
+                fallback = await asyncio.gather(
+                    *(cards[i].acalculate_quality_score(self.llm_service) for i in missing)
+                )
+                for i, score in zip(missing, fallback):
+                    scores[i] = score
+
+            return [score if score is not None else 0.5 for score in scores]
+
+    async def _ascore_batch(self, batch_cards: List[Flashcard]) -> List[Optional[float]]:
+        """한 배치를 한 번의 호출로 평가"""
+        try:
+            response = await self.llm_service.acall_api_with_retry(self._build_batch_messages(batch_cards))
+            return self.parse_batch_scores(response, len(batch_cards))
+        except Exception as e:
+            logging.warning(f"배치 품질 평가 실패, 카드별 평가로 전환: {e}")
+            return [None] * len(batch_cards)
+
+    def _make_batches(self, cards: List[Flashcard]) -> List[List[int]]:
+        """카드 수와 토큰 예산에 맞춰 카드 인덱스를 배치로 분할"""
+        if not self.config.quality_batch_enabled:
+            return []
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        max_cards = max(1, self.config.quality_batch_max_cards)
+
+        for i, card in enumerate(cards):
+            card_tokens = TextProcessor.estimate_tokens(self._format_card(len(current) + 1, card))
+
+            if current and (len(current) >= max_cards or
+                            current_tokens + card_tokens > self.config.quality_batch_max_tokens):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+
+            current.append(i)
+            current_tokens += card_tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    @staticmethod
+    def _format_card(number: int, card: Flashcard) -> str:
+        """배치 프롬프트 안의 카드 표기"""
+        return f"[{number}]\n질문: {card.question}\n답변: {card.answer}\n"
+
+    def _build_batch_messages(self, cards: List[Flashcard]) -> List[Dict]:
+        """배치 평가 요청 메시지"""
+        cards_text = "\n".join(self._format_card(i + 1, card) for i, card in enumerate(cards))
+
+        prompt = f"""
+다음 플래시카드 {len(cards)}개의 품질을 각각 0-10 점수로 평가해주세요.
+
+평가 기준:
+- 질문이 명확하고 구체적인가?
+- 답변이 질문에 정확히 대답하는가?
+- 답변이 의미있고 학습에 도움이 되는가?
+- 답변이 "모르겠다", "언급되지 않음" 같은 무의미한 내용인가?
+
+{cards_text}
+카드마다 한 줄씩 "번호: 점수" 형식으로만 답변하세요 (예: 1: 8).
+"""
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    @classmethod
+    def parse_batch_scores(cls, response: str, count: int) -> List[Optional[float]]:
+        """배치 응답에서 카드별 점수(0-1) 추출, 찾지 못한 카드는 None"""
+        scores: List[Optional[float]] = [None] * count
+
+        # JSON 형식 응답 ({"1": 8, ...} 또는 [8, 7, ...]) 우선 시도
+        json_scores = cls._parse_json_scores(response, count)
+        if json_scores is not None:
+            return json_scores
+
+        for match in cls.SCORE_LINE_PATTERN.finditer(response):
+            index = int(match.group(1)) - 1
+            value = float(match.group(2))
+            if 0 <= index < count and scores[index] is None and 0 <= value <= 10:
+                scores[index] = value / 10.0
+
+        return scores
+
+    @staticmethod
+    def _parse_json_scores(response: str, count: int) -> Optional[List[Optional[float]]]:
+        """JSON 형식 점수 파싱 (코드 블록 표시를 뺀 응답 전체가 JSON이 아니면 None)"""
+        text = re.sub(r'^```[\w-]*\s*|\s*```$', '', response.strip())
+        if not text.startswith(('{', '[')):
+            return None
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+
+        if isinstance(data, list):
+            if len(data) != count:
+                return None
+            items = {i + 1: value for i, value in enumerate(data)}
+        elif isinstance(data, dict):
+            items = {}
+            for key, value in data.items():
+                digits = re.search(r'\d+', str(key))
+                if digits:
+                    items[int(digits.group())] = value
+        else:
+            return None
+
+        scores: List[Optional[float]] = [None] * count
+        for number, value in items.items():
+            if not 1 <= number <= count:
+                continue
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= value <= 10:
+                scores[number - 1] = value / 10.0
+        return scores
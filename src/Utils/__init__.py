@@ -2,5 +2,43 @@
 유틸리티 모듈
 """
 from .text_processor import TextProcessor
+from .llm_cache import LLMResponseCache
+from .http_pool import PooledHTTPSession
+from .card_filter import CardHeuristicFilter, HeuristicResult
+from .dedup_index import NearDuplicateIndex
+from .rate_limiter import TokenBucket, AdaptiveConcurrencyLimiter, ProviderRateLimiter
+from .card_stream_parser import IncrementalCardParser
+from .text_extract_cache import ExtractedTextCache
+from .job_journal import JobJournal
+from .corpus_manifest import CorpusManifest, ManifestDiff
+from .anki_package import AnkiPackageWriter
+from .run_stats import RunStatistics, ProgressReporter
+from .metrics import MetricsRegistry, MetricsExporter
+from .section_packer import SectionPacker
+from .endpoint_pool import CircuitBreaker, LLMEndpoint, EndpointPool
 
-__all__ = ['TextProcessor'] 
\ No newline at end of file
+__all__ = [
+    'TextProcessor',
+    'LLMResponseCache',
+    'PooledHTTPSession',
+    'CardHeuristicFilter',
+    'HeuristicResult',
+    'NearDuplicateIndex',
+    'TokenBucket',
+    'AdaptiveConcurrencyLimiter',
+    'ProviderRateLimiter',
+    'IncrementalCardParser',
+    'ExtractedTextCache',
+    'JobJournal',
+    'CorpusManifest',
+    'ManifestDiff',
+    'AnkiPackageWriter',
+    'RunStatistics',
+    'ProgressReporter',
+    'MetricsRegistry',
+    'MetricsExporter',
+    'SectionPacker',
+    'CircuitBreaker',
+    'LLMEndpoint',
+    'EndpointPool'
+]
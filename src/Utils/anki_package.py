@@ -0,0 +1,306 @@
+"""
+Anki 패키지(.apkg) 작성기 (표준 라이브러리 sqlite3/zipfile만 사용)
+"""
+import os
+import html
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import logging
+import zipfile
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from src.Entity.flashcard import Flashcard
+
+
+# Anki 2.1 컬렉션 스키마 (버전 11)
+COLLECTION_SCHEMA = """
+CREATE TABLE col (
+    id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+    ver integer not null, dty integer not null, usn integer not null, ls integer not null,
+    conf text not null, models text not null, decks text not null, dconf text not null, tags text not null
+);
+CREATE TABLE notes (
+    id integer primary key, guid text not null, mid integer not null, mod integer not null,
+    usn integer not null, tags text not null, flds text not null, sfld integer not null,
+    csum integer not null, flags integer not null, data text not null
+);
+CREATE TABLE cards (
+    id integer primary key, nid integer not null, did integer not null, ord integer not null,
+    mod integer not null, usn integer not null, type integer not null, queue integer not null,
+    due integer not null, ivl integer not null, factor integer not null, reps integer not null,
+    lapses integer not null, left integer not null, odue integer not null, odid integer not null,
+    flags integer not null, data text not null
+);
+CREATE TABLE revlog (
+    id integer primary key, cid integer not null, usn integer not null, ivl integer not null,
+    lastIvl integer not null, factor integer not null, time integer not null, type integer not null
+);
+CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+"""
+
+# 대량 삽입 후에 만드는 인덱스
+COLLECTION_INDEXES = """
+CREATE INDEX ix_notes_usn ON notes (usn);
+CREATE INDEX ix_cards_usn ON cards (usn);
+CREATE INDEX ix_revlog_usn ON revlog (usn);
+CREATE INDEX ix_cards_nid ON cards (nid);
+CREATE INDEX ix_cards_sched ON cards (did, queue, due);
+CREATE INDEX ix_revlog_cid ON revlog (cid);
+CREATE INDEX ix_notes_csum ON notes (csum);
+"""
+
+# Anki GUID에 쓰는 base91 문자
+GUID_ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    "!#$%&()*+,-./:;<=>?@[]^_`{|}~"
+)
+
+
+def _stable_int(text: str, bits: int) -> int:
+    """문자열에서 결정적으로 만든 양의 정수"""
+    digest = hashlib.sha256(text.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') >> (64 - bits) or 1
+
+
+def note_guid(card: Flashcard) -> str:
+    """질문 내용에서 만든 노트 GUID (다시 가져오면 같은 노트를 갱신)"""
+    return _base91(_question_key(card))
+
+
+def _question_key(card: Flashcard) -> int:
+    """노트 GUID와 ID의 기준이 되는 질문 해시 (64비트)"""
+    return _stable_int("flashcard:" + card.question.strip(), 64)
+
+
+def _base91(value: int) -> str:
+    """정수를 Anki GUID 문자열로 변환"""
+    chars = []
+    while value:
+        value, remainder = divmod(value, len(GUID_ALPHABET))
+        chars.append(GUID_ALPHABET[remainder])
+    return ''.join(reversed(chars))
+
+
+class AnkiPackageWriter:
+    """카드를 Anki 컬렉션 SQLite 파일에 배치로 추가하고 close()에서 .apkg로 압축하는 writer
+
+    모든 삽입은 하나의 트랜잭션에서 BATCH_SIZE개씩 executemany로 수행하고 인덱스는 마지막에 만듭니다.
+    메모리에는 현재 배치만 두므로 덱 크기와 관계없이 메모리가 일정합니다.
+    노트 GUID와 ID는 질문 내용에서 결정적으로 만들어 같은 질문은 다시 가져와도 중복되지 않으며,
+    한 패키지 안에서 같은 질문이 다시 나오면 건너뜁니다.
+    """
+
+    BATCH_SIZE = 1000
+
+    MODEL_NAME = "Anki Flashcard Generator Basic"
+
+    def __init__(self, output_path: str, deck_name: str = "Flashcards"):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.deck_name = deck_name
+        self.count = 0
+        self.duplicates = 0
+
+        self._now = int(time.time())
+        self._model_id = _stable_int("model:" + self.MODEL_NAME, 40)
+        self._deck_id = _stable_int("deck:" + deck_name, 40)
+        self._batch: List[Tuple] = []
+        self._closed = False
+
+        # 컬렉션은 시스템 임시 디렉터리에 만들어 비정상 종료 시에도 출력 폴더에 작업 파일을 남기지 않음
+        self._tmp_dir = tempfile.mkdtemp(prefix='apkg_')
+        self._db_path = os.path.join(self._tmp_dir, 'collection.anki2')
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.executescript(COLLECTION_SCHEMA)
+        self._conn.execute(
+            "INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, '{}')",
+            (self._now, self._now * 1000, self._now * 1000,
+             json.dumps(self._collection_conf()), json.dumps(self._models()),
+             json.dumps(self._decks()), json.dumps(self._deck_conf()))
+        )
+
+    def write(self, card: Flashcard) -> None:
+        """카드 하나를 배치에 추가 (배치가 차면 데이터베이스에 삽입)"""
+        self._batch.append(self._note_row(card))
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._insert_batch()
+
+    def write_cards(self, cards: Iterable[Flashcard]) -> int:
+        """카드를 배치에 추가하고 추가한 카드 수 반환"""
+        written = 0
+        for card in cards:
+            self.write(card)
+            written += 1
+        return written
+
+    def flush(self) -> None:
+        """남은 배치를 데이터베이스에 삽입 (패키지는 close()에서 완성)"""
+        self._insert_batch()
+
+    def close(self) -> None:
+        """남은 배치를 삽입하고 인덱스를 만든 뒤 .apkg로 압축"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._insert_batch()
+            self._conn.executescript(COLLECTION_INDEXES)
+            self._conn.commit()
+            self._conn.close()
+
+            # 패키지는 출력 폴더에서 압축한 뒤 원자적으로 교체 (임시 디렉터리와 파일 시스템이 달라도 동작)
+            fd, tmp_package = tempfile.mkstemp(prefix=f".{self.output_path.name}.", suffix='.tmp',
+                                               dir=str(self.output_path.parent))
+            try:
+                with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as package:
+                    package.write(self._db_path, 'collection.anki2')
+                    package.writestr('media', '{}')
+                os.replace(tmp_package, self.output_path)
+            except BaseException:
+                if os.path.exists(tmp_package):
+                    os.remove(tmp_package)
+                raise
+        finally:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+        if self.duplicates:
+            logging.info(f"Anki 패키지에서 중복 질문 {self.duplicates}개 건너뜀")
+        logging.info(f"Anki 패키지 저장됨: {self.output_path} ({self.count}개 카드)")
+
+    def __enter__(self) -> 'AnkiPackageWriter':
+        return self
+
+    def abort(self) -> None:
+        """패키지를 만들지 않고 임시 컬렉션 삭제 (실패한 내보내기는 출력 파일을 만들지 않음)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._conn.close()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _note_row(self, card: Flashcard) -> Tuple:
+        """노트 한 행 (ID, GUID, 필드, 정렬 필드, 체크섬, 태그)"""
+        key = _question_key(card)
+        guid, note_id = _base91(key), key >> 16
+        sort_field = card.question.strip()
+        fields = '\x1f'.join(self._to_html(text) for text in (card.question, card.answer))
+        checksum = int(hashlib.sha1(sort_field.encode('utf-8')).hexdigest()[:8], 16)
+        tags = ' '.join(tag.replace(' ', '_') for tag in card.tags if tag.strip())
+        return note_id, guid, fields, sort_field, checksum, f" {tags} " if tags else ""
+
+    def _insert_batch(self) -> None:
+        """현재 배치의 노트와 카드를 한 번에 삽입 (같은 ID의 노트는 건너뜀)
+
+        이미 있는 ID는 배치마다 한 번의 조회로 걸러 내므로 새 카드의 due(새 카드 순서)에 빈 번호가 생기지 않습니다.
+        """
+        if not self._batch:
+            return
+        seen = {
+            row[0] for row in self._conn.execute(
+                "SELECT id FROM notes WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps([note_id for note_id, *_rest in self._batch]),)
+            )
+        }
+        rows = []
+        for row in self._batch:
+            if row[0] not in seen:
+                seen.add(row[0])
+                rows.append(row)
+
+        self._conn.executemany(
+            "INSERT INTO notes VALUES (?, ?, ?, ?, -1, ?, ?, ?, ?, 0, '')",
+            [
+                (note_id, guid, self._model_id, self._now, tags, fields, sort_field, checksum)
+                for note_id, guid, fields, sort_field, checksum, tags in rows
+            ]
+        )
+        self._conn.executemany(
+            "INSERT INTO cards VALUES (?, ?, ?, 0, ?, -1, 0, 0, ?, 0, 0, 0, 0, 0, 0, 0, 0, '')",
+            [
+                (note_id, note_id, self._deck_id, self._now, self.count + position + 1)
+                for position, (note_id, *_rest) in enumerate(rows)
+            ]
+        )
+        self.duplicates += len(self._batch) - len(rows)
+        self.count += len(rows)
+        self._batch = []
+
+    @staticmethod
+    def _to_html(text: str) -> str:
+        """Anki 필드는 HTML이므로 특수 문자를 이스케이프하고 줄바꿈을 <br>로 변환"""
+        return html.escape(text).replace('\n', '<br>')
+
+    def _collection_conf(self) -> dict:
+        return {
+            'activeDecks': [self._deck_id], 'curDeck': self._deck_id, 'newSpread': 0, 'collapseTime': 1200,
+            'timeLim': 0, 'estTimes': True, 'dueCounts': True, 'curModel': str(self._model_id),
+            'nextPos': 1, 'sortType': 'noteFld', 'sortBackwards': False, 'addToCur': True
+        }
+
+    def _models(self) -> dict:
+        field_defaults = {'sticky': False, 'rtl': False, 'font': 'Arial', 'size': 20, 'media': []}
+        return {
+            str(self._model_id): {
+                'id': self._model_id,
+                'name': self.MODEL_NAME,
+                'type': 0,
+                'mod': self._now,
+                'usn': -1,
+                'sortf': 0,
+                'did': self._deck_id,
+                'tmpls': [{
+                    'name': 'Card 1', 'ord': 0, 'did': None, 'bqfmt': '', 'bafmt': '',
+                    'qfmt': '{{Front}}',
+                    'afmt': '{{FrontSide}}\n\n<hr id=answer>\n\n{{Back}}'
+                }],
+                'flds': [
+                    dict(field_defaults, name='Front', ord=0),
+                    dict(field_defaults, name='Back', ord=1)
+                ],
+                'css': '.card {\n font-family: arial;\n font-size: 20px;\n text-align: center;\n'
+                       ' color: black;\n background-color: white;\n}\n',
+                'latexPre': '\\documentclass[12pt]{article}\n\\special{papersize=3in,5in}\n'
+                            '\\usepackage[utf8]{inputenc}\n\\usepackage{amssymb,amsmath}\n'
+                            '\\pagestyle{empty}\n\\setlength{\\parindent}{0in}\n\\begin{document}\n',
+                'latexPost': '\\end{document}',
+                'tags': [],
+                'vers': [],
+                'req': [[0, 'all', [0]]]
+            }
+        }
+
+    def _decks(self) -> dict:
+        def deck(deck_id: int, name: str) -> dict:
+            return {
+                'id': deck_id, 'name': name, 'mod': self._now, 'usn': -1, 'desc': '', 'dyn': 0,
+                'conf': 1, 'collapsed': False, 'extendNew': 10, 'extendRev': 50,
+                'newToday': [0, 0], 'revToday': [0, 0], 'lrnToday': [0, 0], 'timeToday': [0, 0]
+            }
+        return {'1': deck(1, 'Default'), str(self._deck_id): deck(self._deck_id, self.deck_name)}
+
+    @staticmethod
+    def _deck_conf() -> dict:
+        return {
+            '1': {
+                'id': 1, 'name': 'Default', 'mod': 0, 'usn': 0, 'maxTaken': 60, 'autoplay': True,
+                'timer': 0, 'replayq': True, 'dyn': False,
+                'new': {'delays': [1, 10], 'ints': [1, 4, 7], 'initialFactor': 2500, 'separate': True,
+                        'order': 1, 'perDay': 20, 'bury': True},
+                'lapse': {'delays': [10], 'mult': 0, 'minInt': 1, 'leechFails': 8, 'leechAction': 0},
+                'rev': {'perDay': 100, 'ease4': 1.3, 'fuzz': 0.05, 'minSpace': 1, 'ivlFct': 1,
+                        'maxIvl': 36500, 'bury': True}
+            }
+        }
@@ -0,0 +1,169 @@
+"""
+LLM 품질 평가 전 단계의 휴리스틱 카드 필터
+"""
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Set, Optional
+
+from src.Entity.flashcard import Flashcard
+
+
+@dataclass
+class HeuristicResult:
+    """휴리스틱 평가 결과
+
+    verdict: 'reject'(명백한 실패), 'accept'(명백히 좋은 카드), 'uncertain'(LLM 평가 필요)
+    """
+    verdict: str
+    rule: str = ""
+    source_overlap: float = 0.0
+
+
+class CardHeuristicFilter:
+    """순수 파이썬 규칙으로 명백한 불량 카드는 제외하고 명백히 좋은 카드는 통과시키는 필터"""
+
+    # "모르겠다", "언급되지 않음" 같은 무의미한 답변
+    NON_ANSWER_PATTERN = re.compile(
+        r'모르겠|알 수 없|알수 없|언급되(?:지 않|어 있지 않)|언급(?:이 )?없|나와\s?있지 않|나와 있지 않|'
+        r'정의(?:가|되어)? (?:없|나와있지 않)|명시되(?:지 않|어 있지 않)|텍스트에(?:서)? (?:찾을 수 없|없)|'
+        r'정보가 없|제공되지 않|\bnot (?:mentioned|specified|provided|stated)\b|'
+        # 영어 단어는 답변 전체일 때만 (예: 나트륨 기호 "Na", "... remains unknown until ..."은 정상 답변)
+        r"^\s*(?:n/a|unknown|i don'?t know)\s*[.!]?\s*$",
+        re.IGNORECASE
+    )
+
+    # 한 단어로 된 의미 없는 답변 (참/거짓 카드의 true/false, 한 글자 답변(숫자, 한 음절)은 정상일 수 있어 제외하지 않음)
+    TRIVIAL_ANSWERS = {'예', '네', '아니오', '아니요', '없음', '있음', '모름', '해당없음', '-', 'yes', 'no', 'none'}
+
+    # 질문으로 볼 수 있는 표현 (의문사, 의문형 어미, 명령형 지시, 빈칸)
+    QUESTION_PATTERN = re.compile(
+        r'\?|？|_{2,}|\(\s*\)|무엇|무슨|누구|누가|언제|어디|왜|어떻게|어떤|어느|몇|얼마|'
+        r'(?:인가|는가|은가|니까|나요|까요|을까|ㄹ까|는지|은지|인지)\s*[.。]?\s*$|'
+        r'(?:설명|서술|정의|비교|나열|구분)(?:하시오|하세요|하라|해 ?보세요|해주세요)|'
+        r'\b(?:what|who|whom|whose|when|where|why|how|which|define|explain|describe|name|list)\b',
+        re.IGNORECASE
+    )
+
+    WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self, min_answer_tokens: int = 1, min_source_overlap: float = 0.2,
+                 restate_threshold: float = 0.8, auto_accept: bool = True,
+                 accept_min_overlap: float = 0.8, accept_min_answer_tokens: int = 2):
+        self.min_answer_tokens = min_answer_tokens
+        self.min_source_overlap = min_source_overlap
+        self.restate_threshold = restate_threshold
+        self.auto_accept = auto_accept
+        self.accept_min_overlap = accept_min_overlap
+        self.accept_min_answer_tokens = accept_min_answer_tokens
+
+        self._lock = threading.Lock()
+        self.rule_counts: Counter = Counter()
+        self.verdict_counts: Counter = Counter()
+
+    @classmethod
+    def from_config(cls, config) -> 'CardHeuristicFilter':
+        """LLMConfig 설정으로 필터 생성"""
+        return cls(
+            min_answer_tokens=config.heuristic_min_answer_tokens,
+            min_source_overlap=config.heuristic_min_source_overlap,
+            restate_threshold=config.heuristic_restate_threshold,
+            auto_accept=config.heuristic_auto_accept,
+            accept_min_overlap=config.heuristic_accept_min_overlap,
+            accept_min_answer_tokens=config.heuristic_accept_min_answer_tokens
+        )
+
+    def evaluate_cards(self, cards: List[Flashcard], source_text: str = "") -> List[HeuristicResult]:
+        """카드 목록 평가 (원문 문자 바이그램은 한 번만 계산)"""
+        source_bigrams = self._char_bigrams(source_text) if source_text else None
+        return [self._evaluate(card, source_bigrams) for card in cards]
+
+    def evaluate(self, card: Flashcard, source_text: str = "") -> HeuristicResult:
+        """카드 한 장 평가"""
+        source_bigrams = self._char_bigrams(source_text) if source_text else None
+        return self._evaluate(card, source_bigrams)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """규칙별 제외 횟수와 판정별 횟수"""
+        with self._lock:
+            return {
+                'verdicts': dict(self.verdict_counts),
+                'rejections_by_rule': dict(self.rule_counts)
+            }
+
+    def _evaluate(self, card: Flashcard, source_bigrams: Optional[Set[str]]) -> HeuristicResult:
+        result = self._classify(card, source_bigrams)
+        with self._lock:
+            self.verdict_counts[result.verdict] += 1
+            if result.verdict == 'reject':
+                self.rule_counts[result.rule] += 1
+        return result
+
+    def _classify(self, card: Flashcard, source_bigrams: Optional[Set[str]]) -> HeuristicResult:
+        question = card.question.strip()
+        answer = card.answer.strip()
+        answer_tokens = self._tokens(answer)
+
+        if not answer_tokens:
+            return HeuristicResult('reject', 'empty_answer')
+
+        if len(answer_tokens) < self.min_answer_tokens or (
+                len(answer_tokens) == 1 and answer_tokens[0] in self.TRIVIAL_ANSWERS):
+            return HeuristicResult('reject', 'trivial_answer')
+
+        if self.NON_ANSWER_PATTERN.search(answer):
+            return HeuristicResult('reject', 'non_answer')
+
+        question_tokens = self._tokens(question)
+        if not question_tokens or not self.QUESTION_PATTERN.search(question):
+            return HeuristicResult('reject', 'no_question')
+
+        if self._is_restatement(question, answer, question_tokens, answer_tokens):
+            return HeuristicResult('reject', 'restated_answer')
+
+        overlap = 0.0
+        if source_bigrams is not None:
+            overlap = self._source_overlap(answer, source_bigrams)
+            if overlap < self.min_source_overlap:
+                return HeuristicResult('reject', 'no_source_overlap', overlap)
+
+            if (self.auto_accept and overlap >= self.accept_min_overlap
+                    and len(answer_tokens) >= self.accept_min_answer_tokens):
+                return HeuristicResult('accept', 'grounded_answer', overlap)
+
+        return HeuristicResult('uncertain', '', overlap)
+
+    def _is_restatement(self, question: str, answer: str, question_tokens: List[str], answer_tokens: List[str]) -> bool:
+        """답변이 질문을 그대로 반복하는지 확인"""
+        if self._normalize(answer) == self._normalize(question):
+            return True
+        answer_set = set(answer_tokens)
+        question_set = set(question_tokens)
+        # 답변의 거의 모든 단어가 질문에 이미 있으면 새로운 정보가 없음
+        return len(answer_set & question_set) / len(answer_set) >= self.restate_threshold
+
+    def _source_overlap(self, answer: str, source_bigrams: Set[str]) -> float:
+        """답변의 문자 바이그램 중 원문에 등장하는 비율 (조사가 붙는 한국어에도 동작)"""
+        answer_bigrams = self._char_bigrams(answer)
+        if not answer_bigrams:
+            return 0.0
+        return len(answer_bigrams & source_bigrams) / len(answer_bigrams)
+
+    @classmethod
+    def _tokens(cls, text: str) -> List[str]:
+        return cls.WORD_PATTERN.findall(text.lower())
+
+    @classmethod
+    def _normalize(cls, text: str) -> str:
+        return ''.join(cls._tokens(text))
+
+    @classmethod
+    def _char_bigrams(cls, text: str) -> Set[str]:
+        bigrams: Set[str] = set()
+        for token in cls._tokens(text):
+            if len(token) == 1:
+                bigrams.add(token)
+            for i in range(len(token) - 1):
+                bigrams.add(token[i:i + 2])
+        return bigrams
@@ -0,0 +1,55 @@
+"""
+스트리밍 LLM 응답에서 카드 블록을 점진적으로 분리하는 파서
+"""
+import re
+from typing import List
+
+
+class IncrementalCardParser:
+    """'---' 구분자로 끝난 카드 블록을 도착하는 즉시 돌려주는 파서
+
+    결과를 모두 이어 붙이면 전체 응답에 re.split(r'---+', response)를 적용한 것과 같습니다.
+    청크 끝에 걸친 구분자('--' + '-')나 더 길어질 수 있는 구분자('---' + '-')는
+    다음 청크가 도착할 때까지 확정하지 않습니다.
+    """
+
+    DELIMITER = re.compile(r'---+')
+    # 구분자의 최소 길이 (버퍼 끝에 걸친 미완성 구분자는 이보다 짧음)
+    DELIMITER_LENGTH = 3
+
+    def __init__(self):
+        self._buffer = ""
+        # 이미 확인한 위치부터 다시 찾아 긴 블록이 여러 청크에 걸쳐도 버퍼를 처음부터 다시 훑지 않음
+        self._scan_from = 0
+
+    def feed(self, chunk: str) -> List[str]:
+        """청크를 추가하고 완성된 (비어 있지 않은) 블록 목록 반환"""
+        self._buffer += chunk
+        blocks: List[str] = []
+        consumed = 0
+        pending = None
+
+        for match in self.DELIMITER.finditer(self._buffer, self._scan_from):
+            # 버퍼 끝에 닿은 구분자는 다음 청크에서 더 길어질 수 있음
+            if match.end() == len(self._buffer):
+                pending = match.start()
+                break
+            block = self._buffer[consumed:match.start()]
+            if block.strip():
+                blocks.append(block)
+            consumed = match.end()
+
+        self._buffer = self._buffer[consumed:]
+        # 끝에 걸친 '-', '--'는 다음 청크와 이어 붙여 다시 확인
+        if pending is not None:
+            self._scan_from = pending - consumed
+        else:
+            self._scan_from = max(0, len(self._buffer) - (self.DELIMITER_LENGTH - 1))
+        return blocks
+
+    def close(self) -> List[str]:
+        """스트림 종료 후 남은 블록 반환"""
+        remaining = self.DELIMITER.split(self._buffer)
+        self._buffer = ""
+        self._scan_from = 0
+        return [block for block in remaining if block.strip()]
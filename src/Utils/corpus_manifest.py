@@ -0,0 +1,178 @@
+"""
+증분 처리를 위한 원본 문서 매니페스트 (SQLite 기반)
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+from src.Entity.flashcard import Flashcard
+from src.Utils.text_extract_cache import file_content_hash
+
+
+# (크기, 수정 시각(ns), 내용 해시)
+FileState = Tuple[int, int, str]
+
+
+@dataclass
+class ManifestDiff:
+    """매니페스트와 현재 원본 폴더의 차이"""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    states: Dict[str, FileState] = field(default_factory=dict)  # 추가/수정된 파일의 현재 상태
+
+    @property
+    def changed(self) -> List[str]:
+        """다시 처리해야 하는 파일 (추가 + 수정)"""
+        return self.added + self.modified
+
+
+class CorpusManifest:
+    """원본 파일별 내용 해시와 그 파일에서 생성된 카드를 기록하는 매니페스트
+
+    크기와 수정 시각이 기록과 같은 파일은 해시하지 않고 변경 없음으로 간주합니다.
+    카드는 파일 단위로 교체/삭제되므로 수정된 파일의 예전 카드와 삭제된 파일의 카드는 덱에서 빠집니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                card_count INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS cards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                path TEXT NOT NULL,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                notes TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_path ON cards(path)")
+        self._conn.commit()
+
+    @staticmethod
+    def file_key(file_path: str) -> str:
+        """매니페스트에서 파일을 식별하는 키 (절대 경로)"""
+        return str(Path(file_path).resolve())
+
+    def scan(self, file_paths: Iterable[str]) -> ManifestDiff:
+        """현재 파일 목록과 매니페스트를 비교 (크기/수정 시각이 바뀐 파일만 해시)"""
+        with self._lock:
+            known = {
+                path: (size, mtime_ns, content_hash)
+                for path, size, mtime_ns, content_hash in self._conn.execute(
+                    "SELECT path, size, mtime_ns, content_hash FROM documents"
+                )
+            }
+
+        diff = ManifestDiff()
+        touched = []
+        for file_path in file_paths:
+            key = self.file_key(file_path)
+            stat = os.stat(key)
+            previous = known.pop(key, None)
+
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                diff.unchanged.append(key)
+                continue
+
+            content_hash = file_content_hash(key)
+            if previous and previous[2] == content_hash:
+                # 내용은 같고 수정 시각만 바뀐 파일
+                diff.unchanged.append(key)
+                touched.append((stat.st_size, stat.st_mtime_ns, key))
+                continue
+
+            diff.states[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+            (diff.modified if previous else diff.added).append(key)
+
+        diff.deleted = sorted(known)
+
+        if touched:
+            with self._lock:
+                self._conn.executemany("UPDATE documents SET size = ?, mtime_ns = ? WHERE path = ?", touched)
+                self._conn.commit()
+        return diff
+
+    def replace_cards(self, file_key: str, state: FileState, cards: List[Flashcard]) -> None:
+        """파일의 카드를 새 결과로 교체하고 현재 상태 기록 (한 트랜잭션)"""
+        size, mtime_ns, content_hash = state
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cards WHERE path = ?", (file_key,))
+            self._conn.executemany(
+                "INSERT INTO cards (path, question, answer, tags, notes) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (file_key, card.question, card.answer, json.dumps(card.tags, ensure_ascii=False), card.notes)
+                    for card in cards
+                ]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (path, size, mtime_ns, content_hash, card_count, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (file_key, size, mtime_ns, content_hash, len(cards), time.time())
+            )
+
+    def retire(self, file_keys: Iterable[str]) -> int:
+        """삭제된 파일과 그 카드를 매니페스트에서 제거하고 제거된 카드 수 반환"""
+        keys = [(key,) for key in file_keys]
+        if not keys:
+            return 0
+        with self._lock, self._conn:
+            removed = self._conn.executemany("DELETE FROM cards WHERE path = ?", keys).rowcount
+            self._conn.executemany("DELETE FROM documents WHERE path = ?", keys)
+        return removed
+
+    def iter_cards(self, file_keys: Optional[Iterable[str]] = None) -> Iterator[Flashcard]:
+        """기록된 카드를 파일 경로, 생성 순서대로 하나씩 반환 (file_keys가 주어지면 해당 파일만)"""
+        if file_keys is None:
+            query, params_list = "SELECT question, answer, tags, notes FROM cards ORDER BY path, id", [()]
+        else:
+            query = "SELECT question, answer, tags, notes FROM cards WHERE path = ? ORDER BY id"
+            params_list = [(key,) for key in sorted(file_keys)]
+
+        for params in params_list:
+            # 전체를 한 번에 읽지 않도록 별도 커서로 순회
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(query, params)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(500)
+                if not rows:
+                    break
+                for question, answer, tags, notes in rows:
+                    yield Flashcard(question=question, answer=answer, tags=json.loads(tags), notes=notes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """매니페스트 통계"""
+        with self._lock:
+            documents, cards = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(card_count), 0) FROM documents"
+            ).fetchone()
+        return {'documents': documents, 'cards': cards}
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
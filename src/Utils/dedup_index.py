@@ -0,0 +1,151 @@
+"""
+MinHash/LSH 기반 유사 중복 카드 인덱스
+"""
+import re
+import random
+import hashlib
+import threading
+import zlib
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class NearDuplicateIndex:
+    """정규화된 문자 n-gram(shingle)의 MinHash 시그니처를 LSH 밴드로 색인하는 스레드 안전 인덱스
+
+    밴드 버킷에서 후보만 찾아 비교하므로 카드 수가 늘어도 조회 비용이 거의 일정합니다.
+    시그니처는 카드당 num_perm개의 32비트 정수(array)로 저장해 메모리를 줄입니다.
+    """
+
+    _MERSENNE_PRIME = (1 << 61) - 1
+    _MAX_HASH = (1 << 32) - 1
+    _WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 32, bands: int = 8,
+                 shingle_size: int = 3, seed: int = 1):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._perms: List[Tuple[int, int]] = [
+            (rng.randrange(1, self._MERSENNE_PRIME), rng.randrange(0, self._MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._lock = threading.RLock()
+        self._next_id = 0
+        self._signatures: Dict[int, array] = {}
+        self._band_keys: Dict[int, List[int]] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._exact: Dict[bytes, int] = {}
+        self._exact_keys: Dict[int, bytes] = {}
+
+    @classmethod
+    def from_config(cls, config) -> 'NearDuplicateIndex':
+        """LLMConfig 설정으로 인덱스 생성"""
+        return cls(
+            threshold=config.dedup_similarity_threshold,
+            num_perm=config.dedup_num_perm,
+            bands=config.dedup_bands,
+            shingle_size=config.dedup_shingle_size
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._signatures)
+
+    def add_if_unique(self, text: str) -> Optional[int]:
+        """유사한 항목이 없으면 원자적으로 추가하고 ID 반환, 중복이면 None"""
+        exact_key, signature, band_keys = self._prepare(text)
+
+        with self._lock:
+            if exact_key in self._exact or self._find_similar(signature, band_keys) is not None:
+                return None
+
+            item_id = self._next_id
+            self._next_id += 1
+            self._signatures[item_id] = signature
+            self._band_keys[item_id] = band_keys
+            self._exact[exact_key] = item_id
+            self._exact_keys[item_id] = exact_key
+            for band, key in enumerate(band_keys):
+                self._buckets[band].setdefault(key, []).append(item_id)
+            return item_id
+
+    def find_similar(self, text: str) -> Optional[int]:
+        """유사한 기존 항목의 ID (없으면 None)"""
+        exact_key, signature, band_keys = self._prepare(text)
+        with self._lock:
+            if exact_key in self._exact:
+                return self._exact[exact_key]
+            return self._find_similar(signature, band_keys)
+
+    def remove(self, item_id: int) -> None:
+        """항목 삭제 (예: 실패한 섹션에서 채택했던 카드 제거)"""
+        with self._lock:
+            if self._signatures.pop(item_id, None) is None:
+                return
+            for band, key in enumerate(self._band_keys.pop(item_id)):
+                bucket = self._buckets[band].get(key)
+                if bucket is not None:
+                    bucket.remove(item_id)
+                    if not bucket:
+                        del self._buckets[band][key]
+            del self._exact[self._exact_keys.pop(item_id)]
+
+    def similarity(self, first: str, second: str) -> float:
+        """두 텍스트의 추정 Jaccard 유사도"""
+        return self._estimate(self._signature(self._shingles(first)), self._signature(self._shingles(second)))
+
+    def _find_similar(self, signature: array, band_keys: List[int]) -> Optional[int]:
+        checked: Set[int] = set()
+        for band, key in enumerate(band_keys):
+            for item_id in self._buckets[band].get(key, ()):
+                if item_id in checked:
+                    continue
+                checked.add(item_id)
+                if self._estimate(signature, self._signatures[item_id]) >= self.threshold:
+                    return item_id
+        return None
+
+    def _prepare(self, text: str) -> Tuple[bytes, array, List[int]]:
+        """정확 일치 키, 시그니처, 밴드 키 계산 (잠금 밖에서 수행)"""
+        normalized = self._normalize(text)
+        exact_key = hashlib.md5(normalized.encode('utf-8')).digest()
+        signature = self._signature(self._shingles(normalized, normalized=True))
+        band_keys = [
+            hash(tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+        return exact_key, signature, band_keys
+
+    def _normalize(self, text: str) -> str:
+        return ' '.join(self._WORD_PATTERN.findall(text.lower()))
+
+    def _shingles(self, text: str, normalized: bool = False) -> Set[int]:
+        if not normalized:
+            text = self._normalize(text)
+        if len(text) <= self.shingle_size:
+            return {zlib.crc32(text.encode('utf-8'))}
+        return {
+            zlib.crc32(text[i:i + self.shingle_size].encode('utf-8'))
+            for i in range(len(text) - self.shingle_size + 1)
+        }
+
+    def _signature(self, shingles: Set[int]) -> array:
+        prime = self._MERSENNE_PRIME
+        values = list(shingles)
+        # 순열마다 최솟값을 구한 뒤 하위 32비트만 저장
+        return array('I', (
+            min([(a * value + b) % prime for value in values]) & self._MAX_HASH
+            for a, b in self._perms
+        ))
+
+    def _estimate(self, first: array, second: array) -> float:
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
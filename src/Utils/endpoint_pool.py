@@ -0,0 +1,192 @@
+"""
+여러 LLM 엔드포인트 사이의 부하 분산과 장애 차단(서킷 브레이커)
+"""
+import time
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SUPPORTED_PROVIDERS = ('openai', 'ollama', 'openrouter')
+STRATEGIES = ('least_outstanding', 'latency')
+
+
+def parse_endpoint_specs(spec: str) -> List[Tuple[str, str, str]]:
+    """LLM_ENDPOINTS 문자열을 (제공자, 기본 URL, 모델) 목록으로 변환
+
+    쉼표로 구분한 각 항목은 `제공자@URL#모델` 형식이며 URL과 모델은 생략할 수 있습니다
+    (생략하면 해당 제공자의 기본 설정 사용). 예: `ollama@http://10.0.0.2:11434#qwen2.5:7b`
+    """
+    endpoints = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        item, _, model = item.partition('#')
+        provider, _, base_url = item.partition('@')
+        endpoint = (provider.strip().lower(), base_url.strip().rstrip('/'), model.strip())
+        if endpoint[0] not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"지원되지 않는 LLM 제공자: {endpoint[0]} (LLM_ENDPOINTS 항목 '{item}')")
+        if endpoint[0] == 'openai' and endpoint[1]:
+            raise ValueError(f"openai 엔드포인트에는 URL을 지정할 수 없습니다 (LLM_ENDPOINTS 항목 '{item}')")
+        if endpoint in endpoints:
+            raise ValueError(f"중복된 LLM_ENDPOINTS 항목: '{item}'")
+        endpoints.append(endpoint)
+    return endpoints
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold번 이어지면 열리고(요청 차단), reset_seconds 뒤에
+    시험 요청 하나만 허용(반열림)하여 성공하면 닫히고 실패하면 다시 열리는 차단기"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._trial_in_flight = False
+
+    def available(self, now: float) -> bool:
+        """지금 요청을 보낼 수 있는지 (열린 지 reset_seconds가 지났으면 시험 요청 가능)"""
+        if self.state == self.CLOSED:
+            return True
+        if self._trial_in_flight:
+            return False
+        return self.state == self.HALF_OPEN or now - self.opened_at >= self.reset_seconds
+
+    def on_dispatch(self) -> None:
+        """요청을 보낼 때 호출 (열린 상태면 이 요청이 시험 요청이 됨)"""
+        if self.state != self.CLOSED:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = True
+
+    def on_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def on_cancel(self) -> None:
+        """결과 없이 취소된 요청 (시험 요청이었다면 다음 요청이 다시 시험)"""
+        self._trial_in_flight = False
+
+    def on_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = now
+        self._trial_in_flight = False
+
+
+class LLMEndpoint:
+    """풀에 속한 엔드포인트 하나 (client는 이 엔드포인트로 요청을 보내는 객체)"""
+
+    def __init__(self, name: str, provider: str, model: str, client: Any, base_url: str = '',
+                 breaker: Optional[CircuitBreaker] = None):
+        self.name = name
+        self.provider = provider
+        self.model = model
+        self.base_url = base_url
+        self.client = client
+        self.breaker = breaker or CircuitBreaker()
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency_ewma: Optional[float] = None
+
+
+class EndpointPool:
+    """요청마다 엔드포인트를 골라 주는 풀
+
+    - least_outstanding: 진행 중 요청이 가장 적은 엔드포인트 (같으면 돌아가며 선택)
+    - latency: 지연 시간 지수 이동 평균 × (진행 중 요청 + 1)이 가장 작은 엔드포인트
+      (아직 측정값이 없는 엔드포인트를 먼저 사용)
+    서킷이 열린 엔드포인트는 건너뛰고, 모두 열려 있으면 가장 먼저 열린 엔드포인트로 시험 요청을 보냅니다.
+    """
+
+    def __init__(self, endpoints: Sequence[LLMEndpoint], strategy: str = 'least_outstanding',
+                 latency_alpha: float = 0.3):
+        if not endpoints:
+            raise ValueError("엔드포인트가 하나 이상 필요합니다.")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"지원되지 않는 부하 분산 방식: {strategy} ({', '.join(STRATEGIES)})")
+        self.endpoints = list(endpoints)
+        self.strategy = strategy
+        self.latency_alpha = latency_alpha
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def acquire(self, exclude: Sequence[LLMEndpoint] = ()) -> LLMEndpoint:
+        """요청을 보낼 엔드포인트를 고르고 진행 중 요청 수 증가
+
+        exclude(이번 요청에서 이미 실패한 엔드포인트)는 다른 후보가 있을 때만 제외합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = [endpoint for endpoint in self.endpoints if endpoint.breaker.available(now)]
+            candidates = [endpoint for endpoint in available if endpoint not in exclude] or available
+            if not candidates:
+                candidates = [min(self.endpoints, key=lambda endpoint: endpoint.breaker.opened_at)]
+
+            # 같은 점수면 돌아가며 고르도록 비교 시작 위치를 매번 옮김
+            start = self._next
+            self._next = (self._next + 1) % len(self.endpoints)
+            rotated = self.endpoints[start:] + self.endpoints[:start]
+            endpoint = min((endpoint for endpoint in rotated if endpoint in candidates), key=self._score)
+
+            endpoint.breaker.on_dispatch()
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(self, endpoint: LLMEndpoint, success: Optional[bool], latency: Optional[float] = None) -> None:
+        """요청 완료 처리 (성공 시 지연 시간 반영, 실패 시 차단기에 기록, None이면 취소)"""
+        with self._lock:
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+            if success is None:
+                endpoint.breaker.on_cancel()
+            elif success:
+                endpoint.breaker.on_success()
+                if latency is not None:
+                    endpoint.latency_ewma = latency if endpoint.latency_ewma is None else (
+                        self.latency_alpha * latency + (1 - self.latency_alpha) * endpoint.latency_ewma
+                    )
+            else:
+                endpoint.failures += 1
+                endpoint.breaker.on_failure(time.monotonic())
+
+    def has_alternative(self, exclude: Sequence[LLMEndpoint]) -> bool:
+        """exclude 밖에 지금 요청을 받을 수 있는 엔드포인트가 있는지 (있으면 대기 없이 바로 넘김)"""
+        with self._lock:
+            now = time.monotonic()
+            return any(endpoint not in exclude and endpoint.breaker.available(now) for endpoint in self.endpoints)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 요청 수, 실패 수, 진행 중 요청, 평균 지연, 서킷 상태"""
+        with self._lock:
+            return {
+                endpoint.name: {
+                    'provider': endpoint.provider,
+                    'model': endpoint.model,
+                    'requests': endpoint.requests,
+                    'failures': endpoint.failures,
+                    'outstanding': endpoint.outstanding,
+                    'latency_ewma': endpoint.latency_ewma,
+                    'circuit': endpoint.breaker.state,
+                    'circuit_trips': endpoint.breaker.trips
+                }
+                for endpoint in self.endpoints
+            }
+
+    def _score(self, endpoint: LLMEndpoint) -> float:
+        if self.strategy == 'latency':
+            return (endpoint.latency_ewma or 0.0) * (endpoint.outstanding + 1)
+        return endpoint.outstanding
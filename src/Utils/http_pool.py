@@ -0,0 +1,85 @@
+"""
+keep-alive 연결 풀을 공유하는 HTTP 세션
+"""
+import threading
+from typing import Dict, Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class PooledHTTPSession:
+    """스레드마다 별도의 requests.Session을 쓰되 연결 풀(HTTPAdapter)은 공유하는 세션
+
+    requests.Session 자체는 스레드 안전하지 않으므로 스레드별 세션을 만들고,
+    모든 세션에 같은 어댑터를 마운트하여 TCP/TLS 연결을 재사용합니다.
+    """
+
+    def __init__(self, pool_size: int = 3, connect_timeout: float = 10.0, read_timeout: float = 120.0):
+        self.pool_size = max(1, pool_size)
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        # pool_block=True: 풀이 가득 차면 새 연결을 버리지 않고 반환을 기다림
+        self._adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.pool_size,
+            pool_block=True
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = []
+        self.requests_sent = 0
+
+    def _get_session(self) -> requests.Session:
+        """현재 스레드의 세션 반환 (없으면 생성)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """풀링된 연결로 POST 요청"""
+        kwargs.setdefault('timeout', self.timeout)
+        with self._lock:
+            self.requests_sent += 1
+        return self._get_session().post(url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """풀링된 연결로 GET 요청"""
+        kwargs.setdefault('timeout', self.timeout)
+        with self._lock:
+            self.requests_sent += 1
+        return self._get_session().get(url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 재사용 통계"""
+        connections = 0
+        pool_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            pool_requests += pool.num_requests
+
+        return {
+            'pool_size': self.pool_size,
+            'requests': self.requests_sent,
+            'connections_opened': connections,
+            'connections_reused': max(0, pool_requests - connections),
+            'reuse_rate': (pool_requests - connections) / pool_requests if pool_requests else 0.0
+        }
+
+    def close(self) -> None:
+        """모든 세션과 연결 풀 종료"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._adapter.close()
@@ -0,0 +1,190 @@
+"""
+섹션 단위 작업 저널 (JSON Lines, 중단된 실행 재개용)
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple, Any
+
+from src.Entity.flashcard import Flashcard
+
+
+class JobJournal:
+    """파일/섹션별 처리 상태와 통과한 카드를 한 줄씩 추가 기록하는 저널
+
+    섹션은 (파일 경로, 섹션 번호, 섹션 텍스트와 생성 설정의 해시)로 식별하므로 파일 내용이나
+    제공자/모델/프롬프트 등 생성 설정이 바뀐 섹션은 다시 처리됩니다.
+    메모리에는 완료된 섹션의 파일 내 위치만 두고 카드는 재사용할 때 읽습니다.
+    기록은 한 줄 추가와 flush뿐이며 fsync는 fsync_interval초에 한 번만 수행합니다.
+    열 때 더 이상 쓰이지 않는 줄(삭제·대체된 기록, 실패 기록)이 있으면 살아 있는 기록만 남기고 다시 씁니다.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_interval = fsync_interval
+
+        self.replayed = 0
+        self.recorded = 0
+
+        self._lock = threading.Lock()
+        self._done: Dict[Tuple[str, int], Tuple[str, int]] = {}  # (파일, 섹션) -> (섹션 해시, 줄 위치)
+        self._load()
+        self._file = open(self.path, 'ab')
+        self._last_fsync = time.monotonic()
+
+    @staticmethod
+    def file_key(file_path: str) -> str:
+        """저널에서 파일을 식별하는 키 (절대 경로)"""
+        return str(Path(file_path).resolve())
+
+    @staticmethod
+    def section_hash(text: str, fingerprint: str = '') -> str:
+        """섹션 텍스트와 생성 설정 지문(fingerprint)의 해시"""
+        digest = hashlib.sha1(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get_done(self, file_key: str, section_idx: int, section_hash: str) -> Optional[List[Flashcard]]:
+        """완료된 섹션이면 기록된 카드 반환 (없거나 섹션 내용이 바뀌었으면 None)"""
+        with self._lock:
+            entry = self._done.get((file_key, section_idx))
+            if entry is None or entry[0] != section_hash:
+                return None
+
+        with open(self.path, 'rb') as f:
+            f.seek(entry[1])
+            record = json.loads(f.readline())
+        with self._lock:
+            self.replayed += 1
+        return [Flashcard(**card) for card in record['cards']]
+
+    def record_done(self, file_key: str, section_idx: int, section_hash: str, cards: List[Flashcard]) -> None:
+        """섹션 완료와 통과한 카드 기록"""
+        offset = self._append({
+            'file': file_key,
+            'section': section_idx,
+            'hash': section_hash,
+            'status': 'done',
+            'cards': [asdict(card) for card in cards]
+        })
+        with self._lock:
+            self._done[(file_key, section_idx)] = (section_hash, offset)
+
+    def record_failed(self, file_key: str, section_idx: int, section_hash: str, error: str) -> None:
+        """섹션 실패 기록 (다음 실행에서 다시 처리)"""
+        self._append({
+            'file': file_key,
+            'section': section_idx,
+            'hash': section_hash,
+            'status': 'failed',
+            'error': error
+        })
+
+    def clear(self, file_key: Optional[str] = None) -> None:
+        """완료 기록 삭제 (file_key가 주어지면 해당 파일만 다시 처리되도록 함)"""
+        with self._lock:
+            if file_key is None:
+                self._done.clear()
+                self._file.truncate(0)
+                self._file.seek(0)
+                return
+            for key in [key for key in self._done if key[0] == file_key]:
+                del self._done[key]
+            if not self._done:
+                # 남은 기록이 없으면 파일을 비워 저널이 계속 커지지 않도록 함
+                self._file.truncate(0)
+                self._file.seek(0)
+                return
+        self._append({'file': file_key, 'status': 'cleared'})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저널 통계"""
+        with self._lock:
+            return {
+                'completed_sections': len(self._done),
+                'replayed': self.replayed,
+                'recorded': self.recorded
+            }
+
+    def close(self) -> None:
+        """남은 기록을 디스크에 쓰고 파일 닫기"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        """한 줄 추가 후 줄의 시작 위치 반환"""
+        record['time'] = time.time()
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(line)
+            self._file.flush()
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+            self.recorded += 1
+        return offset
+
+    def _load(self) -> None:
+        """기존 저널에서 완료된 섹션 위치 색인"""
+        if not self.path.exists():
+            return
+
+        offset = 0
+        valid_end = 0
+        records = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                start = offset
+                offset += len(line)
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete line")
+                    record = json.loads(line)
+                except ValueError:
+                    # 비정상 종료로 잘린 마지막 줄
+                    logging.warning(f"작업 저널의 손상된 줄 무시 (위치 {start})")
+                    continue
+                valid_end = offset
+                records += 1
+
+                key = (record.get('file'), record.get('section'))
+                status = record.get('status')
+                if status == 'done':
+                    self._done[key] = (record['hash'], start)
+                elif status == 'cleared':
+                    for done_key in [k for k in self._done if k[0] == record.get('file')]:
+                        del self._done[done_key]
+
+        # 잘린 줄 뒤에 이어 쓰지 않도록 마지막 정상 줄까지만 남김
+        if valid_end < offset:
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+        if records > len(self._done):
+            self._compact()
+
+    def _compact(self) -> None:
+        """완료된 섹션 기록만 남기고 저널을 다시 씀 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        done: Dict[Tuple[str, int], Tuple[str, int]] = {}
+        with open(self.path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            for key, (section_hash, offset) in sorted(self._done.items(), key=lambda item: item[1][1]):
+                src.seek(offset)
+                done[key] = (section_hash, dst.tell())
+                dst.write(src.readline())
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, self.path)
+        self._done = done
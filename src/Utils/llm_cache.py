@@ -0,0 +1,183 @@
+"""
+LLM 응답 캐시 (SQLite 기반, 요청 내용 주소 지정)
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+
+from src.Utils.metrics import CACHE_REQUESTS
+
+
+class LLMResponseCache:
+    """요청 내용(제공자, 모델, 파라미터, 메시지)의 해시로 응답을 저장하는 디스크 캐시
+
+    mode:
+        - 'use': 캐시를 읽고 씁니다 (기본값)
+        - 'bypass': 캐시를 읽지도 쓰지도 않습니다
+        - 'refresh': 캐시를 읽지 않고 새 응답으로 덮어씁니다
+    """
+
+    MODES = ('use', 'bypass', 'refresh')
+
+    # 몇 번의 쓰기마다 만료/용량 정리를 수행할지
+    EVICTION_INTERVAL = 50
+
+    def __init__(self, path: str, max_size_mb: float = 512, max_age_days: float = 30, mode: str = 'use'):
+        if mode not in self.MODES:
+            raise ValueError(f"지원되지 않는 캐시 모드: {mode} (가능한 값: {', '.join(self.MODES)})")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.mode = mode
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, max_tokens: int, messages: List[Dict],
+                 api: str = '') -> str:
+        """요청 내용으로 캐시 키 생성 (api는 같은 제공자의 엔드포인트 종류, 예: Ollama chat/generate)"""
+        request = {
+            'provider': provider,
+            'model': model,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+            'messages': messages
+        }
+        if api:
+            request['api'] = api
+        payload = json.dumps(
+            request,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (없거나 만료되었으면 None)"""
+        if self.mode != 'use':
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (self.max_age_seconds and now - row[1] > self.max_age_seconds):
+                self.misses += 1
+                CACHE_REQUESTS.inc(cache='llm', result='miss')
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            CACHE_REQUESTS.inc(cache='llm', result='hit')
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """응답 저장"""
+        if self.mode == 'bypass':
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, len(response.encode('utf-8')), now, now)
+            )
+            self._conn.commit()
+            self.writes += 1
+            run_eviction = self.writes % self.EVICTION_INTERVAL == 0
+
+        if run_eviction:
+            self.evict()
+
+    def evict(self) -> int:
+        """만료된 항목과 용량 초과분(가장 오래 사용되지 않은 순)을 삭제"""
+        removed = 0
+        with self._lock:
+            if self.max_age_seconds:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+                )
+                removed += cursor.rowcount
+
+            if self.max_size_bytes:
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_size_bytes:
+                    excess = total - self.max_size_bytes
+                    freed = 0
+                    stale_keys = []
+                    for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+                        stale_keys.append((key,))
+                        freed += size
+                        if freed >= excess:
+                            break
+                    self._conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+                    removed += len(stale_keys)
+
+            self._conn.commit()
+            self.evictions += removed
+
+        if removed:
+            logging.info(f"LLM 캐시 정리: {removed}개 항목 삭제됨")
+        return removed
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            'mode': self.mode,
+            'entries': entries,
+            'size_bytes': total_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'writes': self.writes,
+            'evictions': self.evictions
+        }
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
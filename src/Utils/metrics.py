@@ -0,0 +1,313 @@
+"""
+처리 단계별 지표 (Prometheus 텍스트 형식, 표준 라이브러리만 사용)
+"""
+import os
+import time
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# 현재 LLM 호출의 목적 (generation: 카드 생성, scoring: 품질 평가)
+_LLM_PURPOSE: contextvars.ContextVar = contextvars.ContextVar('llm_purpose', default='generation')
+
+
+@contextmanager
+def llm_purpose(purpose: str) -> Iterator[None]:
+    """이 블록 안의 LLM 호출 지표에 purpose 레이블 지정 (비동기 작업에도 전달됨)"""
+    token = _LLM_PURPOSE.set(purpose)
+    try:
+        yield
+    finally:
+        _LLM_PURPOSE.reset(token)
+
+
+def current_llm_purpose() -> str:
+    return _LLM_PURPOSE.get()
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """레이블 값 조합별 값을 가지는 지표"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블은 {self.labelnames}이어야 합니다: {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _label_text(self, key: Tuple[str, ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key: Tuple[str, ...], value) -> List[str]:
+        return [f"{self.name}{self._label_text(key)} {_format_value(value)}"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """증가만 하는 값"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Counter):
+    """현재 값"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """관측값 분포 (구간별 누적 개수, 합계, 개수)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def _render_value(self, key: Tuple[str, ...], state) -> List[str]:
+        counts, total, count = state
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            label_text = self._label_text(key, (('le', _format_value(bound)),))
+            lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {_format_value(total)}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 모음 (Prometheus 텍스트 형식으로 출력)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str) -> None:
+        """임시 파일에 쓴 뒤 교체 (수집기가 반쯤 쓰인 파일을 읽지 않도록)"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding='utf-8')
+        os.replace(tmp_path, target)
+
+    def clear(self) -> None:
+        """모든 값 초기화 (테스트용)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+FILE_READ_SECONDS = REGISTRY.histogram(
+    'flashcard_file_read_seconds', '파일 전체 읽기/텍스트 추출 시간 (페이지를 지연 추출하는 경우는 페이지별 지표로 기록)', ['format'])
+PDF_PAGE_EXTRACT_SECONDS = REGISTRY.histogram(
+    'flashcard_pdf_page_extract_seconds', 'PDF 페이지별 텍스트 추출 시간')
+SECTION_SPLIT_SECONDS = REGISTRY.histogram(
+    'flashcard_section_split_seconds', '섹션 하나를 분할(토큰화, 지연 추출 포함)하는 데 걸린 시간')
+SECTIONS = REGISTRY.counter(
+    'flashcard_sections_total', '처리한 섹션 수', ['status'])
+CARDS = REGISTRY.counter(
+    'flashcard_cards_total', '단계별 카드 수 (parsed, accepted, rejected)', ['stage'])
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    'llm_request_duration_seconds', 'LLM 호출 한 번(시도 단위)의 지연 시간', ['provider', 'purpose', 'outcome'])
+LLM_RETRIES = REGISTRY.counter(
+    'llm_retries_total', '실패 후 다시 시도한 LLM 호출 수', ['provider', 'purpose'])
+LLM_ENDPOINT_REQUESTS = REGISTRY.counter(
+    'llm_endpoint_requests_total', '엔드포인트별 LLM 호출 시도 수', ['endpoint', 'outcome'])
+LLM_TOKENS = REGISTRY.counter(
+    'llm_tokens_total', '제공자가 보고한 토큰 수', ['provider', 'purpose', 'type'])
+CACHE_REQUESTS = REGISTRY.counter(
+    'flashcard_cache_requests_total', '캐시 조회 결과', ['cache', 'result'])
+
+
+def record_llm_tokens(provider: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+    """제공자 응답의 토큰 사용량 기록 (보고되지 않은 값은 건너뜀)"""
+    purpose = current_llm_purpose()
+    if prompt_tokens:
+        LLM_TOKENS.inc(prompt_tokens, provider=provider, purpose=purpose, type='prompt')
+    if completion_tokens:
+        LLM_TOKENS.inc(completion_tokens, provider=provider, purpose=purpose, type='completion')
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """실행 중 interval초마다, 그리고 끝날 때 지표를 파일로 쓰고 선택적으로 localhost에서 제공 (with 문으로 사용)"""
+
+    def __init__(self, path: Optional[str], interval: float = 15.0, port: int = 0,
+                 registry: MetricsRegistry = REGISTRY):
+        self.path = path
+        self.interval = interval
+        self.port = port
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        if self.port and self._server is None:
+            handler = type('MetricsHandler', (_MetricsHandler,), {'registry': self.registry})
+            self._server = ThreadingHTTPServer(('127.0.0.1', self.port), handler)
+            threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True).start()
+            logging.info(f"지표 제공: http://127.0.0.1:{self._server.server_port}/metrics")
+        if self.path and self.interval > 0 and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """주기적 기록을 멈추고 마지막 값을 기록한 뒤 서버 종료"""
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.write()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def write(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.registry.write_textfile(self.path)
+        except OSError as e:
+            logging.warning(f"지표 파일 기록 실패 ({self.path}): {e}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def __enter__(self) -> 'MetricsExporter':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
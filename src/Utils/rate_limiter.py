@@ -0,0 +1,225 @@
+"""
+제공자별 요청 속도 제한과 적응형 동시성 제어
+"""
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Optional, Tuple
+
+
+class TokenBucket:
+    """분당 허용량을 초 단위로 채우는 토큰 버킷 (rate_per_minute <= 0이면 제한 없음)
+
+    reserve()는 필요한 만큼 미리 차감하고 기다려야 할 시간을 돌려주므로
+    동기(time.sleep)와 비동기(asyncio.sleep) 호출자가 같은 버킷을 공유할 수 있습니다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate_per_second > 0
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """amount만큼 예약하고 대기해야 할 시간(초) 반환"""
+        if not self.enabled:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+            self._updated = now
+
+            # 버킷보다 큰 요청도 언젠가는 통과하도록 용량으로 제한
+            amount = min(amount, self.capacity)
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식 동시성 제한
+
+    지연 시간이 목표 이하로 성공하면 한도를 천천히 늘리고(가산 증가),
+    429/과부하 또는 목표 초과 지연이 발생하면 한도를 곱셈으로 줄입니다(승산 감소).
+    동기 스레드와 asyncio 코루틴이 같은 한도를 공유합니다.
+    """
+
+    def __init__(self, initial: int = 3, min_limit: int = 1, max_limit: int = 16,
+                 latency_target: float = 0.0, decrease_factor: float = 0.5,
+                 cooldown: float = 2.0, adaptive: bool = True):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.adaptive = adaptive
+
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """여유가 있으면 즉시 슬롯 획득"""
+        with self._condition:
+            if self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """슬롯을 얻을 때까지 대기 (동기)"""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def aacquire(self) -> None:
+        """슬롯을 얻을 때까지 대기 (비동기)"""
+        while True:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            with self._condition:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                self._async_waiters.append((loop, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._condition:
+                    try:
+                        self._async_waiters.remove((loop, future))
+                    except ValueError:
+                        # 이미 깨워진 뒤 취소되었으면 기회를 다음 대기자에게 넘김
+                        self._notify()
+                raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """슬롯 반환 및 결과에 따른 한도 조정
+
+        latency: 성공한 요청의 지연 시간(초), 실패 시 None
+        overloaded: 429/503, 타임아웃처럼 제공자 과부하를 나타내는 실패 여부
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+
+            if self.adaptive:
+                slow = self.latency_target > 0 and latency is not None and latency > self.latency_target
+                if overloaded or slow:
+                    now = time.monotonic()
+                    if now - self._last_decrease >= self.cooldown:
+                        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                        self._last_decrease = now
+                        self.decreases += 1
+                elif latency is not None and self._limit < self.max_limit:
+                    # 한도만큼 성공하면 약 1 증가
+                    previous = int(self._limit)
+                    self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                    if int(self._limit) > previous:
+                        self.increases += 1
+
+            self._notify()
+
+    def _notify(self) -> None:
+        """빈 슬롯 수만큼 대기 중인 스레드/코루틴 깨우기 (잠금을 잡은 상태에서 호출)"""
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        while free > 0 and self._async_waiters:
+            loop, future = self._async_waiters.popleft()
+            if loop.is_closed() or future.done():
+                continue
+            loop.call_soon_threadsafe(self._wake, future)
+            free -= 1
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+
+class ProviderRateLimiter:
+    """한 제공자의 요청/토큰 속도 제한과 동시성 제한 묶음"""
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 concurrency: Optional[AdaptiveConcurrencyLimiter] = None):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter()
+
+    @classmethod
+    def from_config(cls, config, quota: Optional['ProviderRateLimiter'] = None) -> 'ProviderRateLimiter':
+        """LLMConfig 설정으로 제한기 생성 (quota를 주면 그 제한기의 요청/토큰 버킷을 함께 사용)"""
+        limiter = cls(
+            requests_per_minute=config.rate_limit_rpm,
+            tokens_per_minute=config.rate_limit_tpm,
+            concurrency=AdaptiveConcurrencyLimiter(
+                initial=config.concurrency_initial,
+                min_limit=config.concurrency_min,
+                max_limit=config.concurrency_max,
+                latency_target=config.latency_target_seconds,
+                adaptive=config.adaptive_concurrency
+            )
+        )
+        if quota is not None:
+            limiter.requests = quota.requests
+            limiter.tokens = quota.tokens
+        return limiter
+
+    def reserve(self, tokens: float = 0) -> float:
+        """요청 1건과 토큰 예약 후 대기 시간(초) 반환"""
+        wait = self.requests.reserve(1)
+        if tokens and self.tokens.enabled:
+            wait = max(wait, self.tokens.reserve(tokens))
+        return wait
+
+
+def compute_backoff(attempt: int, base_delay: float, max_delay: float,
+                    retry_after: Optional[float] = None) -> float:
+    """재시도 대기 시간: Retry-After가 있으면 따르고, 없으면 지수 백오프에 전체 지터 적용"""
+    if retry_after is not None and retry_after >= 0:
+        # 여러 호출자가 동시에 깨어나지 않도록 약간의 지터 추가
+        return min(max_delay, retry_after) + random.uniform(0, base_delay)
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
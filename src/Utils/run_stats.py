@@ -0,0 +1,175 @@
+"""
+실행 중 누적되는 처리 통계와 주기적 진행 상황 보고
+"""
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from src.Entity.flashcard import Flashcard
+
+
+class RunStatistics:
+    """카드가 통과하고 섹션이 끝날 때마다 갱신되는 통계 (언제든 snapshot()으로 조회)
+
+    질문/답변 길이는 합계로, 태그는 Counter로 누적하므로 실행이 끝난 뒤 카드를 다시 순회하지 않습니다.
+    진행률은 처리할 텍스트 글자 수 대비 처리를 마친 섹션의 글자 수로 계산하며,
+    남은 섹션 수와 예상 남은 시간(ETA)은 지금까지의 섹션 크기와 처리 속도로 추정합니다.
+    경과 시간은 객체를 만들 때가 아니라 처음 파일이나 섹션이 추가될 때부터 잽니다
+    (실행 전 입력을 기다린 시간은 처리 속도와 ETA에 포함하지 않음).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.started_at: Optional[float] = None
+
+        self.files_total = 0
+        self.files_done = 0
+        self.files_failed = 0
+
+        self.sections_queued = 0
+        self.sections_done = 0
+        self.sections_failed = 0
+        self.text_total_chars = 0
+        self.text_queued_chars = 0
+        self.text_done_chars = 0
+
+        self.cards_accepted = 0
+        self.cards_rejected = 0
+        self._question_chars = 0
+        self._answer_chars = 0
+        self._tags: Counter = Counter()
+
+    def add_files(self, count: int) -> None:
+        """처리할 파일 수 추가"""
+        with self._lock:
+            self._start()
+            self.files_total += count
+
+    def file_finished(self, failed: bool = False) -> None:
+        """파일 하나 처리 완료"""
+        with self._lock:
+            self.files_done += 1
+            self.files_failed += int(failed)
+
+    def add_text(self, chars: int) -> None:
+        """처리할 텍스트 글자 수 추가 (분할 후 실제 크기와의 차이는 음수로 보정)"""
+        with self._lock:
+            self.text_total_chars += chars
+
+    def section_queued(self, chars: int) -> None:
+        """섹션 분할 완료 (처리 대기)"""
+        with self._lock:
+            self._start()
+            self.sections_queued += 1
+            self.text_queued_chars += chars
+
+    def section_finished(self, chars: int, cards: Optional[Iterable[Flashcard]]) -> None:
+        """섹션 처리 완료 (cards가 None이면 실패) 및 통과한 카드 누적"""
+        with self._lock:
+            self.sections_done += 1
+            self.text_done_chars += chars
+            if cards is None:
+                self.sections_failed += 1
+                return
+            for card in cards:
+                self.cards_accepted += 1
+                self._question_chars += len(card.question)
+                self._answer_chars += len(card.answer)
+                self._tags.update(card.tags)
+
+    def record_rejected(self, count: int) -> None:
+        """생성됐지만 검증/중복/품질 평가에서 제외된 카드 수"""
+        if count:
+            with self._lock:
+                self.cards_rejected += count
+
+    def _start(self) -> None:
+        if self.started_at is None:
+            self.started_at = self._clock()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계"""
+        with self._lock:
+            elapsed = max(self._clock() - self.started_at, 1e-9) if self.started_at is not None else 1e-9
+            accepted = self.cards_accepted
+            candidates = accepted + self.cards_rejected
+            progress = min(self.text_done_chars / self.text_total_chars, 1.0) if self.text_total_chars else 0.0
+
+            # 아직 분할되지 않은 텍스트는 지금까지의 평균 섹션 크기로 섹션 수 추정
+            sections_remaining = self.sections_queued - self.sections_done
+            unsplit_chars = self.text_total_chars - self.text_queued_chars
+            if unsplit_chars > 0 and self.sections_queued:
+                sections_remaining += round(unsplit_chars / (self.text_queued_chars / self.sections_queued))
+
+            return {
+                'total_cards': accepted,
+                'rejected_cards': self.cards_rejected,
+                'acceptance_rate': accepted / candidates if candidates else 0.0,
+                'avg_question_length': self._question_chars / accepted if accepted else 0.0,
+                'avg_answer_length': self._answer_chars / accepted if accepted else 0.0,
+                'tags_distribution': dict(self._tags.most_common()),
+                'files_total': self.files_total,
+                'files_done': self.files_done,
+                'files_failed': self.files_failed,
+                'sections_done': self.sections_done,
+                'sections_failed': self.sections_failed,
+                'sections_remaining': max(sections_remaining, 0),
+                'progress': progress,
+                'elapsed_seconds': elapsed,
+                'cards_per_second': accepted / elapsed,
+                'eta_seconds': elapsed * (1 - progress) / progress if progress > 0 else None
+            }
+
+    def format_progress(self) -> str:
+        """진행 상황 한 줄 요약"""
+        stats = self.snapshot()
+        eta = stats['eta_seconds']
+        eta_str = time.strftime('%H:%M:%S', time.gmtime(eta)) if eta is not None else '-'
+        return (
+            f"진행률 {stats['progress'] * 100:.1f}% | "
+            f"파일 {stats['files_done']}/{stats['files_total']} | "
+            f"섹션 {stats['sections_done']}개 완료, 약 {stats['sections_remaining']}개 남음 | "
+            f"카드 {stats['total_cards']}개 (제외 {stats['rejected_cards']}개, "
+            f"{stats['cards_per_second'] * 60:.1f}개/분) | 남은 시간 {eta_str}"
+        )
+
+
+class ProgressReporter:
+    """RunStatistics의 진행 상황을 interval초마다 로그로 남기는 백그라운드 스레드 (with 문으로 사용)"""
+
+    def __init__(self, stats: RunStatistics, interval: float = 10.0,
+                 report: Callable[[str], None] = logging.info):
+        self.stats = stats
+        self.interval = interval
+        self.report = report
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self.interval <= 0 or self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, name="progress-reporter", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """보고 중지 (마지막 상태를 한 번 더 보고)"""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.report(self.stats.format_progress())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.report(self.stats.format_progress())
+
+    def __enter__(self) -> 'ProgressReporter':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
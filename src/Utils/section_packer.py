@@ -0,0 +1,91 @@
+"""
+작은 섹션을 모아 한 번의 생성 요청으로 보내는 묶음 처리기
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+class SectionPacker:
+    """토큰 예산(max_tokens)이나 섹션 수(max_sections)가 찰 때까지, 또는 첫 섹션이 들어온 뒤
+    linger_seconds가 지날 때까지 섹션을 모았다가 send(섹션 목록)로 한 번에 처리하고
+    결과를 섹션별로 돌려줍니다. 여러 파일의 섹션 작업이 같은 packer를 공유하면 파일 사이에서도 묶입니다.
+
+    send는 입력과 같은 순서로 섹션별 결과 목록을 반환해야 하며, 실패하면 묶인 섹션이 모두 같은 예외로 실패합니다.
+    하나의 이벤트 루프 안에서 사용합니다.
+    """
+
+    def __init__(self, send: Callable[[List[Any]], Awaitable[List[Any]]], max_tokens: int,
+                 max_sections: int = 4, linger_seconds: float = 0.05):
+        self._send = send
+        self.max_tokens = max_tokens
+        self.max_sections = max(1, max_sections)
+        self.linger_seconds = linger_seconds
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.packed_sections = 0
+
+    def accepts(self, tokens: int) -> bool:
+        """다른 섹션과 함께 묶을 만큼 작은 섹션인지 (예산의 절반 이하)"""
+        return tokens <= self.max_tokens // 2
+
+    async def submit(self, section: Any, tokens: int) -> Any:
+        """섹션을 묶음에 추가하고 그 섹션의 결과를 기다림"""
+        loop = asyncio.get_running_loop()
+        if self._pending and self._pending_tokens + tokens > self.max_tokens:
+            self._flush()
+
+        future = loop.create_future()
+        self._pending.append((section, future))
+        self._pending_tokens += tokens
+        if len(self._pending) >= self.max_sections or self._pending_tokens >= self.max_tokens:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_seconds, self._flush)
+        return await future
+
+    def get_stats(self) -> Dict[str, float]:
+        """묶음 요청 수와 요청당 평균 섹션 수"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'sections': self.packed_sections,
+                'avg_sections_per_request': self.packed_sections / self.requests if self.requests else 0.0
+            }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        with self._lock:
+            self.requests += 1
+            self.packed_sections += len(batch)
+        try:
+            results = await self._send([section for section, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
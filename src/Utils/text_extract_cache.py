@@ -0,0 +1,198 @@
+"""
+추출된 문서 텍스트 캐시 (SQLite 기반, 파일 내용 해시로 주소 지정)
+"""
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Any
+
+from src.Utils.metrics import CACHE_REQUESTS
+
+
+def file_content_hash(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 해시 (블록 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractedTextCache:
+    """페이지별 추출 텍스트와 메타데이터(제목, 저자, 페이지 수)를 파일 내용 해시로 저장하는 디스크 캐시
+
+    파일 경로, 크기, 수정 시각이 이전과 같으면 파일을 다시 해시하지 않고 기록된 해시를 사용합니다.
+    페이지 텍스트는 zlib으로 압축해 저장하고, 전체 크기가 max_size_mb를 넘으면
+    가장 오래 사용되지 않은 문서부터 삭제합니다.
+    """
+
+    # 캐시에 저장하는 메타데이터 키 (파일 이름 등 경로에 따라 달라지는 값은 제외)
+    METADATA_KEYS = ('title', 'author', 'pages')
+
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, path: str, max_size_mb: float = 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self.hits = 0
+        self.misses = 0
+        self.hashes_computed = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS documents (
+                content_hash TEXT PRIMARY KEY,
+                metadata TEXT NOT NULL,
+                pages BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_last_access ON documents(last_access)")
+        self._conn.commit()
+
+    def content_hash(self, file_path: str) -> str:
+        """파일 내용 해시 (크기와 수정 시각이 기록과 같으면 다시 계산하지 않음)"""
+        resolved = str(Path(file_path).resolve())
+        stat = os.stat(resolved)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (resolved, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+        if row:
+            return row[0]
+
+        content_hash = file_content_hash(resolved, self.HASH_BLOCK_SIZE)
+
+        with self._lock:
+            self.hashes_computed += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (resolved, stat.st_size, stat.st_mtime_ns, content_hash)
+            )
+            self._conn.commit()
+        return content_hash
+
+    def get(self, file_path: str) -> Optional[Tuple[List[str], Dict[str, Any]]]:
+        """캐시된 (페이지별 텍스트, 메타데이터) 조회 (없으면 None)"""
+        content_hash = self.content_hash(file_path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata, pages FROM documents WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc(cache='text', result='miss')
+                return None
+
+            self._conn.execute(
+                "UPDATE documents SET last_access = ? WHERE content_hash = ?", (time.time(), content_hash)
+            )
+            self._conn.commit()
+            self.hits += 1
+            CACHE_REQUESTS.inc(cache='text', result='hit')
+
+        pages = json.loads(zlib.decompress(row[1]).decode('utf-8'))
+        return pages, json.loads(row[0])
+
+    def set(self, file_path: str, pages: List[str], metadata: Dict[str, Any]) -> None:
+        """페이지별 텍스트와 메타데이터 저장"""
+        content_hash = self.content_hash(file_path)
+        cached_metadata = json.dumps(
+            {key: metadata[key] for key in self.METADATA_KEYS if key in metadata},
+            ensure_ascii=False, default=str
+        )
+        compressed = zlib.compress(json.dumps(pages, ensure_ascii=False).encode('utf-8'))
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (content_hash, metadata, pages, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, cached_metadata, compressed, len(compressed), now, now)
+            )
+            self._conn.commit()
+
+        self.evict()
+
+    def evict(self) -> int:
+        """전체 크기가 한도를 넘으면 가장 오래 사용되지 않은 문서부터 삭제"""
+        removed = 0
+        with self._lock:
+            if self.max_size_bytes:
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()[0]
+                if total > self.max_size_bytes:
+                    excess = total - self.max_size_bytes
+                    freed = 0
+                    stale_hashes = []
+                    for content_hash, size in self._conn.execute(
+                            "SELECT content_hash, size FROM documents ORDER BY last_access"):
+                        stale_hashes.append((content_hash,))
+                        freed += size
+                        if freed >= excess:
+                            break
+                    self._conn.executemany("DELETE FROM documents WHERE content_hash = ?", stale_hashes)
+                    self._conn.execute(
+                        "DELETE FROM files WHERE content_hash NOT IN (SELECT content_hash FROM documents)"
+                    )
+                    removed = len(stale_hashes)
+
+            self._conn.commit()
+            self.evictions += removed
+
+        if removed:
+            logging.info(f"텍스트 추출 캐시 정리: {removed}개 문서 삭제됨")
+        return removed
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM files")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            entries, total_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM documents"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'size_bytes': total_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'hashes_computed': self.hashes_computed,
+            'evictions': self.evictions
+        }
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
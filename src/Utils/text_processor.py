@@ -2,48 +2,106 @@
 텍스트 처리 유틸리티
 """
 import re
-from typing import List
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
 import tiktoken
 
 
 class TextProcessor:
     """텍스트 처리 및 분할 클래스"""
     
+    # 한 번에 토큰화할 문장 수 (배치 크기만큼만 토큰 목록을 메모리에 유지)
+    ENCODE_BATCH_SIZE = 2048
+    # 조각 단위로 읽는 입력의 첫 배치 크기 (앞부분만 필요할 때 과도하게 읽지 않도록 두 배씩 증가)
+    LAZY_ENCODE_BATCH_SIZE = 32
+    
+    SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+    
     @staticmethod
-    def estimate_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
-        """텍스트의 토큰 수 추정"""
+    @lru_cache(maxsize=None)
+    def _get_encoding(model: str = "gpt-3.5-turbo"):
+        """모델별 tiktoken 인코딩 (프로세스당 한 번만 로드)"""
         try:
-            encoding = tiktoken.encoding_for_model(model)
+            return tiktoken.encoding_for_model(model)
         except:
-            encoding = tiktoken.get_encoding("cl100k_base")
-        
-        return len(encoding.encode(text))
+            return tiktoken.get_encoding("cl100k_base")
+    
+    @staticmethod
+    def estimate_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+        """텍스트의 토큰 수 추정"""
+        return len(TextProcessor._get_encoding(model).encode(text))
+    
+    @staticmethod
+    def count_tokens_batch(texts: List[str], model: str = "gpt-3.5-turbo") -> List[int]:
+        """여러 텍스트의 토큰 수를 배치 단위로 한 번에 계산"""
+        encoding = TextProcessor._get_encoding(model)
+        batch_size = TextProcessor.ENCODE_BATCH_SIZE
+        counts: List[int] = []
+        for start in range(0, len(texts), batch_size):
+            counts.extend(len(tokens) for tokens in encoding.encode_batch(texts[start:start + batch_size]))
+        return counts
     
     @staticmethod
     def smart_divide_text(text: str, max_tokens: int = 1500) -> List[str]:
         """의미 있는 단위로 텍스트 분할"""
-        # 문장 단위로 분할
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        return list(TextProcessor.iter_divide_text(text, max_tokens))
+    
+    @staticmethod
+    def iter_divide_text(text: Union[str, Iterable[str]], max_tokens: int = 1500) -> Iterator[str]:
+        """smart_divide_text와 같은 섹션을 필요할 때마다 하나씩 생성
         
-        sections = []
-        current_section: List[str] = []
-        current_tokens = 0
+        text는 문자열 또는 이어 붙이면 전체 텍스트가 되는 조각 이터러블입니다.
+        문장은 배치 단위로만 토큰화하므로 앞쪽 섹션만 소비하면 나머지는 읽거나 계산하지 않습니다.
+        """
+        sentences = TextProcessor.iter_sentences(text)
+        batch_size = TextProcessor.ENCODE_BATCH_SIZE if isinstance(text, str) else TextProcessor.LAZY_ENCODE_BATCH_SIZE
+        section: List[str] = []
+        section_tokens = 0
         
-        for sentence in sentences:
-            sentence_tokens = TextProcessor.estimate_tokens(sentence)
-            
-            if current_tokens + sentence_tokens > max_tokens and current_section:
-                sections.append(' '.join(current_section))
-                current_section = [sentence]
-                current_tokens = sentence_tokens
-            else:
-                current_section.append(sentence)
-                current_tokens += sentence_tokens
+        while True:
+            batch = list(islice(sentences, batch_size))
+            if not batch:
+                break
+            for sentence, sentence_tokens in zip(batch, TextProcessor.count_tokens_batch(batch)):
+                if section and section_tokens + sentence_tokens > max_tokens:
+                    yield ' '.join(section)
+                    section = []
+                    section_tokens = 0
+                section.append(sentence)
+                section_tokens += sentence_tokens
+            batch_size = min(batch_size * 2, TextProcessor.ENCODE_BATCH_SIZE)
         
-        if current_section:
-            sections.append(' '.join(current_section))
+        if section:
+            yield ' '.join(section)
+    
+    @staticmethod
+    def iter_sentences(text: Union[str, Iterable[str]]) -> Iterator[str]:
+        """문장 단위 분할 (전체 텍스트에 re.split을 적용한 것과 같은 결과를 지연 생성)"""
+        chunks = [text] if isinstance(text, str) else text
+        buffer = ""
+        # 이미 확인한 위치부터 다시 찾아 긴 문장이 여러 조각에 걸쳐도 버퍼를 처음부터 다시 훑지 않음
+        # (앞 문자는 lookbehind로 보이므로 조각 경계에 걸친 구분자도 찾음)
+        scan_from = 0
+        for chunk in chunks:
+            buffer += chunk
+            start = 0
+            pending = None
+            for match in TextProcessor.SENTENCE_BOUNDARY.finditer(buffer, scan_from):
+                # 버퍼 끝에 닿은 공백은 다음 조각에서 이어질 수 있음
+                if match.end() == len(buffer):
+                    pending = match.start()
+                    break
+                yield buffer[start:match.start()]
+                start = match.end()
+            buffer = buffer[start:]
+            scan_from = pending - start if pending is not None else max(0, len(buffer) - 1)
         
-        return sections
+        start = 0
+        for match in TextProcessor.SENTENCE_BOUNDARY.finditer(buffer, scan_from):
+            yield buffer[start:match.start()]
+            start = match.end()
+        yield buffer[start:]
     
     @staticmethod
     def extract_key_concepts(text: str) -> List[str]:
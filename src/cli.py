@@ -0,0 +1,134 @@
+"""
+비대화형 배치 CLI
+
+사용 예:
+    python -m src.cli "SOURCE_DOCUMENTS/**/*.pdf" --output-dir output --max-files 4 --rpm 60
+"""
+import os
+import sys
+import glob
+import logging
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from src.main import AnkiFlashcardMaker, setup_logging
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="여러 문서에서 Anki 플래시카드를 생성합니다 (입력 프롬프트 없음)."
+    )
+    parser.add_argument('patterns', nargs='+',
+                        help="처리할 파일, 폴더 또는 glob 패턴 (**는 하위 폴더 포함)")
+    parser.add_argument('-o', '--output-dir', default='output', help="출력 폴더 (기본값: output)")
+    parser.add_argument('-a', '--process-all', action='store_true',
+                        help="모든 섹션 처리 (기본값: 파일마다 처음 3개 섹션만)")
+    parser.add_argument('--deck-name', help="모든 카드를 이 이름의 덱 하나로 저장 (없으면 파일마다 저장)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="증분 모드: 추가/수정된 파일만 처리하고 전체 덱 저장 (항상 모든 섹션 처리)")
+    parser.add_argument('--formats',
+                        help="쉼표로 구분한 출력 형식 (txt, csv, jsonl, json, apkg; 기본값: EXPORT_FORMATS)")
+    parser.add_argument('--provider', help="LLM 제공자 (ollama, openai, openrouter)")
+    parser.add_argument('--endpoints',
+                        help="쉼표로 구분한 엔드포인트 풀 (제공자@URL#모델, 예: ollama@http://10.0.0.2:11434)")
+    parser.add_argument('--max-concurrency', type=int, help="모든 파일이 공유하는 동시 LLM 요청 수")
+    parser.add_argument('--max-files', type=int, help="동시에 처리하는 파일 수")
+    parser.add_argument('--rpm', type=float, help="분당 요청 수 제한 (0이면 제한 없음)")
+    parser.add_argument('--tpm', type=float, help="분당 토큰 수 제한 (0이면 제한 없음)")
+    parser.add_argument('--metrics-path', help="Prometheus 텍스트 형식 지표 파일 (빈 값이면 기록하지 않음)")
+    parser.add_argument('--metrics-port', type=int, help="실행 중 http://127.0.0.1:<포트>/metrics로 지표 제공 (0이면 사용 안 함)")
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    return parser
+
+
+def resolve_files(patterns: List[str], extensions: List[str]) -> List[Path]:
+    """패턴에 맞는 지원 형식 파일 목록 (중복 제거, 경로 순 정렬)"""
+    files = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        matches = [path] if path.exists() else [Path(match) for match in glob.glob(pattern, recursive=True)]
+        for match in matches:
+            candidates = sorted(match.iterdir()) if match.is_dir() else [match]
+            files.update(
+                candidate.resolve() for candidate in candidates
+                if candidate.is_file() and candidate.suffix.lower() in extensions
+            )
+    return sorted(files)
+
+
+def apply_overrides(args: argparse.Namespace) -> None:
+    """명령행 값을 환경 변수로 반영 (LLMConfig가 파생 설정까지 함께 계산하도록)"""
+    overrides = {
+        'LLM_PROVIDER': args.provider,
+        'LLM_ENDPOINTS': args.endpoints,
+        'MAX_CONCURRENCY': args.max_concurrency,
+        'MAX_PARALLEL_FILES': args.max_files,
+        'RATE_LIMIT_RPM': args.rpm,
+        'RATE_LIMIT_TPM': args.tpm,
+        'EXPORT_FORMATS': args.formats,
+        'METRICS_PATH': args.metrics_path,
+        'METRICS_PORT': args.metrics_port,
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            os.environ[name] = str(value)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 실행 (성공 0, 실패한 파일이 있으면 1, 처리할 파일이 없으면 2 반환)"""
+    args = build_parser().parse_args(argv)
+    setup_logging(getattr(logging, args.log_level))
+    apply_overrides(args)
+
+    files = resolve_files(args.patterns, AnkiFlashcardMaker.SUPPORTED_EXTENSIONS)
+    if not files:
+        print("처리할 파일이 없습니다.", file=sys.stderr)
+        return 2
+
+    maker = AnkiFlashcardMaker(output_dir=args.output_dir)
+    try:
+        return run(maker, files, args)
+    finally:
+        maker.close()
+
+
+def run(maker: AnkiFlashcardMaker, files: List[Path], args: argparse.Namespace) -> int:
+    """파일 처리 후 결과 출력 (반환값은 main()과 같음)"""
+    print(f"LLM 제공자: {maker.config.provider}, 파일 {len(files)}개, "
+          f"동시 파일 {maker.config.max_parallel_files}개, 동시 요청 {maker.config.max_concurrency}개")
+
+    if args.incremental:
+        summary = maker.process_incremental(files)
+        print(f"추가: {summary['added']}, 수정: {summary['modified']}, "
+              f"변경 없음: {summary['unchanged']}, 삭제: {summary['deleted']}")
+        print(f"덱 전체 카드 수: {summary['total_cards']}")
+        for path in summary['paths'].values():
+            print(f"- {path}")
+        for file_path in summary['failed_files']:
+            print(f"✗ {file_path}", file=sys.stderr)
+        return 1 if summary['failed_files'] else 0
+
+    summary = maker.process_files(files, args.process_all, args.deck_name, maker.config.max_parallel_files)
+    for file_path, result in summary['files'].items():
+        if result['error']:
+            print(f"✗ {file_path}: {result['error']}", file=sys.stderr)
+        elif result['failed_sections']:
+            print(f"⚠ {file_path}: {result['cards']}개 카드, 실패한 섹션 {result['failed_sections']}")
+        else:
+            print(f"✓ {file_path}: {result['cards']}개 카드")
+
+    stats = summary['stats']
+    print(f"총 카드 수: {summary['total_cards']} (제외된 후보 {stats['rejected_cards']}개, "
+          f"평균 질문 {stats['avg_question_length']:.1f}자, 평균 답변 {stats['avg_answer_length']:.1f}자, "
+          f"{stats['elapsed_seconds']:.1f}초)")
+    for paths in summary['paths'].values():
+        for path in paths.values():
+            print(f"- {path}")
+    return 1 if summary['failed_files'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,25 +5,31 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable
 
 from src.Config.llm_config import LLMConfig
 from src.Entity.flashcard import Flashcard
+from src.Entity.card_collection import CardCollection
 from src.Service.llm_service import LLMService
 from src.Service.pdf_reader_service import FileReaderService
 from src.Service.flashcard_generator_service import FlashcardGeneratorService
-from src.Service.export_service import ExportService
+from src.Service.export_service import ExportService, StreamingExportWriter, EXPORT_SUFFIXES
+from src.Utils.corpus_manifest import CorpusManifest
+from src.Utils.run_stats import ProgressReporter
+from src.Utils.metrics import MetricsExporter
 
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/flashcard_generator.log'),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging(level: int = logging.INFO, log_dir: str = "logs") -> None:
+    """로깅 설정 (로그 폴더가 없으면 생성)"""
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(str(Path(log_dir) / 'flashcard_generator.log')),
+            logging.StreamHandler()
+        ]
+    )
 
 
 class AnkiFlashcardMaker:
@@ -32,40 +38,165 @@ class AnkiFlashcardMaker:
     # 지원하는 파일 확장자들
     SUPPORTED_EXTENSIONS = ['.pdf', '.md', '.markdown', '.txt', '.text']
     
-    def __init__(self):
-        self.config = LLMConfig()
+    def __init__(self, config: Optional[LLMConfig] = None, output_dir: str = "output"):
+        self.config = config or LLMConfig()
         self.llm_service = LLMService(self.config)
-        self.file_service = FileReaderService()  # 이름 변경
+        self.file_service = FileReaderService(self.config)  # 이름 변경
         self.generator_service = FlashcardGeneratorService(
             self.llm_service, 
             self.file_service,  # 이름 변경
             self.config
         )
         self.export_service = ExportService()
-        self.output_dir = Path("output")
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def process_file(self, file_path: str, process_all: bool = False) -> List[Flashcard]:
-        """파일 처리 (PDF, Markdown, Text 지원)"""
-        return self.generator_service.generate_cards_from_pdf(file_path, process_all)
+    def process_file(self, file_path: str, process_all: bool = False,
+                     writer: Optional[StreamingExportWriter] = None) -> List[Flashcard]:
+        """파일 처리 (PDF, Markdown, Text 지원)
+        
+        writer가 주어지면 섹션마다 통과한 카드를 바로 파일에 추가합니다.
+        """
+        on_cards = writer.write_cards if writer else None
+        return self.generator_service.generate_cards_from_pdf(file_path, process_all, on_cards)
     
-    def save_flashcards(self, cards: List[Flashcard], base_name: str):
-        """플래시카드를 여러 형식으로 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def process_files(self, files: List[Path], process_all: bool = False, deck_name: Optional[str] = None,
+                      max_parallel_files: int = 4) -> Dict[str, Any]:
+        """여러 파일을 동시에 처리하고 결과 요약 반환
+        
+        모든 파일의 섹션이 같은 동시 요청 제한과 속도 제한을 공유합니다. deck_name이 주어지면
+        모든 카드를 하나의 덱으로, 없으면 파일마다 따로 저장합니다.
+        """
+        self.generator_service.reset_stats()
+        writers: Dict[str, StreamingExportWriter] = {}
+        combined = self.open_writer(deck_name) if deck_name else None
         
-        # Anki 텍스트 형식
-        anki_path = self.output_dir / f"{base_name}_{timestamp}_anki.txt"
-        self.export_service.export_to_anki_txt(cards, str(anki_path))
+        def on_cards(file_path: str, cards: List[Flashcard]) -> None:
+            if combined:
+                combined.write_cards(cards)
+                return
+            if file_path not in writers:
+                writers[file_path] = self.open_writer(Path(file_path).stem)
+            writers[file_path].write_cards(cards)
         
-        # CSV 형식
-        csv_path = self.output_dir / f"{base_name}_{timestamp}.csv"
-        self.export_service.export_to_csv(cards, str(csv_path))
+        failed = True
+        try:
+            with self.progress_reporter(), self.metrics_exporter():
+                results = self.generator_service.generate_cards_from_files(
+                    [str(file_path) for file_path in files], process_all, max_parallel_files, on_cards
+                )
+            failed = False
+        finally:
+            for writer in ([combined] if combined else list(writers.values())):
+                self.close_writer(writer, abort=failed)
         
-        # JSON 형식
-        json_path = self.output_dir / f"{base_name}_{timestamp}.json"
-        self.export_service.export_to_json(cards, str(json_path))
+        return {
+            'files': results,
+            'total_cards': sum(result['cards'] for result in results.values()),
+            'failed_files': [
+                file_path for file_path, result in results.items()
+                if result['error'] or result['failed_sections']
+            ],
+            'paths': {
+                file_path: writer.paths
+                for file_path, writer in ({deck_name: combined} if combined else writers).items()
+                if writer.count
+            },
+            'stats': self.get_statistics()
+        }
+    
+    def open_writer(self, base_name: str) -> StreamingExportWriter:
+        """EXPORT_FORMATS의 형식들에 한 번에 이어 쓰는 writer 열기 (파일 이름: {base_name}_{시각}{접미사})"""
+        unknown = [fmt for fmt in self.config.export_formats if fmt not in EXPORT_SUFFIXES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 내보내기 형식: {', '.join(unknown)}")
         
-        return anki_path, csv_path, json_path
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        paths = {
+            fmt: str(self.output_dir / f"{base_name}_{timestamp}{EXPORT_SUFFIXES[fmt]}")
+            for fmt in self.config.export_formats
+        }
+        return self.export_service.open_writer(
+            anki_path=paths.get('txt'),
+            csv_path=paths.get('csv'),
+            json_path=paths.get('json'),
+            jsonl_path=paths.get('jsonl'),
+            apkg_path=paths.get('apkg'),
+            deck_name=base_name
+        )
+    
+    @staticmethod
+    def close_writer(writer: StreamingExportWriter, abort: bool = False) -> None:
+        """writer를 닫고 (abort면 .apkg 등을 완성하지 않음) 카드가 하나도 없으면 빈 출력 파일 삭제"""
+        if abort:
+            writer.abort()
+        else:
+            writer.close()
+        if writer.count == 0:
+            for path in writer.paths.values():
+                Path(path).unlink(missing_ok=True)
+    
+    def process_incremental(self, files: List[Path]) -> Dict[str, Any]:
+        """증분 모드: 추가/수정된 파일만 처리하고 삭제된 파일의 카드는 빼고 전체 덱 저장
+        
+        매니페스트에 파일별 내용 해시와 생성된 카드를 기록하므로 변경되지 않은 파일은 다시 처리하지 않습니다.
+        덱 전체를 유지하기 위해 모든 섹션을 처리하며, 실패한 섹션이 있는 파일은 다음 실행에서 다시 처리합니다.
+        """
+        self.generator_service.reset_stats()
+        manifest = CorpusManifest(self.config.corpus_manifest_path)
+        try:
+            diff = manifest.scan(str(file_path) for file_path in files)
+            retired_cards = manifest.retire(diff.deleted)
+            
+            # 새 카드가 변경되지 않은 파일의 카드와 중복되지 않도록 등록
+            self.generator_service.register_existing_cards(manifest.iter_cards(diff.unchanged))
+            
+            # 변경된 파일을 동시에 처리하고 파일별 카드는 처리가 끝난 뒤 한 번에 교체
+            changed_cards: Dict[str, CardCollection] = {file_key: CardCollection() for file_key in diff.changed}
+            with self.progress_reporter(), self.metrics_exporter():
+                results = self.generator_service.generate_cards_from_files(
+                    diff.changed, True, self.config.max_parallel_files,
+                    lambda file_key, cards: changed_cards[file_key].extend(cards)
+                )
+            
+            processed_files, failed_files = [], []
+            for file_key, result in results.items():
+                cards = changed_cards.pop(file_key)
+                if result['error']:
+                    logging.error(f"증분 처리 실패 ({file_key}): {result['error']}")
+                    failed_files.append(file_key)
+                    continue
+                if result['failed_sections']:
+                    # 매니페스트를 갱신하지 않아 다음 실행에서 다시 처리 (완료된 섹션은 작업 저널에서 재사용)
+                    logging.warning(f"{len(result['failed_sections'])}개 섹션 실패, 다음 실행에서 다시 처리: {file_key}")
+                    failed_files.append(file_key)
+                    continue
+                manifest.replace_cards(file_key, diff.states[file_key], cards)
+                processed_files.append(file_key)
+            
+            # 매니페스트의 전체 덱을 한 장씩 읽어 저장
+            with self.open_writer("CORPUS") as writer:
+                writer.write_cards(manifest.iter_cards())
+            
+            return {
+                'added': len(diff.added),
+                'modified': len(diff.modified),
+                'unchanged': len(diff.unchanged),
+                'deleted': len(diff.deleted),
+                'retired_cards': retired_cards,
+                'processed_files': processed_files,
+                'failed_files': failed_files,
+                'total_cards': writer.count,
+                'paths': writer.paths
+            }
+        finally:
+            manifest.close()
+    
+    def save_flashcards(self, cards: Iterable[Flashcard], base_name: str) -> Dict[str, str]:
+        """플래시카드를 여러 형식으로 저장 (카드는 한 번만 순회) 후 {형식: 경로} 반환"""
+        with self.open_writer(base_name) as writer:
+            writer.write_cards(cards)
+        return writer.paths
     
     def get_supported_files(self, source_dir: Path) -> List[Path]:
         """지원하는 형식의 파일들을 찾아서 반환"""
@@ -74,37 +205,61 @@ class AnkiFlashcardMaker:
             files.extend(source_dir.glob(f"*{ext}"))
         return sorted(files)  # 파일명 순으로 정렬
     
-    def generate_statistics(self, cards: List[Flashcard]) -> Dict[str, Any]:
-        """생성된 카드 통계"""
-        stats: Dict[str, Any] = {
-            'total_cards': len(cards),
-            'tags_distribution': {},
-            'avg_question_length': 0.0,
-            'avg_answer_length': 0.0
-        }
-        
-        if cards:
-            q_lengths = [len(card.question) for card in cards]
-            a_lengths = [len(card.answer) for card in cards]
-            
-            stats['avg_question_length'] = sum(q_lengths) / len(q_lengths)
-            stats['avg_answer_length'] = sum(a_lengths) / len(a_lengths)
-            
-            # 태그 분포
-            for card in cards:
-                for tag in card.tags:
-                    if tag not in stats['tags_distribution']:
-                        stats['tags_distribution'][tag] = 0
-                    stats['tags_distribution'][tag] += 1
-        
-        return stats
+    def close(self) -> None:
+        """PDF 추출 프로세스 풀, 연결 풀, 캐시 정리"""
+        self.file_service.close()
+        self.llm_service.close()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """실행 중 누적된 카드 통계 (카드를 다시 순회하지 않음)"""
+        return self.generator_service.stats.snapshot()
+    
+    def progress_reporter(self) -> ProgressReporter:
+        """PROGRESS_INTERVAL_SECONDS마다 진행 상황을 로그로 남기는 보고기"""
+        return ProgressReporter(self.generator_service.stats, self.config.progress_interval_seconds)
+    
+    def metrics_exporter(self) -> MetricsExporter:
+        """METRICS_INTERVAL_SECONDS마다, 그리고 끝날 때 METRICS_PATH에 지표를 기록하는 내보내기"""
+        return MetricsExporter(self.config.metrics_path, self.config.metrics_interval_seconds, self.config.metrics_port)
+
+
+# 출력 파일 안내에 쓰는 형식 이름
+OUTPUT_LABELS = {'txt': 'Anki', 'csv': 'CSV', 'json': 'JSON', 'jsonl': 'JSON Lines', 'apkg': 'Anki 패키지'}
+
+
+def print_output_paths(paths: Dict[str, str], title: str = "파일 저장 위치") -> None:
+    """형식별 출력 파일 경로 출력"""
+    print(f"\n{title}:")
+    for fmt, path in paths.items():
+        print(f"- {OUTPUT_LABELS.get(fmt, fmt)}: {path}")
+
+
+def print_statistics(stats: Dict[str, Any]) -> None:
+    """누적 통계 출력"""
+    print(f"총 카드 수: {stats['total_cards']} (제외된 후보 {stats['rejected_cards']}개, "
+          f"통과율 {stats['acceptance_rate'] * 100:.1f}%)")
+    print(f"평균 질문 길이: {stats['avg_question_length']:.1f}자")
+    print(f"평균 답변 길이: {stats['avg_answer_length']:.1f}자")
+    print(f"처리 시간: {stats['elapsed_seconds']:.1f}초 ({stats['cards_per_second'] * 60:.1f}개/분)")
+    
+    if stats['tags_distribution']:
+        print(f"태그 분포: {dict(list(stats['tags_distribution'].items())[:5])}")
 
 
 def main():
     """메인 실행 함수"""
+    setup_logging()
     print("=== 향상된 Anki 플래시카드 생성기 ===")
     
     maker = AnkiFlashcardMaker()
+    try:
+        run_interactive(maker)
+    finally:
+        maker.close()
+
+
+def run_interactive(maker: AnkiFlashcardMaker) -> None:
+    """파일 선택 메뉴를 보여 주고 선택한 방식으로 처리"""
     print(f"현재 LLM 제공자: {maker.config.provider}")
     
     # 소스 디렉토리 확인
@@ -131,88 +286,81 @@ def main():
     
     # 모든 파일 처리 옵션 추가
     print(f"{len(supported_files)+1}. 모든 파일 처리")
+    print(f"{len(supported_files)+2}. 변경된 파일만 처리 (증분 모드)")
     
     try:
         choice = int(input("\n처리할 파일 번호를 선택하세요: ")) - 1
-        if choice < 0 or choice > len(supported_files):
+        if choice < 0 or choice > len(supported_files) + 1:
             raise ValueError
     except:
         print("잘못된 선택입니다.")
         return
     
+    if choice == len(supported_files) + 1:
+        # 증분 모드 (항상 모든 섹션 처리)
+        print("\n추가/수정된 파일을 찾고 있습니다...")
+        try:
+            summary = maker.process_incremental(supported_files)
+        except Exception as e:
+            logging.error(f"처리 중 오류 발생: {e}")
+            print(f"오류가 발생했습니다: {e}")
+            return
+        
+        print(f"\n=== 증분 처리 결과 ===")
+        print(f"추가: {summary['added']}, 수정: {summary['modified']}, "
+              f"변경 없음: {summary['unchanged']}, 삭제: {summary['deleted']}")
+        print(f"처리된 파일 수: {len(summary['processed_files'])}, 실패: {len(summary['failed_files'])}")
+        print(f"삭제된 파일에서 제외된 카드 수: {summary['retired_cards']}")
+        print(f"덱 전체 카드 수: {summary['total_cards']}")
+        print_output_paths(summary['paths'])
+        return
+    
     # 처리 옵션
     process_all = input("모든 섹션을 처리하시겠습니까? (y/N): ").lower().startswith('y')
     
     try:
         if choice == len(supported_files):
-            # 모든 파일 처리
+            # 모든 파일 처리 (파일들을 동시에 처리하고 통합 파일에 카드를 생성되는 즉시 추가)
             print(f"\n모든 파일 ({len(supported_files)}개)을 처리하고 있습니다...")
-            all_cards = []
-            processed_files = []
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            summary = maker.process_files(supported_files, process_all, f"ALL_FILES_{timestamp}",
+                                          maker.config.max_parallel_files)
             
-            for file_path in supported_files:
-                try:
-                    print(f"처리 중: {file_path.name}...")
-                    cards = maker.process_file(str(file_path), process_all)
-                    if cards:
-                        all_cards.extend(cards)
-                        processed_files.append(file_path.name)
-                        print(f"✓ {file_path.name}: {len(cards)}개 카드 생성")
-                    else:
-                        print(f"⚠ {file_path.name}: 카드 생성 실패")
-                except Exception as e:
-                    print(f"✗ {file_path.name}: 처리 중 오류 - {e}")
-                    continue
+            processed_files = []
+            for file_path, result in summary['files'].items():
+                name = Path(file_path).name
+                if result['error']:
+                    print(f"✗ {name}: 처리 중 오류 - {result['error']}")
+                elif result['cards']:
+                    processed_files.append(name)
+                    print(f"✓ {name}: {result['cards']}개 카드 생성")
+                else:
+                    print(f"⚠ {name}: 카드 생성 실패")
             
-            if all_cards:
-                # 통합 파일로 저장
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                base_name = f"ALL_FILES_{timestamp}"
-                anki_path, csv_path, json_path = maker.save_flashcards(all_cards, base_name)
-                
-                # 통계 출력
-                stats = maker.generate_statistics(all_cards)
+            if summary['total_cards']:
+                stats = summary['stats']
                 print(f"\n=== 전체 처리 통계 ===")
                 print(f"처리된 파일 수: {len(processed_files)}")
-                print(f"총 카드 수: {stats['total_cards']}")
-                print(f"평균 질문 길이: {stats['avg_question_length']:.1f}자")
-                print(f"평균 답변 길이: {stats['avg_answer_length']:.1f}자")
-                
-                if stats['tags_distribution']:
-                    print(f"태그 분포: {dict(list(stats['tags_distribution'].items())[:5])}")
-                
+                print_statistics(stats)
                 print(f"\n처리된 파일들: {', '.join(processed_files)}")
-                print(f"\n통합 파일 저장 위치:")
-                print(f"- Anki: {anki_path}")
-                print(f"- CSV: {csv_path}")
-                print(f"- JSON: {json_path}")
+                for paths in summary['paths'].values():
+                    print_output_paths(paths, "통합 파일 저장 위치")
             else:
                 print("어떤 파일에서도 플래시카드가 생성되지 않았습니다.")
         else:
-            # 개별 파일 처리 (기존 로직)
+            # 개별 파일 처리
             selected_file = supported_files[choice]
             print(f"\n{selected_file.name} 파일을 처리하고 있습니다...")
-            cards = maker.process_file(str(selected_file), process_all)
+            summary = maker.process_files([selected_file], process_all)
             
-            if cards:
-                # 파일 저장
-                base_name = selected_file.stem
-                anki_path, csv_path, json_path = maker.save_flashcards(cards, base_name)
-                
-                # 통계 출력
-                stats = maker.generate_statistics(cards)
+            result = summary['files'][str(selected_file)]
+            if result['error']:
+                raise RuntimeError(result['error'])
+            if summary['total_cards']:
                 print(f"\n=== 생성 통계 ===")
-                print(f"총 카드 수: {stats['total_cards']}")
-                print(f"평균 질문 길이: {stats['avg_question_length']:.1f}자")
-                print(f"평균 답변 길이: {stats['avg_answer_length']:.1f}자")
-                
-                if stats['tags_distribution']:
-                    print(f"태그 분포: {dict(list(stats['tags_distribution'].items())[:5])}")
-                
-                print(f"\n파일 저장 위치:")
-                print(f"- Anki: {anki_path}")
-                print(f"- CSV: {csv_path}")
-                print(f"- JSON: {json_path}")
+                print_statistics(summary['stats'])
+                for paths in summary['paths'].values():
+                    print_output_paths(paths)
             else:
                 print("플래시카드가 생성되지 않았습니다.")
             
@@ -221,6 +369,5 @@ def main():
         print(f"오류가 발생했습니다: {e}")
         print("로그 파일을 확인하세요.")
 
-
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Anki 패키지 작성기 테스트
+"""
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import zipfile
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Service.export_service import ExportService
+from src.Utils.anki_package import AnkiPackageWriter, note_guid
+
+
+class TestAnkiPackageWriter(unittest.TestCase):
+    """AnkiPackageWriter 클래스 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def open_collection(self, package_path):
+        """패키지에서 컬렉션을 꺼내 연결"""
+        with zipfile.ZipFile(package_path) as package:
+            self.assertEqual(sorted(package.namelist()), ['collection.anki2', 'media'])
+            self.assertEqual(package.read('media'), b'{}')
+            package.extract('collection.anki2', self.temp_dir.name)
+        conn = sqlite3.connect(self.path('collection.anki2'))
+        self.addCleanup(conn.close)
+        return conn
+
+    def test_export_notes_and_cards(self):
+        """노트/카드/덱이 Anki 컬렉션 형식으로 기록되고 필드는 HTML로 이스케이프"""
+        cards = [
+            Flashcard("<b>질문</b> 1?", "첫 줄\n둘째 줄", ["태그", "source:a b.pdf"]),
+            Flashcard("질문 2?", "답변 2")
+        ]
+        count = ExportService().export_to_apkg(iter(cards), self.path("deck.apkg"), "테스트 덱")
+
+        self.assertEqual(count, 2)
+        conn = self.open_collection(self.path("deck.apkg"))
+        notes = conn.execute("SELECT guid, flds, sfld, tags FROM notes ORDER BY id").fetchall()
+        self.assertEqual(len(notes), 2)
+        first = next(note for note in notes if note[2] == "<b>질문</b> 1?")
+        self.assertEqual(first[0], note_guid(cards[0]))
+        self.assertEqual(first[1], "&lt;b&gt;질문&lt;/b&gt; 1?\x1f첫 줄<br>둘째 줄")
+        self.assertEqual(first[3], " 태그 source:a_b.pdf ")
+
+        decks = json.loads(conn.execute("SELECT decks FROM col").fetchone()[0])
+        deck_ids = {deck['id'] for deck in decks.values() if deck['name'] == "테스트 덱"}
+        card_decks = {did for (did,) in conn.execute("SELECT did FROM cards")}
+        self.assertEqual(card_decks, deck_ids)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0], 2)
+        # 인덱스는 삽입 후 생성
+        indexes = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('ix_cards_sched', indexes)
+
+    def test_stable_ids_across_exports(self):
+        """같은 질문은 내보낼 때마다 같은 GUID/ID를 가지며 답변이 바뀌어도 유지"""
+        ExportService().export_to_apkg([Flashcard("질문?", "답변 1")], self.path("a.apkg"))
+        first = self.open_collection(self.path("a.apkg")).execute("SELECT id, guid FROM notes").fetchall()
+        ExportService().export_to_apkg([Flashcard("질문?", "답변 2")], self.path("b.apkg"))
+        second = self.open_collection(self.path("b.apkg")).execute("SELECT id, guid FROM notes").fetchall()
+
+        self.assertEqual(first, second)
+
+    def test_batches_and_duplicates(self):
+        """배치 경계를 넘어도 모든 카드를 기록하고 같은 질문은 한 번만 저장"""
+        cards = [Flashcard(f"질문 {i}?", f"답변 {i}") for i in range(25)]
+        cards.append(Flashcard("질문 3?", "다른 답변"))
+
+        with AnkiPackageWriter(self.path("deck.apkg")) as writer:
+            writer.BATCH_SIZE = 10
+            writer.write_cards(cards)
+
+        self.assertEqual((writer.count, writer.duplicates), (25, 1))
+        conn = self.open_collection(self.path("deck.apkg"))
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0], 25)
+
+    def test_due_numbers_skip_duplicates(self):
+        """건너뛴 중복 질문은 새 카드 순서(due)에 빈 번호를 남기지 않음"""
+        cards = [Flashcard("질문 1?", "답변"), Flashcard("질문 1?", "다른 답변"), Flashcard("질문 2?", "답변")]
+        cards += [Flashcard("질문 2?", "다시"), Flashcard("질문 3?", "답변")]
+
+        with AnkiPackageWriter(self.path("deck.apkg")) as writer:
+            writer.BATCH_SIZE = 3
+            writer.write_cards(cards)
+
+        conn = self.open_collection(self.path("deck.apkg"))
+        rows = conn.execute("SELECT n.sfld, c.due FROM cards c JOIN notes n ON n.id = c.nid ORDER BY c.due").fetchall()
+        self.assertEqual(rows, [("질문 1?", 1), ("질문 2?", 2), ("질문 3?", 3)])
+        self.assertEqual(os.listdir(self.temp_dir.name).count("deck.apkg"), 1)
+
+    def test_failed_export_leaves_no_file(self):
+        """내보내기 중 오류가 나면 출력 파일과 임시 파일을 남기지 않음"""
+        def cards():
+            yield Flashcard("질문?", "답변")
+            raise RuntimeError("중단")
+
+        with self.assertRaises(RuntimeError):
+            ExportService().export_to_apkg(cards(), self.path("deck.apkg"))
+
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_collection_staged_outside_output_dir(self):
+        """작업 중인 컬렉션은 출력 폴더가 아닌 임시 디렉터리에 둠"""
+        writer = AnkiPackageWriter(self.path("deck.apkg"))
+        self.addCleanup(writer.abort)
+        writer.write(Flashcard("질문?", "답변"))
+        writer.flush()
+
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+        self.assertEqual(os.path.dirname(writer._tmp_dir), tempfile.gettempdir())
+
+
+if __name__ == '__main__':
+    unittest.main()
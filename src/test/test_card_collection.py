@@ -0,0 +1,79 @@
+"""
+메모리 절약형 카드 표현 테스트
+"""
+import unittest
+import sys
+import os
+import json
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard, CompactFlashcard
+from src.Entity.card_collection import CardCollection
+
+
+class TestCompactFlashcard(unittest.TestCase):
+    """CompactFlashcard 클래스 테스트"""
+
+    def test_same_api_as_flashcard(self):
+        """to_anki_format / is_valid 결과가 Flashcard와 동일"""
+        card = Flashcard("질문?", "답변", ["태그", "source:a.pdf"])
+        compact = CompactFlashcard.from_flashcard(card)
+
+        self.assertEqual(compact.to_anki_format(), card.to_anki_format())
+        self.assertTrue(compact.is_valid())
+        self.assertFalse(CompactFlashcard(" ", "답변").is_valid())
+        self.assertEqual(compact, card)
+        self.assertEqual(compact.to_flashcard(), card)
+        self.assertFalse(hasattr(compact, '__dict__'))
+
+    def test_tag_strings_shared(self):
+        """같은 태그 문자열은 같은 객체를 공유"""
+        first = CompactFlashcard("q1", "a1", ["태그", "source:" + "a.pdf"])
+        second = CompactFlashcard("q2", "a2", ["태그", "source:" + "".join(["a", ".pdf"])])
+
+        self.assertIs(first.tags[1], second.tags[1])
+        self.assertEqual(json.dumps(first.tags, ensure_ascii=False), '["태그", "source:a.pdf"]')
+
+
+class TestCardCollection(unittest.TestCase):
+    """CardCollection 클래스 테스트"""
+
+    def setUp(self):
+        self.cards = [
+            Flashcard("질문 1?", "답변 1", ["a", "source:x.pdf"]),
+            Flashcard("질문 2?", "답변 2", ["b", "source:x.pdf"], notes="메모"),
+            Flashcard("질문 3?", "답변 3", ["a", "source:x.pdf"])
+        ]
+
+    def test_round_trip(self):
+        """추가한 순서대로 같은 내용의 카드를 돌려줌"""
+        collection = CardCollection(self.cards)
+
+        self.assertEqual(len(collection), 3)
+        self.assertEqual(list(collection), self.cards)
+        self.assertEqual(collection[-1], self.cards[2])
+        self.assertEqual(collection[1].notes, "메모")
+        with self.assertRaises(IndexError):
+            collection[3]
+
+    def test_tag_counts(self):
+        """태그 조합 ID로 태그별 카드 수 집계"""
+        collection = CardCollection(self.cards)
+
+        self.assertEqual(collection.tag_counts(), {'a': 2, 'b': 1, 'source:x.pdf': 3})
+        self.assertEqual(len(collection._tag_sets), 2)
+
+    def test_tag_sets_scoped_to_collection(self):
+        """같은 태그 조합은 컬렉션 안에서 한 튜플을 공유하고, 컬렉션 사이에는 공유하지 않음"""
+        collection = CardCollection(self.cards)
+        other = CardCollection(self.cards)
+
+        self.assertIs(collection[0].tags, collection[2].tags)
+        self.assertIsNot(collection[0].tags, other[0].tags)
+        self.assertIs(collection[0].tags[1], other[1].tags[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+휴리스틱 카드 필터 테스트
+"""
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Utils.card_filter import CardHeuristicFilter
+
+
+SOURCE = "광합성은 식물이 빛 에너지를 이용해 이산화탄소와 물로 포도당을 만드는 과정이다. 엽록체에서 일어난다."
+
+
+class TestCardHeuristicFilter(unittest.TestCase):
+    """CardHeuristicFilter 클래스 테스트"""
+
+    def setUp(self):
+        self.filter = CardHeuristicFilter()
+
+    def assertVerdict(self, question, answer, verdict, rule=None, source=SOURCE):
+        result = self.filter.evaluate(Flashcard(question=question, answer=answer), source)
+        self.assertEqual(result.verdict, verdict)
+        if rule is not None:
+            self.assertEqual(result.rule, rule)
+
+    def test_non_answer_rejected(self):
+        """'모르겠다', '언급되지 않음' 류의 답변 제외"""
+        self.assertVerdict("광합성의 부산물은 무엇인가?", "텍스트에 언급되지 않음", 'reject', 'non_answer')
+        self.assertVerdict("광합성의 발견자는 누구인가?", "모르겠다", 'reject', 'non_answer')
+
+    def test_trivial_answer_rejected(self):
+        """의미 없는 한 단어 답변 제외"""
+        self.assertVerdict("광합성은 식물에서 일어나는가?", "네", 'reject', 'trivial_answer')
+        self.assertVerdict("What is the discoverer's name?", "Unknown.", 'reject', 'non_answer', source="")
+
+    def test_short_answers_not_rejected(self):
+        """원소 기호, 한 자리 숫자, 참/거짓 답변은 LLM 평가로 넘김"""
+        self.assertVerdict("What is the chemical symbol for sodium?", "Na", 'uncertain', source="")
+        self.assertVerdict("How many continents are there?", "7", 'uncertain', source="")
+        self.assertVerdict("Is the Earth flat?", "False", 'uncertain', source="")
+
+    def test_unknown_inside_answer_not_rejected(self):
+        """'unknown'이 들어 있을 뿐인 답변은 무의미한 답변이 아님"""
+        self.assertVerdict("When was the origin of the city discovered?",
+                           "The origin remains unknown until 1900 excavations", 'uncertain', source="")
+
+    def test_restated_answer_rejected(self):
+        """질문을 되풀이한 답변 제외"""
+        self.assertVerdict("광합성은 어디에서 일어나는가?", "광합성은 어디에서 일어나는가", 'reject', 'restated_answer')
+
+    def test_no_question_rejected(self):
+        """질문 형태가 아닌 질문 제외"""
+        self.assertVerdict("광합성", "식물이 포도당을 만드는 과정", 'reject', 'no_question')
+
+    def test_no_source_overlap_rejected(self):
+        """원문과 겹치는 내용이 없는 답변 제외"""
+        self.assertVerdict("광합성은 누가 발견했는가?", "얀 잉엔하우스", 'reject', 'no_source_overlap')
+
+    def test_grounded_answer_accepted(self):
+        """원문에 근거한 답변은 LLM 평가 없이 통과"""
+        self.assertVerdict("광합성은 어디에서 일어나는가?", "엽록체에서 일어난다", 'accept')
+
+    def test_partial_overlap_uncertain(self):
+        """애매한 카드는 LLM 평가로 넘김"""
+        self.assertVerdict("광합성이 중요한 이유는 무엇인가?", "식물이 포도당을 만들어 생태계 먹이사슬을 지탱한다", 'uncertain')
+
+    def test_single_word_answer_not_rejected(self):
+        """의미 있는 한 단어 답변은 허용"""
+        self.assertVerdict("광합성은 어느 세포 소기관에서 일어나는가?", "엽록체", 'uncertain')
+
+    def test_rule_counts(self):
+        """규칙별 제외 횟수 집계"""
+        cards = [
+            Flashcard(question="무엇인가?", answer="모르겠다"),
+            Flashcard(question="무엇인가?", answer="알 수 없음"),
+            Flashcard(question="광합성", answer="엽록체에서 일어난다"),
+        ]
+        self.filter.evaluate_cards(cards, SOURCE)
+        stats = self.filter.get_stats()
+        self.assertEqual(stats['rejections_by_rule'], {'non_answer': 2, 'no_question': 1})
+        self.assertEqual(stats['verdicts'], {'reject': 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+스트리밍 카드 파서 테스트
+"""
+import unittest
+import sys
+import os
+import re
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.card_stream_parser import IncrementalCardParser
+
+
+RESPONSE = """Q: 첫 질문?
+A: 첫 답변
+Tags: a, b
+---
+Q: 둘째 질문?
+A: 둘째 답변 - 하이픈 포함 -- 두 개
+-----
+Q: 셋째 질문?
+A: 셋째 답변
+---"""
+
+
+class TestIncrementalCardParser(unittest.TestCase):
+    """IncrementalCardParser 클래스 테스트"""
+
+    def expected_blocks(self):
+        return [block for block in re.split(r'---+', RESPONSE) if block.strip()]
+
+    def parse_in_chunks(self, size):
+        parser = IncrementalCardParser()
+        blocks = []
+        for i in range(0, len(RESPONSE), size):
+            blocks.extend(parser.feed(RESPONSE[i:i + size]))
+        blocks.extend(parser.close())
+        return blocks
+
+    def test_same_blocks_for_any_chunk_size(self):
+        """청크 크기와 상관없이 한 번에 분리한 결과와 동일"""
+        for size in (1, 2, 3, 5, 13, len(RESPONSE)):
+            self.assertEqual(self.parse_in_chunks(size), self.expected_blocks(), f"chunk size {size}")
+
+    def test_blocks_emitted_before_stream_ends(self):
+        """구분자가 확정되면 스트림이 끝나기 전에 블록 반환"""
+        parser = IncrementalCardParser()
+        first = RESPONSE.index('---') + 3
+        self.assertEqual(parser.feed(RESPONSE[:first]), [])  # 구분자가 더 길어질 수 있음
+        self.assertEqual(len(parser.feed("\n")), 1)
+
+    def test_long_block_scanned_once(self):
+        """여러 청크에 걸친 긴 블록도 이미 확인한 부분은 다시 훑지 않음 (청크 경계의 구분자도 찾음)"""
+        delimiter = IncrementalCardParser.DELIMITER
+        scanned = []
+
+        class CountingPattern:
+            def finditer(self, string, pos=0):
+                scanned.append(len(string) - pos)
+                return delimiter.finditer(string, pos)
+
+            def split(self, string):
+                return delimiter.split(string)
+
+        chunks = ["Q: 질문? A: 답변 - " * 10] * 500 + ["-", "-", "-\n", "Q: 다음?", "---", "-"]
+        parser = IncrementalCardParser()
+        with mock.patch.object(IncrementalCardParser, 'DELIMITER', CountingPattern()):
+            blocks = [block for chunk in chunks for block in parser.feed(chunk)] + parser.close()
+
+        self.assertEqual(blocks, [block for block in re.split(r'---+', "".join(chunks)) if block.strip()])
+        self.assertEqual(len(blocks), 2)
+        self.assertLess(sum(scanned), 2 * len("".join(chunks)))
+
+
+if __name__ == '__main__':
+    unittest.main()
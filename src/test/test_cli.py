@@ -0,0 +1,50 @@
+"""
+배치 CLI 테스트
+"""
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.cli import build_parser, resolve_files
+from src.main import AnkiFlashcardMaker
+
+
+class TestCli(unittest.TestCase):
+    """CLI 인자 처리 테스트"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        for name in ("a.pdf", "b.md", "notes.docx", "sub/c.txt", "sub/deep/d.PDF"):
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("내용", encoding='utf-8')
+
+    def test_resolve_files(self):
+        """glob 패턴과 폴더에서 지원 형식 파일만 중복 없이 찾음"""
+        files = resolve_files(
+            [str(self.root / "**" / "*"), str(self.root / "sub"), str(self.root / "a.pdf")],
+            AnkiFlashcardMaker.SUPPORTED_EXTENSIONS
+        )
+
+        names = [path.relative_to(self.root.resolve()).as_posix() for path in files]
+        self.assertEqual(names, ["a.pdf", "b.md", "sub/c.txt", "sub/deep/d.PDF"])
+
+    def test_parser_defaults(self):
+        """기본값: 처음 3개 섹션만 처리, 파일마다 저장"""
+        args = build_parser().parse_args(["docs/*.pdf"])
+
+        self.assertFalse(args.process_all)
+        self.assertIsNone(args.deck_name)
+        self.assertIsNone(args.max_concurrency)
+        self.assertEqual(args.output_dir, "output")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+원본 문서 매니페스트 테스트
+"""
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Utils import corpus_manifest
+from src.Utils.corpus_manifest import CorpusManifest
+
+
+class TestCorpusManifest(unittest.TestCase):
+    """CorpusManifest 클래스 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.manifest_path = os.path.join(self.tmp_dir.name, 'manifest.sqlite')
+        self.docs = {name: self.write(name, f"{name} 내용") for name in ('a.md', 'b.md', 'c.md')}
+
+    def write(self, name, text, mtime=None):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def open_manifest(self):
+        manifest = CorpusManifest(self.manifest_path)
+        self.addCleanup(manifest.close)
+        return manifest
+
+    def record_all(self, manifest, paths):
+        diff = manifest.scan(paths)
+        for key in diff.changed:
+            name = os.path.basename(key)
+            manifest.replace_cards(key, diff.states[key], [Flashcard(f"{name} 질문?", "답변", [f"source:{name}"])])
+        return diff
+
+    def test_first_scan_adds_everything(self):
+        """처음에는 모든 파일이 추가됨"""
+        manifest = self.open_manifest()
+        diff = self.record_all(manifest, self.docs.values())
+        self.assertEqual(len(diff.added), 3)
+        self.assertEqual(manifest.get_stats(), {'documents': 3, 'cards': 3})
+
+    def test_only_changed_files_reprocessed(self):
+        """수정/추가된 파일만 다시 처리하고, 내용이 같으면 수정 시각만 바뀌어도 변경 없음"""
+        manifest = self.open_manifest()
+        self.record_all(manifest, self.docs.values())
+
+        self.write('a.md', "a.md 새 내용", mtime=10 ** 18)
+        self.write('b.md', "b.md 내용", mtime=10 ** 18)  # 내용 동일
+        new_doc = self.write('d.md', "d.md 내용")
+        paths = list(self.docs.values()) + [new_doc]
+
+        diff = manifest.scan(paths)
+        self.assertEqual([os.path.basename(p) for p in diff.modified], ['a.md'])
+        self.assertEqual([os.path.basename(p) for p in diff.added], ['d.md'])
+        self.assertEqual(sorted(os.path.basename(p) for p in diff.unchanged), ['b.md', 'c.md'])
+
+        # 수정 시각이 갱신되었으므로 다음 검사에서는 해시하지 않음
+        with mock.patch.object(corpus_manifest, 'file_content_hash') as content_hash:
+            manifest.scan([self.docs['b.md']])
+        content_hash.assert_not_called()
+
+    def test_deleted_files_retired(self):
+        """삭제된 파일의 카드는 덱에서 제외"""
+        manifest = self.open_manifest()
+        self.record_all(manifest, self.docs.values())
+
+        diff = manifest.scan([self.docs['a.md'], self.docs['c.md']])
+        self.assertEqual([os.path.basename(p) for p in diff.deleted], ['b.md'])
+        self.assertEqual(manifest.retire(diff.deleted), 1)
+        self.assertEqual([card.question for card in manifest.iter_cards()], ["a.md 질문?", "c.md 질문?"])
+
+    def test_replace_cards_and_iterate_by_file(self):
+        """파일의 카드를 교체하고 파일별로 조회"""
+        manifest = self.open_manifest()
+        diff = self.record_all(manifest, self.docs.values())
+        key = diff.added[0]
+        cards = [Flashcard(f"질문 {i}?", "답변", ["태그"], notes="메모") for i in range(1200)]
+        manifest.replace_cards(key, diff.states[key], cards)
+
+        self.assertEqual(list(manifest.iter_cards([key])), cards)
+        self.assertEqual(manifest.get_stats()['cards'], 1202)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+유사 중복 인덱스 테스트
+"""
+import unittest
+import sys
+import os
+import threading
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.dedup_index import NearDuplicateIndex
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    """NearDuplicateIndex 클래스 테스트"""
+
+    def setUp(self):
+        self.index = NearDuplicateIndex(threshold=0.7)
+
+    def test_exact_duplicate(self):
+        """대소문자/공백/문장부호만 다른 텍스트는 중복"""
+        self.assertIsNotNone(self.index.add_if_unique("What is Python? A programming language."))
+        self.assertIsNone(self.index.add_if_unique("what is python   a programming language"))
+
+    def test_paraphrased_duplicate(self):
+        """조금 바꿔 쓴 카드도 중복으로 판정"""
+        self.assertIsNotNone(self.index.add_if_unique("파이썬은 무엇인가? 파이썬은 범용 프로그래밍 언어이다."))
+        self.assertIsNone(self.index.add_if_unique("파이썬이란 무엇인가? 파이썬은 범용 프로그래밍 언어다."))
+
+    def test_different_cards_kept(self):
+        """다른 내용의 카드는 모두 추가"""
+        self.assertIsNotNone(self.index.add_if_unique("파이썬은 무엇인가? 파이썬은 범용 프로그래밍 언어이다."))
+        self.assertIsNotNone(self.index.add_if_unique("GIL은 무엇의 약자인가? Global Interpreter Lock"))
+        self.assertEqual(len(self.index), 2)
+
+    def test_remove_releases_reservation(self):
+        """삭제한 항목은 다시 추가 가능"""
+        item_id = self.index.add_if_unique("광합성은 어디에서 일어나는가? 엽록체")
+        self.index.remove(item_id)
+        self.assertIsNone(self.index.find_similar("광합성은 어디에서 일어나는가? 엽록체"))
+        self.assertIsNotNone(self.index.add_if_unique("광합성은 어디에서 일어나는가? 엽록체"))
+
+    def test_concurrent_add_is_atomic(self):
+        """여러 스레드가 같은 카드를 추가해도 하나만 성공"""
+        results = []
+
+        def worker():
+            results.append(self.index.add_if_unique("동시에 추가되는 같은 카드의 질문과 답변"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(result is not None for result in results), 1)
+
+    def test_invalid_band_configuration(self):
+        """num_perm이 bands의 배수가 아니면 오류"""
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(num_perm=30, bands=8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+엔드포인트 풀과 서킷 브레이커 테스트
+"""
+import unittest
+import sys
+import os
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.endpoint_pool import CircuitBreaker, EndpointPool, LLMEndpoint, parse_endpoint_specs
+
+
+def make_pool(count, strategy='least_outstanding', threshold=2, reset_seconds=30):
+    endpoints = [
+        LLMEndpoint(f"ep{i}", 'ollama', 'llama3.2', client=None, breaker=CircuitBreaker(threshold, reset_seconds))
+        for i in range(count)
+    ]
+    return EndpointPool(endpoints, strategy), endpoints
+
+
+class TestParseEndpointSpecs(unittest.TestCase):
+    """LLM_ENDPOINTS 파싱 테스트"""
+
+    def test_parse_mixed_providers(self):
+        specs = parse_endpoint_specs("ollama@http://10.0.0.1:11434/, ollama@http://10.0.0.2:11434#qwen2.5:7b,openrouter")
+        self.assertEqual(specs, [
+            ('ollama', 'http://10.0.0.1:11434', ''),
+            ('ollama', 'http://10.0.0.2:11434', 'qwen2.5:7b'),
+            ('openrouter', '', '')
+        ])
+        self.assertEqual(parse_endpoint_specs(""), [])
+
+    def test_invalid_specs(self):
+        for spec in ["claude@http://x", "openai@http://x", "ollama,ollama"]:
+            with self.assertRaises(ValueError):
+                parse_endpoint_specs(spec)
+
+
+class TestEndpointPool(unittest.TestCase):
+    """EndpointPool 클래스 테스트"""
+
+    def test_least_outstanding_spreads_requests(self):
+        pool, endpoints = make_pool(3)
+        chosen = [pool.acquire() for _ in range(6)]
+        self.assertEqual([endpoint.outstanding for endpoint in endpoints], [2, 2, 2])
+
+        pool.release(chosen[0], True, 0.1)
+        self.assertIs(pool.acquire(), chosen[0])
+
+    def test_latency_strategy_prefers_faster_endpoint(self):
+        pool, (slow, fast) = make_pool(2, strategy='latency')
+        pool.release(pool.acquire(), True, 2.0)
+        pool.release(pool.acquire(), True, 0.5)
+        self.assertEqual((slow.latency_ewma, fast.latency_ewma), (2.0, 0.5))
+
+        # 빠른 엔드포인트에 요청이 쌓여 점수가 느린 쪽을 넘기 전까지는 빠른 쪽 선택
+        self.assertEqual([pool.acquire() for _ in range(4)], [fast, fast, fast, fast])
+        self.assertIs(pool.acquire(), slow)
+
+    def test_failed_endpoint_excluded_for_retry(self):
+        pool, endpoints = make_pool(2)
+        first = pool.acquire()
+        pool.release(first, False)
+
+        self.assertTrue(pool.has_alternative([first]))
+        self.assertIsNot(pool.acquire(exclude=[first]), first)
+
+    def test_circuit_opens_and_recovers_with_single_trial(self):
+        pool, (broken, healthy) = make_pool(2, threshold=2, reset_seconds=30)
+        with mock.patch('src.Utils.endpoint_pool.time.monotonic', return_value=100.0):
+            for _ in range(2):
+                broken.outstanding += 1
+                pool.release(broken, False)
+            self.assertEqual(broken.breaker.state, CircuitBreaker.OPEN)
+            self.assertEqual({pool.acquire().name for _ in range(3)}, {healthy.name})
+
+        with mock.patch('src.Utils.endpoint_pool.time.monotonic', return_value=131.0):
+            trial = pool.acquire()
+            self.assertIs(trial, broken)
+            self.assertEqual(broken.breaker.state, CircuitBreaker.HALF_OPEN)
+            # 시험 요청이 끝나기 전에는 다른 요청을 보내지 않음
+            self.assertIs(pool.acquire(), healthy)
+
+            pool.release(trial, True, 0.1)
+            self.assertEqual(broken.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(pool.get_stats()['ep0']['circuit_trips'], 1)
+
+    def test_neutral_releases_keep_circuit_closed(self):
+        """장애가 아닌 실패(success=None)는 몇 번이 반복되어도 서킷을 열지 않음"""
+        pool, endpoints = make_pool(2, threshold=2)
+        for _ in range(6):
+            pool.release(pool.acquire(), None)
+
+        self.assertEqual({endpoint.breaker.state for endpoint in endpoints}, {CircuitBreaker.CLOSED})
+        self.assertEqual([endpoint.outstanding for endpoint in endpoints], [0, 0])
+
+    def test_all_open_still_probes_earliest(self):
+        pool, endpoints = make_pool(2, threshold=1)
+        with mock.patch('src.Utils.endpoint_pool.time.monotonic', side_effect=[10.0, 20.0]):
+            for endpoint in endpoints:
+                endpoint.outstanding += 1
+                pool.release(endpoint, False)
+
+        with mock.patch('src.Utils.endpoint_pool.time.monotonic', return_value=21.0):
+            self.assertFalse(pool.has_alternative([]))
+            self.assertIs(pool.acquire(), endpoints[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+내보내기 서비스 테스트
+"""
+import unittest
+import sys
+import os
+import json
+import zipfile
+import tempfile
+import tracemalloc
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Service.export_service import ExportService
+
+
+class TestStreamingExportWriter(unittest.TestCase):
+    """StreamingExportWriter 클래스 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.service = ExportService()
+        self.cards = [
+            Flashcard("질문 1?", "답변, \"따옴표\"", ["태그", "source:a.pdf"]),
+            Flashcard("Question 2?", "Answer\twith tab", [], notes="메모"),
+            Flashcard("질문 3?", "답변 3", ["x"])
+        ]
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def read(self, name):
+        with open(self.path(name), encoding='utf-8') as f:
+            return f.read()
+
+    def test_same_output_as_batch_export(self):
+        """나누어 쓴 결과가 일괄 내보내기와 동일"""
+        self.service.export_to_anki_txt(self.cards, self.path("batch.txt"))
+        self.service.export_to_csv(self.cards, self.path("batch.csv"))
+        self.service.export_to_json(self.cards, self.path("batch.json"))
+
+        with self.service.open_writer(self.path("s.txt"), self.path("s.csv"), self.path("s.json")) as writer:
+            writer.write_cards(self.cards[:1])
+            writer.write_cards([])
+            writer.write_cards(self.cards[1:])
+
+        self.assertEqual(writer.count, 3)
+        for ext in ("txt", "csv", "json"):
+            self.assertEqual(self.read(f"s.{ext}"), self.read(f"batch.{ext}"))
+
+    def test_empty_output_is_valid(self):
+        """카드가 없어도 유효한 JSON"""
+        self.service.export_to_json([], self.path("batch.json"))
+        with self.service.open_writer(self.path("s.txt"), self.path("s.csv"), self.path("s.json")):
+            pass
+        self.assertEqual(self.read("s.json"), self.read("batch.json"))
+
+    def test_cards_on_disk_before_close(self):
+        """close() 전에도 이미 쓴 카드는 파일에 기록됨"""
+        writer = self.service.open_writer(self.path("s.txt"), self.path("s.csv"), self.path("s.json"))
+        self.addCleanup(writer.close)
+        writer.write_cards(self.cards[:2])
+
+        self.assertEqual(len(self.read("s.txt").splitlines()), 2)
+        self.assertIn("Question 2?", self.read("s.csv"))
+        # 닫히지 않은 JSON 배열도 항목은 모두 기록되어 있음
+        self.assertEqual(len(json.loads(self.read("s.json") + "\n]")), 2)
+
+    def test_failed_run_not_finalized(self):
+        """예외로 끝나면 .apkg를 만들지 않고 JSON 배열도 닫지 않음"""
+        with self.assertRaises(RuntimeError):
+            with self.service.open_writer(self.path("s.txt"), json_path=self.path("s.json"),
+                                          apkg_path=self.path("s.apkg")) as writer:
+                writer.write_cards(self.cards[:2])
+                raise RuntimeError("생성 실패")
+
+        self.assertFalse(os.path.exists(self.path("s.apkg")))
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ["s.json", "s.txt"])
+        self.assertEqual(len(self.read("s.txt").splitlines()), 2)
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads(self.read("s.json"))
+
+    def test_close_error_still_closes_other_sinks(self):
+        """한 파일을 닫다가 오류가 나도 나머지 파일은 닫고 오류를 전달"""
+        writer = self.service.open_writer(self.path("s.txt"), self.path("s.csv"), apkg_path=self.path("s.apkg"))
+        writer.write_cards(self.cards)
+        txt_sink, csv_sink, _ = writer._sinks
+
+        with mock.patch.object(txt_sink, 'close', side_effect=OSError("디스크 가득 참")):
+            with self.assertRaises(OSError):
+                writer.close()
+        self.assertTrue(csv_sink._file.closed)
+        self.assertTrue(os.path.exists(self.path("s.apkg")))
+        txt_sink._file.close()
+
+    def test_legacy_json_format(self):
+        """기존 JSON 출력은 json.dump(indent=2)와 동일"""
+        self.service.export_to_json(iter(self.cards), self.path("s.json"))
+
+        expected = json.dumps(
+            [{'question': c.question, 'answer': c.answer, 'tags': c.tags, 'notes': c.notes} for c in self.cards],
+            ensure_ascii=False, indent=2
+        )
+        self.assertEqual(self.read("s.json"), expected)
+
+    def test_fan_out_in_one_pass(self):
+        """카드 이터레이터를 한 번만 순회하면서 모든 형식에 기록"""
+        consumed = []
+
+        def cards():
+            for card in self.cards:
+                consumed.append(card)
+                yield card
+
+        with self.service.open_writer(self.path("s.txt"), self.path("s.csv"), jsonl_path=self.path("s.jsonl"),
+                                      apkg_path=self.path("s.apkg"), deck_name="덱") as writer:
+            writer.write_cards(cards())
+
+        self.assertEqual(consumed, self.cards)
+        self.assertEqual(list(writer.paths), ['txt', 'csv', 'jsonl', 'apkg'])
+        lines = [json.loads(line) for line in self.read("s.jsonl").splitlines()]
+        self.assertEqual([line['question'] for line in lines], [card.question for card in self.cards])
+        self.assertEqual(lines[1]['notes'], "메모")
+        self.assertEqual(len(self.read("s.txt").splitlines()), 3)
+        with zipfile.ZipFile(self.path("s.apkg")) as package:
+            self.assertIn('collection.anki2', package.namelist())
+
+    def test_unknown_format_rejected(self):
+        """지원하지 않는 형식은 ValueError"""
+        from src.Service.export_service import StreamingExportWriter
+
+        with self.assertRaises(ValueError):
+            StreamingExportWriter({'xml': self.path("s.xml")})
+
+    def test_constant_memory(self):
+        """카드 수가 늘어도 최대 메모리 사용량이 늘지 않음"""
+        def peak(count):
+            def cards():
+                for i in range(count):
+                    yield Flashcard(f"질문 {i}?", f"답변 {i}", ["태그"])
+
+            tracemalloc.start()
+            with self.service.open_writer(self.path("m.txt"), self.path("m.csv"), self.path("m.json"),
+                                          self.path("m.jsonl")) as writer:
+                writer.write_cards(cards())
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak_bytes
+
+        small, large = peak(500), peak(5000)
+        self.assertLess(large, small * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,465 @@
+"""
+플래시카드 생성 서비스 테스트
+"""
+import unittest
+import sys
+import os
+import re
+import asyncio
+import hashlib
+import tempfile
+from typing import List, Dict
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.IService.llm_service_interface import ILLMService, current_llm_max_tokens
+from src.IService.pdf_reader_interface import IFileReaderService
+from src.Service.flashcard_generator_service import FlashcardGeneratorService
+from src.Utils.text_processor import TextProcessor
+from src.Utils import metrics
+
+
+GENERATION_RESPONSE = """Q: 파이썬은 무엇인가?
+A: 파이썬은 범용 프로그래밍 언어이다.
+Tags: 프로그래밍, 언어
+---
+Q: 파이썬은 무엇인가?
+A: 파이썬은 범용 프로그래밍 언어이다.
+Tags: 프로그래밍
+---
+Q: GIL은 무엇의 약자인가?
+A: Global Interpreter Lock
+Tags: 파이썬
+---"""
+
+
+class StubLLMService(ILLMService):
+    """고정 응답을 돌려주며 동시 호출 수를 기록하는 LLM 서비스"""
+
+    def __init__(self, score: str = "8", delay: float = 0.01):
+        self.score = score
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _respond(self, messages: List[Dict]) -> str:
+        self.calls += 1
+        content = messages[-1]["content"]
+        if "번호: 점수" in content:
+            count = len(re.findall(r'^\[\d+\]$', content, re.MULTILINE))
+            return "\n".join(f"{i + 1}: {self.score}" for i in range(count))
+        if "평가해주세요" in content:
+            return self.score
+        return GENERATION_RESPONSE
+
+    def call_api_with_retry(self, messages: List[Dict]) -> str:
+        return self._respond(messages)
+
+    async def acall_api_with_retry(self, messages: List[Dict]) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(messages)
+        finally:
+            self.in_flight -= 1
+
+    async def astream_api_with_retry(self, messages: List[Dict]):
+        """응답을 작은 조각으로 나누어 스트리밍"""
+        response = await self.acall_api_with_retry(messages)
+        for i in range(0, len(response), 7):
+            await asyncio.sleep(0)
+            yield response[i:i + 7]
+
+    def generate_prompt(self, system_prompt: str, user_prompt: str) -> List[Dict]:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+
+class SectionEchoLLMService(StubLLMService):
+    """섹션 텍스트를 그대로 질문에 담아 섹션마다 다른 카드를 만드는 LLM 서비스"""
+
+    def _respond(self, messages: List[Dict]) -> str:
+        content = messages[-1]["content"]
+        match = re.search(r'텍스트:\n(.*?)\n\n중요한 지침', content, re.DOTALL)
+        if not match:
+            return super()._respond(messages)
+        self.calls += 1
+        return f"Q: {match.group(1)} 무엇인가?\nA: 섹션 {match.group(1)} 내용\n---"
+
+
+class PackedEchoLLMService(SectionEchoLLMService):
+    """묶음 요청이면 섹션 번호별로 섹션 텍스트를 담은 카드를 만드는 LLM 서비스"""
+
+    def __init__(self):
+        super().__init__()
+        self.packed_requests = []
+        self.max_tokens = []
+
+    def _respond(self, messages: List[Dict]) -> str:
+        self.max_tokens.append(current_llm_max_tokens(0))
+        content = messages[-1]["content"]
+        sections = re.findall(r'^\[섹션 (\d+)\]\n.*?텍스트:\n(.*?)(?=\n\n\[섹션|\n\n중요한 지침)', content, re.DOTALL | re.MULTILINE)
+        if not sections:
+            return super()._respond(messages)
+        self.calls += 1
+        self.packed_requests.append(len(sections))
+        # 응답 순서를 섞어도 번호로 돌아가야 함
+        return "\n".join(f"Section: {number}\nQ: {text} 무엇인가?\nA: 섹션 {text} 내용\n---"
+                         for number, text in reversed(sections))
+
+
+class StubFileService(IFileReaderService):
+    """고정 텍스트를 돌려주는 파일 리더"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def read_file(self, file_path: str):
+        return self.text, {'file_name': file_path}
+
+
+class MultiFileService(IFileReaderService):
+    """파일 경로별 고정 텍스트를 돌려주는 파일 리더 (없는 파일은 오류)"""
+
+    def __init__(self, texts: Dict[str, str]):
+        self.texts = texts
+
+    def read_file(self, file_path: str):
+        if file_path not in self.texts:
+            raise FileNotFoundError(file_path)
+        return self.texts[file_path], {'file_name': file_path}
+
+
+class TestFlashcardGeneratorService(unittest.TestCase):
+    """FlashcardGeneratorService 클래스 테스트"""
+
+    def setUp(self):
+        self.config = LLMConfig()
+        self.config.min_card_quality = 0.7
+        self.config.max_concurrency = 2
+        self.config.quality_batch_enabled = True
+        self.config.heuristic_filter_enabled = False
+        self.config.job_journal_enabled = False
+
+        # 토큰 수 추정은 인코딩 다운로드 없이 근사값 사용
+        patcher = mock.patch.object(TextProcessor, 'estimate_tokens', side_effect=lambda text, *a: len(text) // 4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_generate_cards_from_section(self):
+        """동기 래퍼로 섹션 처리: 중복 제거 및 출처 태그 추가"""
+        llm = StubLLMService()
+        service = FlashcardGeneratorService(llm, None, self.config)
+        metrics.CARDS.clear()
+
+        cards = service.generate_cards_from_section("텍스트", {'file_name': 'doc.pdf'})
+
+        self.assertEqual(len(cards), 2)
+        self.assertEqual(cards[0].question, "파이썬은 무엇인가?")
+        self.assertIn("source:doc.pdf", cards[0].tags)
+        # 생성 1회 + 배치 평가 1회
+        self.assertEqual(llm.calls, 2)
+        # 중복 카드 1장은 제외로 집계
+        self.assertEqual(service.stats.snapshot()['rejected_cards'], 1)
+        self.assertEqual([metrics.CARDS.get(stage=stage) for stage in ('parsed', 'accepted', 'rejected')], [3, 2, 1])
+
+    def test_heuristic_filter_skips_llm_scoring(self):
+        """원문에 근거한 카드는 휴리스틱 필터가 통과시켜 LLM 평가를 생략"""
+        self.config.heuristic_filter_enabled = True
+        llm = StubLLMService(score="3")
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        source = "파이썬은 범용 프로그래밍 언어이다. GIL은 Global Interpreter Lock의 약자이다."
+        cards = service.generate_cards_from_section(source, {})
+
+        self.assertEqual(len(cards), 2)
+        self.assertEqual(llm.calls, 1)
+        self.assertEqual(service.get_filter_stats()['verdicts'], {'accept': 2})
+
+    def test_streaming_matches_non_streaming(self):
+        """스트리밍 모드도 같은 카드를 생성"""
+        self.config.llm_streaming = True
+        self.config.stream_score_batch_size = 1
+        llm = StubLLMService()
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        cards = service.generate_cards_from_section("텍스트", {'file_name': 'doc.pdf'})
+
+        self.assertEqual([card.question for card in cards], ["파이썬은 무엇인가?", "GIL은 무엇의 약자인가?"])
+        self.assertEqual(cards[1].tags, ["파이썬", "source:doc.pdf"])
+
+    def test_low_quality_cards_rejected(self):
+        """품질 점수가 기준 미만이면 제외"""
+        llm = StubLLMService(score="3")
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        self.assertEqual(service.generate_cards_from_section("텍스트", {}), [])
+
+    def test_concurrency_limited_by_semaphore(self):
+        """여러 섹션을 동시에 처리해도 진행 중 요청 수는 max_concurrency 이하"""
+        llm = StubLLMService()
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        async def run():
+            return await asyncio.gather(
+                *(service.agenerate_cards_from_section(f"텍스트 {i}", {}) for i in range(5))
+            )
+
+        asyncio.run(run())
+        self.assertLessEqual(llm.max_in_flight, 2)
+        self.assertEqual(llm.max_in_flight, 2)
+
+    def test_rejected_card_does_not_block_concurrent_paraphrase(self):
+        """동시에 처리되는 섹션의 비슷한 카드 중 하나가 평가에서 탈락해도 다른 하나는 채택"""
+        answer = "Global Interpreter Lock의 약자로 한 번에 한 스레드만 파이썬 바이트코드를 실행하게 하는 잠금이다"
+        questions = {"첫 섹션": "파이썬의 GIL은 무엇인가?", "둘째 섹션": "파이썬에서 GIL은 무엇인가?"}
+
+        class ParaphraseLLMService(StubLLMService):
+            def _respond(self, messages: List[Dict]) -> str:
+                content = messages[-1]["content"]
+                if "번호: 점수" in content:
+                    # 첫 섹션의 표현만 낮은 점수
+                    cards = re.findall(r'^\[(\d+)\]\n질문: (.*)$', content, re.MULTILINE)
+                    return "\n".join(f"{number}: {3 if question == questions['첫 섹션'] else 9}"
+                                     for number, question in cards)
+                section = re.search(r'텍스트:\n(.*?)\n\n중요한 지침', content, re.DOTALL).group(1)
+                return f"Q: {questions[section]}\nA: {answer}\n---"
+
+        llm = ParaphraseLLMService()
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        async def run():
+            return await asyncio.gather(
+                *(service.agenerate_cards_from_section(section, {}) for section in questions)
+            )
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, [])
+        self.assertEqual([card.question for card in second], [questions["둘째 섹션"]])
+        # 탈락한 카드는 인덱스에 남지 않음
+        self.assertEqual(len(service.dedup_index), 1)
+
+
+class TestSectionPipeline(unittest.TestCase):
+    """섹션 단위 스트리밍 파이프라인 테스트"""
+
+    def setUp(self):
+        self.config = LLMConfig()
+        self.config.min_card_quality = 0.7
+        self.config.max_concurrency = 2
+        self.config.pipeline_max_pending_sections = 3
+        self.config.heuristic_filter_enabled = False
+        self.config.job_journal_enabled = False
+
+        # 한 문장이 max_tokens(1500)를 넘도록 해 문장마다 한 섹션이 되게 함
+        self.batches = []
+
+        def count_tokens(texts, *a):
+            self.batches.append(len(texts))
+            return [1500 for _ in texts]
+
+        for name, kwargs in (('count_tokens_batch', {'side_effect': count_tokens}),
+                             ('estimate_tokens', {'side_effect': lambda text, *a: len(text) // 4})):
+            patcher = mock.patch.object(TextProcessor, name, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.text = " ".join(f"s{i}." for i in range(5000))
+
+    def test_preview_reads_only_needed_sections(self):
+        """처음 3개 섹션만 처리하고 나머지 문장은 토큰화하지 않음"""
+        llm = SectionEchoLLMService()
+        service = FlashcardGeneratorService(llm, StubFileService(self.text), self.config)
+
+        cards = service.generate_cards_from_pdf("doc.txt")
+
+        self.assertEqual([card.question for card in cards], ["s0. 무엇인가?", "s1. 무엇인가?", "s2. 무엇인가?"])
+        self.assertEqual(self.batches, [TextProcessor.LAZY_ENCODE_BATCH_SIZE])
+
+    def test_sections_in_order_with_bounded_window(self):
+        """결과는 섹션 순서대로 전달되고 진행 중인 섹션 수는 창 크기 이하"""
+        # 유사 중복으로 걸리지 않도록 섹션마다 전혀 다른 문장 사용
+        sentences = [hashlib.md5(str(i).encode()).hexdigest() + "." for i in range(20)]
+        llm = SectionEchoLLMService()
+        service = FlashcardGeneratorService(llm, StubFileService(" ".join(sentences)), self.config)
+        written = []
+
+        cards = service.generate_cards_from_pdf("doc.txt", process_all=True, on_cards=written.extend)
+
+        self.assertEqual([card.question for card in written], [f"{sentence} 무엇인가?" for sentence in sentences])
+        self.assertEqual(written, cards)
+        self.assertLessEqual(llm.max_in_flight, 2)
+
+    def test_failed_section_skipped(self):
+        """실패한 섹션은 건너뛰고 나머지는 계속 처리"""
+        llm = SectionEchoLLMService()
+        original = llm._respond
+
+        def respond(messages):
+            if "s1." in messages[-1]["content"] and "무엇인가" not in messages[-1]["content"]:
+                raise RuntimeError("provider down")
+            return original(messages)
+
+        llm._respond = respond
+        service = FlashcardGeneratorService(llm, StubFileService(self.text), self.config)
+
+        cards = service.generate_cards_from_pdf("doc.txt")
+
+        self.assertEqual([card.question for card in cards], ["s0. 무엇인가?", "s2. 무엇인가?"])
+
+    def test_resume_skips_completed_sections(self):
+        """중단 후 다시 실행하면 저널에 완료된 섹션은 LLM 호출 없이 재사용"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.config.job_journal_enabled = True
+        self.config.job_journal_path = os.path.join(tmp_dir.name, 'journal.jsonl')
+        sentences = [hashlib.md5(str(i).encode()).hexdigest() + "." for i in range(6)]
+        file_service = StubFileService(" ".join(sentences))
+
+        # 첫 실행은 4번째 섹션에서 실패
+        llm = SectionEchoLLMService()
+        original = llm._respond
+
+        def respond(messages):
+            if sentences[3] in messages[-1]["content"] and "무엇인가" not in messages[-1]["content"]:
+                raise RuntimeError("provider down")
+            return original(messages)
+
+        llm._respond = respond
+        first = FlashcardGeneratorService(llm, file_service, self.config)
+        first_cards = first.generate_cards_from_pdf("doc.txt", process_all=True)
+        first.journal.close()
+        self.assertEqual(len(first_cards), 5)
+
+        llm = SectionEchoLLMService()
+        second = FlashcardGeneratorService(llm, file_service, self.config)
+        self.addCleanup(second.journal.close)
+        cards = second.generate_cards_from_pdf("doc.txt", process_all=True)
+
+        self.assertEqual([card.question for card in cards], [f"{sentence} 무엇인가?" for sentence in sentences])
+        # 실패했던 섹션의 생성 1회 + 평가 1회만 호출
+        self.assertEqual(llm.calls, 2)
+        self.assertEqual(second.journal.get_stats()['replayed'], 5)
+        # 모든 섹션이 끝난 파일의 기록은 삭제
+        self.assertEqual(second.journal.get_stats()['completed_sections'], 0)
+
+    def test_config_change_regenerates_journaled_sections(self):
+        """모델 등 생성 설정이 바뀌면 저널의 카드를 재사용하지 않고 다시 생성"""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.config.job_journal_enabled = True
+        self.config.job_journal_path = os.path.join(tmp_dir.name, 'journal.jsonl')
+        sentences = [hashlib.md5(str(i).encode()).hexdigest() + "." for i in range(4)]
+        file_service = StubFileService(" ".join(sentences))
+
+        llm = SectionEchoLLMService()
+        original = llm._respond
+
+        def respond(messages):
+            if sentences[3] in messages[-1]["content"] and "무엇인가" not in messages[-1]["content"]:
+                raise RuntimeError("provider down")
+            return original(messages)
+
+        llm._respond = respond
+        first = FlashcardGeneratorService(llm, file_service, self.config)
+        first.generate_cards_from_pdf("doc.txt", process_all=True)
+        first.journal.close()
+
+        self.config.ollama_model = self.config.ollama_model + "-changed"
+        llm = SectionEchoLLMService()
+        second = FlashcardGeneratorService(llm, file_service, self.config)
+        self.addCleanup(second.journal.close)
+        cards = second.generate_cards_from_pdf("doc.txt", process_all=True)
+
+        self.assertEqual(len(cards), 4)
+        self.assertEqual(second.journal.get_stats()['replayed'], 0)
+
+    def test_files_share_concurrency_budget(self):
+        """여러 파일의 섹션이 같은 동시 요청 제한을 공유하고 파일별 결과를 반환"""
+        texts = {
+            f"doc{n}.txt": " ".join(hashlib.md5(f"{n}-{i}".encode()).hexdigest() + "." for i in range(4))
+            for n in range(3)
+        }
+        llm = SectionEchoLLMService()
+        service = FlashcardGeneratorService(llm, MultiFileService(texts), self.config)
+        written = {}
+
+        results = service.generate_cards_from_files(
+            list(texts) + ["missing.txt"], process_all=True, max_parallel_files=2,
+            on_cards=lambda file_path, cards: written.setdefault(file_path, []).extend(cards)
+        )
+
+        self.assertEqual(list(results), list(texts) + ["missing.txt"])
+        for file_path in texts:
+            self.assertEqual(results[file_path], {'cards': 4, 'failed_sections': [], 'error': None})
+            self.assertEqual(len(written[file_path]), 4)
+        self.assertEqual(results["missing.txt"]['cards'], 0)
+        self.assertIn("missing.txt", results["missing.txt"]['error'])
+        self.assertEqual(llm.max_in_flight, 2)
+
+        stats = service.stats.snapshot()
+        self.assertEqual((stats['files_done'], stats['files_failed']), (4, 1))
+        self.assertEqual(stats['total_cards'], 12)
+        self.assertEqual(stats['sections_done'], 12)
+        self.assertEqual(stats['sections_remaining'], 0)
+        self.assertAlmostEqual(stats['progress'], 1.0)
+
+    def test_small_sections_packed_across_files(self):
+        """작은 섹션은 여러 파일에 걸쳐 한 번의 요청으로 묶이고 카드는 원래 파일로 돌아감"""
+        self.config.section_packing_enabled = True
+        self.config.pack_max_tokens = 1500
+        self.config.pack_max_sections = 4
+        self.config.pack_linger_seconds = 0.2
+        texts = {f"note{n}.md": hashlib.md5(f"note-{n}".encode()).hexdigest() + "." for n in range(4)}
+        llm = PackedEchoLLMService()
+        service = FlashcardGeneratorService(llm, MultiFileService(texts), self.config)
+        written = {}
+
+        results = service.generate_cards_from_files(
+            list(texts), process_all=True, max_parallel_files=4,
+            on_cards=lambda file_path, cards: written.setdefault(file_path, []).extend(cards)
+        )
+
+        self.assertEqual(llm.packed_requests, [4])
+        self.assertEqual(service.get_packing_stats()['requests'], 1)
+        for file_path, text in texts.items():
+            self.assertEqual(results[file_path]['cards'], 1)
+            card = written[file_path][0]
+            self.assertEqual(card.question, f"{text} 무엇인가?")
+            self.assertEqual(card.tags, [f"source:{file_path}"])
+        self.assertEqual(service.stats.snapshot()['total_cards'], 4)
+
+    def test_packed_completion_budget_grows_with_pack(self):
+        """묶음 요청의 최대 응답 토큰은 섹션 수만큼 늘어나고 PACK_MAX_OUTPUT_TOKENS로 제한"""
+        self.config.max_tokens = 1000
+        self.config.pack_max_output_tokens = 2500
+        llm = PackedEchoLLMService()
+        service = FlashcardGeneratorService(llm, None, self.config)
+
+        for count in (1, 2, 3):
+            asyncio.run(service._agenerate_packed([(f"섹션{i}", {'file_name': 'a.md'}) for i in range(count)]))
+
+        self.assertEqual(llm.max_tokens, [1000, 2000, 2500])
+        # 요청 밖에서는 설정값 사용
+        self.assertEqual(current_llm_max_tokens(self.config.max_tokens), 1000)
+
+    def test_unlabeled_packed_cards_dropped(self):
+        service = FlashcardGeneratorService(StubLLMService(), None, self.config)
+        response = "Section: 2\nQ: 질문 하나?\nA: 답변 하나\n---\nQ: 번호 없는 질문?\nA: 답변\n---\nSection: 9\nQ: 범위 밖?\nA: 답변\n---"
+
+        cards = service._parse_packed_flashcards(response, [{'file_name': 'a.md'}, {'file_name': 'b.md'}])
+
+        self.assertEqual([len(section_cards) for section_cards in cards], [0, 1])
+        self.assertEqual(cards[1][0].tags, ["source:b.md"])
+        self.assertEqual(service.stats.snapshot()['rejected_cards'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+공유 연결 풀 HTTP 세션 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.http_pool import PooledHTTPSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """keep-alive 응답을 보내고 요청을 보낸 클라이언트 포트를 기록하는 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.client_ports.append(self.client_address[1])
+        if self.path == '/slow':
+            time.sleep(0.5)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPooledHTTPSession(unittest.TestCase):
+    """PooledHTTPSession 클래스 테스트"""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.server.daemon_threads = True
+        self.server.client_ports = []
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def make_session(self, **kwargs):
+        session = PooledHTTPSession(**kwargs)
+        self.addCleanup(session.close)
+        return session
+
+    def test_connection_reused(self):
+        """같은 스레드의 연속 요청은 연결 하나를 재사용"""
+        session = self.make_session(pool_size=2)
+        for _ in range(5):
+            self.assertEqual(session.post(self.url + "/api", json={}).json(), {"ok": True})
+
+        self.assertEqual(len(set(self.server.client_ports)), 1)
+        stats = session.get_stats()
+        self.assertEqual((stats['requests'], stats['connections_opened'], stats['connections_reused']), (5, 1, 4))
+        self.assertAlmostEqual(stats['reuse_rate'], 0.8)
+
+    def test_threads_share_bounded_pool(self):
+        """여러 스레드가 같은 풀을 공유하고 연결 수는 pool_size 이하"""
+        session = self.make_session(pool_size=2)
+
+        def worker():
+            for _ in range(3):
+                session.post(self.url + "/api", json={})
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = session.get_stats()
+        self.assertEqual(stats['requests'], 12)
+        self.assertLessEqual(stats['connections_opened'], 2)
+        self.assertEqual(stats['connections_opened'] + stats['connections_reused'], 12)
+        self.assertLessEqual(len(set(self.server.client_ports)), 2)
+
+    def test_configured_timeout_applied(self):
+        """post에 설정된 (연결, 읽기) 타임아웃을 적용하고, 직접 넘긴 값은 그대로 사용"""
+        session = self.make_session(connect_timeout=3.0, read_timeout=0.1)
+        with mock.patch.object(requests.Session, 'post', return_value=mock.Mock()) as post:
+            session.post(self.url + "/api", json={})
+            session.post(self.url + "/api", json={}, timeout=30)
+        self.assertEqual([call[1]['timeout'] for call in post.call_args_list], [(3.0, 0.1), 30])
+
+        with self.assertRaises(requests.ReadTimeout):
+            session.post(self.url + "/slow", json={})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+작업 저널 테스트
+"""
+import unittest
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Utils.job_journal import JobJournal
+
+
+CARDS = [Flashcard("질문?", "답변", ["태그"]), Flashcard("Q2?", "A2", [], notes="메모")]
+
+
+class TestJobJournal(unittest.TestCase):
+    """JobJournal 클래스 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'journal.jsonl')
+
+    def open_journal(self):
+        journal = JobJournal(self.path)
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_done_sections_survive_restart(self):
+        """완료된 섹션의 카드는 다시 연 저널에서 그대로 조회"""
+        journal = JobJournal(self.path)
+        journal.record_done("doc.pdf", 0, "h0", CARDS)
+        journal.record_failed("doc.pdf", 1, "h1", "provider down")
+        journal.record_done("doc.pdf", 2, "h2", [])
+        journal.close()
+
+        reopened = self.open_journal()
+        self.assertEqual(reopened.get_done("doc.pdf", 0, "h0"), CARDS)
+        self.assertEqual(reopened.get_done("doc.pdf", 2, "h2"), [])
+        self.assertIsNone(reopened.get_done("doc.pdf", 1, "h1"))
+        self.assertEqual(reopened.get_stats()['completed_sections'], 2)
+
+    def test_changed_section_not_reused(self):
+        """섹션 내용 해시가 다르면 다시 처리"""
+        journal = self.open_journal()
+        journal.record_done("doc.pdf", 0, "old", CARDS)
+        self.assertIsNone(journal.get_done("doc.pdf", 0, "new"))
+
+    def test_truncated_last_line_ignored(self):
+        """비정상 종료로 잘린 마지막 줄은 무시하고 이후 기록은 정상"""
+        journal = JobJournal(self.path)
+        journal.record_done("doc.pdf", 0, "h0", CARDS)
+        journal.close()
+        with open(self.path, 'ab') as f:
+            f.write(b'{"file": "doc.pdf", "section": 1, "hash": "h1", "status": "do')
+
+        reopened = JobJournal(self.path)
+        reopened.record_done("doc.pdf", 1, "h1", CARDS[:1])
+        reopened.close()
+
+        journal = self.open_journal()
+        self.assertEqual(journal.get_done("doc.pdf", 0, "h0"), CARDS)
+        self.assertEqual(journal.get_done("doc.pdf", 1, "h1"), CARDS[:1])
+
+    def test_clear_file(self):
+        """파일 단위로 완료 기록 삭제"""
+        journal = JobJournal(self.path)
+        journal.record_done("a.pdf", 0, "h", CARDS)
+        journal.record_done("b.pdf", 0, "h", CARDS)
+        journal.clear("a.pdf")
+        journal.close()
+
+        reopened = self.open_journal()
+        self.assertIsNone(reopened.get_done("a.pdf", 0, "h"))
+        self.assertEqual(reopened.get_done("b.pdf", 0, "h"), CARDS)
+
+    def test_clearing_last_file_empties_journal(self):
+        journal = self.open_journal()
+        journal.record_done("a.pdf", 0, "h", CARDS)
+        journal.clear("a.pdf")
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+    def test_stale_records_compacted_on_open(self):
+        """다시 열면 대체·삭제·실패 기록은 지우고 완료 기록만 남김"""
+        journal = JobJournal(self.path)
+        journal.record_done("a.pdf", 0, "old", CARDS)
+        journal.record_done("a.pdf", 0, "new", CARDS[:1])
+        journal.record_failed("a.pdf", 1, "h1", "provider down")
+        journal.record_done("b.pdf", 0, "h", CARDS)
+        journal.clear("b.pdf")
+        journal.close()
+
+        reopened = self.open_journal()
+        with open(self.path, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 1)
+        self.assertEqual(reopened.get_done("a.pdf", 0, "new"), CARDS[:1])
+        self.assertIsNone(reopened.get_done("b.pdf", 0, "h"))
+
+    def test_section_hash_includes_fingerprint(self):
+        self.assertEqual(JobJournal.section_hash("텍스트", "설정"), JobJournal.section_hash("텍스트", "설정"))
+        self.assertNotEqual(JobJournal.section_hash("텍스트", "설정"), JobJournal.section_hash("텍스트", "다른 설정"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+LLM 응답 캐시 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import tempfile
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.Service.llm_service import LLMService
+from src.Utils.llm_cache import LLMResponseCache
+
+
+MESSAGES = [
+    {"role": "system", "content": "시스템"},
+    {"role": "user", "content": "질문"}
+]
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """LLMResponseCache 클래스 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_hit_and_miss(self):
+        """저장 후 조회 시 적중, 미저장 키는 미스"""
+        cache = LLMResponseCache(self.path)
+        key = LLMResponseCache.make_key('ollama', 'llama3.2', 0.3, 2048, MESSAGES)
+
+        self.assertIsNone(cache.get(key))
+        cache.set(key, "응답")
+        self.assertEqual(cache.get(key), "응답")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+        cache.close()
+
+    def test_key_depends_on_request(self):
+        """파라미터나 메시지가 바뀌면 다른 키"""
+        base = LLMResponseCache.make_key('ollama', 'llama3.2', 0.3, 2048, MESSAGES)
+        self.assertEqual(base, LLMResponseCache.make_key('ollama', 'llama3.2', 0.3, 2048, list(MESSAGES)))
+        self.assertNotEqual(base, LLMResponseCache.make_key('openai', 'llama3.2', 0.3, 2048, MESSAGES))
+        self.assertNotEqual(base, LLMResponseCache.make_key('ollama', 'llama3.2', 0.5, 2048, MESSAGES))
+        self.assertNotEqual(base, LLMResponseCache.make_key('ollama', 'llama3.2', 0.3, 1024, MESSAGES))
+        changed = [MESSAGES[0], {"role": "user", "content": "다른 질문"}]
+        self.assertNotEqual(base, LLMResponseCache.make_key('ollama', 'llama3.2', 0.3, 2048, changed))
+
+    def test_persistence(self):
+        """다른 인스턴스에서도 저장된 응답 조회"""
+        cache = LLMResponseCache(self.path)
+        cache.set('k', "응답")
+        cache.close()
+
+        reopened = LLMResponseCache(self.path)
+        self.assertEqual(reopened.get('k'), "응답")
+        reopened.close()
+
+    def test_bypass_and_refresh_modes(self):
+        """bypass는 읽기/쓰기 모두 생략, refresh는 쓰기만 수행"""
+        cache = LLMResponseCache(self.path)
+        cache.set('k', "이전 응답")
+        cache.close()
+
+        bypass = LLMResponseCache(self.path, mode='bypass')
+        self.assertIsNone(bypass.get('k'))
+        bypass.set('k', "무시됨")
+        bypass.close()
+
+        refresh = LLMResponseCache(self.path, mode='refresh')
+        self.assertIsNone(refresh.get('k'))
+        refresh.set('k', "새 응답")
+        refresh.close()
+
+        cache = LLMResponseCache(self.path)
+        self.assertEqual(cache.get('k'), "새 응답")
+        cache.close()
+
+    def test_age_eviction(self):
+        """만료된 항목은 미스로 처리되고 정리됨"""
+        cache = LLMResponseCache(self.path, max_age_days=1)
+        cache.set('k', "응답")
+
+        with mock.patch('src.Utils.llm_cache.time.time', return_value=time.time() + 2 * 24 * 3600):
+            self.assertIsNone(cache.get('k'))
+            self.assertEqual(cache.evict(), 1)
+        self.assertEqual(cache.get_stats()['entries'], 0)
+        cache.close()
+
+    def test_size_eviction_removes_least_recently_used(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제"""
+        cache = LLMResponseCache(self.path, max_size_mb=1.5 / 1024)  # 1.5KB
+        cache.set('old', "a" * 700)
+        cache.set('new', "b" * 700)
+        cache.get('old')  # old를 최근 사용으로 갱신
+        cache.set('newest', "c" * 700)
+        cache.evict()
+
+        self.assertIsNotNone(cache.get('old'))
+        self.assertIsNone(cache.get('new'))
+        self.assertIsNotNone(cache.get('newest'))
+        cache.close()
+
+    def test_invalid_mode(self):
+        """지원되지 않는 모드는 오류"""
+        with self.assertRaises(ValueError):
+            LLMResponseCache(self.path, mode='invalid')
+
+
+class TestLLMServiceCache(unittest.TestCase):
+    """LLMService의 캐시 연동 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = LLMConfig()
+        self.config.provider = 'ollama'
+        self.config.ollama_warmup = False
+        self.config.llm_cache_enabled = True
+        self.config.llm_cache_mode = 'use'
+        self.config.llm_cache_path = os.path.join(self.tmp_dir.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_second_call_served_from_cache(self):
+        """동일한 요청은 제공자를 다시 호출하지 않음"""
+        service = LLMService(self.config)
+        with mock.patch.object(service, '_call_ollama', return_value="응답") as call:
+            self.assertEqual(service.call_api_with_retry(MESSAGES), "응답")
+            self.assertEqual(service.call_api_with_retry(MESSAGES), "응답")
+            self.assertEqual(call.call_count, 1)
+
+        self.assertEqual(service.get_cache_stats()['hits'], 1)
+
+    def test_changed_parameters_miss(self):
+        """온도가 바뀌면 다시 호출"""
+        service = LLMService(self.config)
+        with mock.patch.object(service, '_call_ollama', return_value="응답") as call:
+            service.call_api_with_retry(MESSAGES)
+            self.config.temperature += 0.1
+            service.call_api_with_retry(MESSAGES)
+            self.assertEqual(call.call_count, 2)
+
+    def test_ollama_api_in_key(self):
+        """Ollama /api/chat과 /api/generate 응답은 따로 캐시"""
+        service = LLMService(self.config)
+        with mock.patch.object(service, '_call_ollama', return_value="응답") as call:
+            service.call_api_with_retry(MESSAGES)
+            self.config.ollama_api = 'generate' if self.config.ollama_api == 'chat' else 'chat'
+            service.call_api_with_retry(MESSAGES)
+            self.assertEqual(call.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
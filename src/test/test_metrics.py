@@ -0,0 +1,154 @@
+"""
+처리 지표 테스트
+"""
+import unittest
+import sys
+import os
+import socket
+import asyncio
+import tempfile
+import urllib.request
+from unittest import mock
+
+import requests
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.Service.llm_service import LLMService
+from src.Utils import metrics
+from src.Utils.metrics import MetricsRegistry, MetricsExporter, llm_purpose, current_llm_purpose
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """MetricsRegistry 클래스 테스트"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_render(self):
+        """레이블별 값과 HELP/TYPE 줄을 텍스트 형식으로 출력"""
+        counter = self.registry.counter('cards_total', '카드 수', ['stage'])
+        gauge = self.registry.gauge('in_flight', '진행 중인 요청')
+        counter.inc(3, stage='accepted')
+        counter.inc(stage='accepted')
+        counter.inc(2, stage='rejected')
+        gauge.set(1.5)
+
+        text = self.registry.render()
+        self.assertIn('# TYPE cards_total counter', text)
+        self.assertIn('cards_total{stage="accepted"} 4', text)
+        self.assertIn('cards_total{stage="rejected"} 2', text)
+        self.assertIn('# TYPE in_flight gauge', text)
+        self.assertIn('in_flight 1.5', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """구간별 개수는 누적되고 +Inf는 전체 개수와 같음"""
+        histogram = self.registry.histogram('latency_seconds', '지연', ['provider'], buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.7, 3):
+            histogram.observe(value, provider='ollama')
+
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{provider="ollama",le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{provider="ollama",le="1"} 3', text)
+        self.assertIn('latency_seconds_bucket{provider="ollama",le="+Inf"} 4', text)
+        self.assertIn('latency_seconds_sum{provider="ollama"} 4.25', text)
+        self.assertIn('latency_seconds_count{provider="ollama"} 4', text)
+
+    def test_labels_are_validated_and_escaped(self):
+        counter = self.registry.counter('errors_total', '오류', ['reason'])
+        with self.assertRaises(ValueError):
+            counter.inc(kind='x')
+        counter.inc(reason='say "hi"\n')
+        self.assertIn('errors_total{reason="say \\"hi\\"\\n"} 1', self.registry.render())
+
+    def test_duplicate_name_rejected(self):
+        self.registry.counter('a_total', 'a')
+        with self.assertRaises(ValueError):
+            self.registry.gauge('a_total', 'a')
+
+    def test_write_textfile_replaces_atomically(self):
+        """임시 파일 없이 최종 파일만 남음"""
+        self.registry.counter('runs_total', '실행 수').inc()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'nested', 'metrics.prom')
+            self.registry.write_textfile(path)
+            self.registry.write_textfile(path)
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['metrics.prom'])
+            with open(path, encoding='utf-8') as f:
+                self.assertIn('runs_total 1', f.read())
+
+
+class TestMetricsExporter(unittest.TestCase):
+    """MetricsExporter 클래스 테스트"""
+
+    def test_writes_on_stop_and_serves_localhost(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('sections_total', '섹션 수')
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'metrics.prom')
+            with MetricsExporter(path, interval=60, port=port, registry=registry):
+                counter.inc(2)
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics') as response:
+                    self.assertIn('sections_total 2', response.read().decode('utf-8'))
+                counter.inc()
+
+            # 끝날 때 마지막 값 기록
+            with open(path, encoding='utf-8') as f:
+                self.assertIn('sections_total 3', f.read())
+
+
+class TestLLMMetrics(unittest.TestCase):
+    """LLMService 호출 지표 테스트"""
+
+    def setUp(self):
+        metrics.REGISTRY.clear()
+        self.config = LLMConfig()
+        self.config.provider = 'ollama'
+        self.config.ollama_warmup = False
+        self.config.llm_cache_enabled = False
+        self.config.max_retries = 3
+
+    def test_purpose_propagates_to_tasks(self):
+        async def run():
+            with llm_purpose('scoring'):
+                return await asyncio.gather(asyncio.create_task(asyncio.sleep(0, current_llm_purpose())))
+
+        self.assertEqual(asyncio.run(run()), ['scoring'])
+        self.assertEqual(current_llm_purpose(), 'generation')
+
+    def test_latency_retries_and_tokens_by_purpose(self):
+        """시도마다 지연 시간, 재시도 수, 응답의 토큰 수를 목적별로 기록"""
+        service = LLMService(self.config)
+        response = mock.Mock()
+        response.json.return_value = {'response': '응답', 'prompt_eval_count': 120, 'eval_count': 30}
+        calls = [requests.ConnectionError("연결 실패"), response]
+        messages = [{"role": "user", "content": "x"}]
+
+        with mock.patch.object(service.http, 'post', side_effect=lambda *args, **kwargs: self._next(calls)), \
+                mock.patch('src.Service.llm_service.time.sleep'), llm_purpose('scoring'):
+            self.assertEqual(service.call_api_with_retry(messages), '응답')
+
+        labels = {'provider': 'ollama', 'purpose': 'scoring'}
+        self.assertEqual(metrics.LLM_REQUEST_SECONDS.get_count(outcome='error', **labels), 1)
+        self.assertEqual(metrics.LLM_REQUEST_SECONDS.get_count(outcome='success', **labels), 1)
+        self.assertEqual(metrics.LLM_RETRIES.get(**labels), 1)
+        self.assertEqual(metrics.LLM_TOKENS.get(type='prompt', **labels), 120)
+        self.assertEqual(metrics.LLM_TOKENS.get(type='completion', **labels), 30)
+        self.assertEqual(metrics.LLM_REQUEST_SECONDS.get_count(provider='ollama', purpose='generation', outcome='success'), 0)
+
+    @staticmethod
+    def _next(calls):
+        result = calls.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+if __name__ == '__main__':
+    unittest.main()
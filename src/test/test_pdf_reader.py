@@ -0,0 +1,162 @@
+"""
+파일 리더 서비스 테스트
+"""
+import unittest
+import sys
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.Service import pdf_reader_service
+from src.Service.pdf_reader_service import FileReaderService
+
+
+def write_pdf(path, page_texts):
+    """페이지마다 한 줄의 텍스트가 있는 최소 PDF 작성"""
+    count = len(page_texts)
+    font_id = 3 + 2 * count
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            " ".join(f"{3 + 2 * i} 0 R" for i in range(count)), count)
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {4 + 2 * i} 0 R /Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    data += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class TestPdfExtraction(unittest.TestCase):
+    """PDF 페이지 추출 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "book.pdf")
+        self.pages = [f"Page {i} text" for i in range(12)]
+        write_pdf(self.path, self.pages)
+
+    def make_service(self, workers, min_pages, cache=False):
+        config = LLMConfig()
+        config.pdf_extract_workers = workers
+        config.pdf_parallel_min_pages = min_pages
+        config.text_cache_enabled = cache
+        config.text_cache_path = os.path.join(self.temp_dir.name, "text.sqlite")
+        service = FileReaderService(config)
+        self.addCleanup(service.close)
+        return service
+
+    def test_parallel_matches_serial(self):
+        """프로세스 풀 추출도 페이지 순서와 결과가 순차 추출과 동일"""
+        serial_text, serial_meta = self.make_service(1, 0).read_file(self.path)
+        service = self.make_service(3, 4)
+        parallel_text, parallel_meta = service.read_file(self.path)
+
+        self.assertEqual(serial_text, " ".join(self.pages))
+        self.assertEqual(parallel_text, serial_text)
+        self.assertEqual(parallel_meta, serial_meta)
+        self.assertEqual(len(service.last_page_timings), 12)
+
+    def test_pool_reused_across_files(self):
+        """프로세스 풀은 spawn 방식으로 한 번만 만들고 여러 파일에서 재사용"""
+        other = os.path.join(self.temp_dir.name, "other.pdf")
+        write_pdf(other, self.pages[:6])
+        service = self.make_service(2, 4)
+
+        with mock.patch('src.Service.pdf_reader_service.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as pool:
+            first, _ = service.read_file(self.path)
+            second, _ = service.read_file(other)
+
+        pool.assert_called_once()
+        self.assertEqual(pool.call_args[1]['mp_context'].get_start_method(), 'spawn')
+        self.assertEqual((first, second), (" ".join(self.pages), " ".join(self.pages[:6])))
+
+    def test_small_file_stays_serial(self):
+        """페이지 수가 기준 미만이면 프로세스 풀을 만들지 않음"""
+        service = self.make_service(4, 64)
+        with mock.patch('src.Service.pdf_reader_service.ProcessPoolExecutor') as pool:
+            text, _ = service.read_file(self.path)
+        pool.assert_not_called()
+        self.assertEqual(text, " ".join(self.pages))
+
+    def test_page_failure_skipped(self):
+        """읽기에 실패한 페이지만 건너뜀"""
+        original = FileReaderService._extract_pages_parallel
+
+        def fail_page_three(service, path, count):
+            results = original(service, path, count)
+            return [(i, "", t, "broken") if i == 3 else (i, text, t, e) for i, text, t, e in results]
+
+        with mock.patch.object(FileReaderService, '_extract_pages_parallel', fail_page_three):
+            text, _ = self.make_service(2, 4).read_file(self.path)
+
+        self.assertEqual(text, " ".join(page for i, page in enumerate(self.pages) if i != 3))
+
+    def test_unchanged_file_read_from_cache(self):
+        """내용이 같은 파일은 PDF를 다시 파싱하지 않고 캐시에서 읽음"""
+        first_text, first_meta = self.make_service(1, 0, cache=True).read_file(self.path)
+
+        service = self.make_service(1, 0, cache=True)
+        with mock.patch('src.Service.pdf_reader_service.PyPDF2.PdfReader') as reader:
+            text, meta = service.read_file(self.path)
+        reader.assert_not_called()
+
+        self.assertEqual((text, meta), (first_text, first_meta))
+        self.assertEqual(service.text_cache.get_stats()['hits'], 1)
+
+    def test_iter_text_extracts_only_consumed_pages(self):
+        """앞부분만 소비하면 나머지 페이지는 추출하지 않고, 끝까지 읽으면 read_file과 동일"""
+        service = self.make_service(1, 0, cache=True)
+        with mock.patch('src.Service.pdf_reader_service._extract_page',
+                        wraps=pdf_reader_service._extract_page) as extract:
+            chunks, metadata = service.iter_text(self.path)
+            next(chunks)
+            chunks.close()
+            self.assertLessEqual(extract.call_count, 2)
+        self.assertEqual(metadata['pages'], 12)
+        self.assertEqual(service.text_cache.get_stats()['entries'], 0)
+
+        chunks, _ = service.iter_text(self.path)
+        self.assertEqual("".join(chunks), self.make_service(1, 0).read_file(self.path)[0])
+        # 끝까지 읽은 결과는 캐시에 저장됨
+        self.assertEqual(service.text_cache.get_stats()['entries'], 1)
+
+    def test_incremental_cleaning_matches_full_cleaning(self):
+        """페이지 경계의 공백과 하이픈 단어도 한 번에 정리한 결과와 동일"""
+        service = self.make_service(1, 0)
+        cases = [
+            ["inter-", "national trade. ", "", "  Next   page"],
+            ["  leading", "a- b- c", "-", "trailing  \n"],
+            ["word-\n", "\t", "break", "end-", "-start"],
+            ["", "   ", ""],
+            ["한국어 문장.", "  다음-", "페이지"]
+        ]
+        for pages in cases:
+            expected = service._clean_text(" ".join(page for page in pages if page))
+            self.assertEqual("".join(service._iter_clean_text(pages)), expected, pages)
+
+
+if __name__ == '__main__':
+    unittest.main()
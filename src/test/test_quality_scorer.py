@@ -0,0 +1,107 @@
+"""
+배치 품질 평가 서비스 테스트
+"""
+import unittest
+import sys
+import os
+from typing import List, Dict
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.Entity.flashcard import Flashcard
+from src.Service.quality_scorer_service import QualityScorerService
+from src.Utils.text_processor import TextProcessor
+
+
+class RecordingLLM:
+    """요청을 기록하고 미리 정한 응답을 순서대로 돌려주는 LLM"""
+
+    def __init__(self, batch_response: str, single_response: str = "9"):
+        self.batch_response = batch_response
+        self.single_response = single_response
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def call_api_with_retry(self, messages: List[Dict]) -> str:
+        if "번호: 점수" in messages[-1]["content"]:
+            self.batch_calls += 1
+            return self.batch_response
+        self.single_calls += 1
+        return self.single_response
+
+    async def acall_api_with_retry(self, messages: List[Dict]) -> str:
+        return self.call_api_with_retry(messages)
+
+
+class TestQualityScorerService(unittest.TestCase):
+    """QualityScorerService 클래스 테스트"""
+
+    def setUp(self):
+        self.config = LLMConfig()
+        self.config.quality_batch_enabled = True
+        self.config.quality_batch_max_cards = 20
+        self.config.quality_batch_max_tokens = 3000
+        self.cards = [Flashcard(question=f"질문 {i}?", answer=f"답변 {i}") for i in range(3)]
+
+        # 토큰 수 추정은 인코딩 다운로드 없이 근사값 사용
+        patcher = mock.patch.object(TextProcessor, 'estimate_tokens', side_effect=lambda text, *a: len(text) // 4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parse_line_formats(self):
+        """다양한 줄 형식의 점수 파싱"""
+        response = "1: 8\n[2] - 7\n카드 3 = 6.5\n4번: 9"
+        self.assertEqual(QualityScorerService.parse_batch_scores(response, 4), [0.8, 0.7, 0.65, 0.9])
+
+    def test_parse_json_formats(self):
+        """JSON 객체/배열 형식의 점수 파싱"""
+        self.assertEqual(QualityScorerService.parse_batch_scores('{"1": 8, "2": 6}', 2), [0.8, 0.6])
+        self.assertEqual(QualityScorerService.parse_batch_scores('```json\n[5, 10]\n```', 2), [0.5, 1.0])
+
+    def test_parse_bracket_labels(self):
+        """프롬프트의 [번호] 표시를 따라 한 응답은 JSON이 아닌 줄 형식으로 파싱"""
+        self.assertEqual(QualityScorerService.parse_batch_scores('[1]: 8', 1), [0.8])
+        self.assertEqual(QualityScorerService.parse_batch_scores('[1] 8\n[2] 7', 2), [0.8, 0.7])
+
+    def test_parse_missing_and_out_of_range(self):
+        """누락되었거나 범위를 벗어난 점수는 None"""
+        self.assertEqual(QualityScorerService.parse_batch_scores("1: 8\n2: 42\n7: 5", 3), [0.8, None, None])
+
+    def test_single_call_for_batch(self):
+        """모든 점수를 파싱하면 배치 호출 1회로 끝남"""
+        llm = RecordingLLM("1: 8\n2: 7\n3: 6")
+        scores = QualityScorerService(llm, self.config).score_cards(self.cards)
+
+        self.assertEqual(scores, [0.8, 0.7, 0.6])
+        self.assertEqual((llm.batch_calls, llm.single_calls), (1, 0))
+
+    def test_fallback_only_for_unparsed_cards(self):
+        """점수를 찾지 못한 카드만 개별 평가"""
+        llm = RecordingLLM("1: 8\n3: 6", single_response="9")
+        scores = QualityScorerService(llm, self.config).score_cards(self.cards)
+
+        self.assertEqual(scores, [0.8, 0.9, 0.6])
+        self.assertEqual((llm.batch_calls, llm.single_calls), (1, 1))
+
+    def test_batches_split_by_card_limit(self):
+        """배치당 최대 카드 수를 넘으면 나누어 요청"""
+        self.config.quality_batch_max_cards = 2
+        llm = RecordingLLM("1: 8\n2: 8")
+        scores = QualityScorerService(llm, self.config).score_cards(self.cards)
+
+        self.assertEqual(llm.batch_calls, 2)
+        self.assertEqual(scores, [0.8, 0.8, 0.8])
+
+    def test_async_scoring(self):
+        """비동기 평가도 동일한 결과"""
+        import asyncio
+        llm = RecordingLLM("1: 8\n3: 6", single_response="9")
+        scores = asyncio.run(QualityScorerService(llm, self.config).ascore_cards(self.cards))
+        self.assertEqual(scores, [0.8, 0.9, 0.6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+속도 제한 및 적응형 동시성 테스트
+"""
+import unittest
+import sys
+import os
+import asyncio
+from unittest import mock
+
+import requests
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Config.llm_config import LLMConfig
+from src.Service.llm_service import LLMService
+from src.Utils.rate_limiter import TokenBucket, AdaptiveConcurrencyLimiter, compute_backoff, parse_retry_after
+
+
+def http_error(status: int, headers=None) -> requests.HTTPError:
+    """상태 코드와 헤더를 가진 requests.HTTPError 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status} Error", response=response)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """TokenBucket 클래스 테스트"""
+
+    def test_disabled_bucket_never_waits(self):
+        bucket = TokenBucket(0)
+        self.assertEqual(bucket.reserve(1000), 0.0)
+
+    def test_wait_after_capacity_exhausted(self):
+        """용량을 다 쓰면 보충 속도에 맞춰 대기"""
+        bucket = TokenBucket(60)  # 초당 1개
+        for _ in range(60):
+            self.assertEqual(bucket.reserve(1), 0.0)
+        self.assertAlmostEqual(bucket.reserve(1), 1.0, delta=0.05)
+        self.assertAlmostEqual(bucket.reserve(1), 2.0, delta=0.05)
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """AdaptiveConcurrencyLimiter 클래스 테스트"""
+
+    def test_additive_increase(self):
+        """성공이 이어지면 한도가 최대치까지 증가"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_multiplicative_decrease_on_overload(self):
+        """429 등 과부하에는 한도를 절반으로 (쿨다운 동안 한 번만)"""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_slow_latency_decreases(self):
+        """목표 지연 시간을 넘으면 한도 감소"""
+        limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=8, latency_target=1.0)
+        limiter.acquire()
+        limiter.release(latency=5.0)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_async_waiters_respect_limit(self):
+        """코루틴 동시 실행 수가 한도를 넘지 않음"""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        state = {'running': 0, 'peak': 0}
+
+        async def task():
+            await limiter.aacquire()
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+            await asyncio.sleep(0.01)
+            state['running'] -= 1
+            limiter.release(latency=0.01)
+
+        async def run():
+            await asyncio.gather(*(task() for _ in range(10)))
+
+        asyncio.run(run())
+        self.assertEqual(state['peak'], 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class TestBackoff(unittest.TestCase):
+    """재시도 대기 시간 계산 테스트"""
+
+    def test_retry_after_seconds_and_date(self):
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_backoff_honours_retry_after(self):
+        delay = compute_backoff(0, base_delay=1, max_delay=60, retry_after=10)
+        self.assertGreaterEqual(delay, 10)
+        self.assertLessEqual(delay, 11)
+
+    def test_exponential_jitter_bounds(self):
+        for attempt in range(6):
+            delay = compute_backoff(attempt, base_delay=2, max_delay=30)
+            self.assertLessEqual(delay, min(30, 2 * 2 ** attempt))
+            self.assertGreaterEqual(delay, 0)
+
+
+class TestLLMServiceRetry(unittest.TestCase):
+    """LLMService 재시도/제한 연동 테스트"""
+
+    def setUp(self):
+        self.config = LLMConfig()
+        self.config.provider = 'ollama'
+        self.config.ollama_warmup = False
+        self.config.llm_cache_enabled = False
+        self.config.max_retries = 3
+        self.config.concurrency_initial = 4
+        self.config.concurrency_max = 4
+
+    def test_429_retry_after_and_backoff(self):
+        """429 응답의 Retry-After를 따르고 동시성 한도를 줄임"""
+        service = LLMService(self.config)
+        responses = [http_error(429, {'Retry-After': '5'}), "응답"]
+
+        def fake_call(messages):
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with mock.patch.object(service, '_call_ollama', side_effect=fake_call), \
+                mock.patch('src.Service.llm_service.time.sleep') as sleep:
+            self.assertEqual(service.call_api_with_retry([{"role": "user", "content": "x"}]), "응답")
+
+        self.assertGreaterEqual(sleep.call_args_list[-1][0][0], 5)
+        self.assertEqual(service.get_rate_limit_stats()['ollama']['concurrency_limit'], 2)
+
+    def test_non_overload_error_keeps_limit(self):
+        """과부하가 아닌 오류는 한도를 유지하고 마지막 시도 후 예외 전파"""
+        service = LLMService(self.config)
+        with mock.patch.object(service, '_call_ollama', side_effect=http_error(500)), \
+                mock.patch('src.Service.llm_service.time.sleep'):
+            with self.assertRaises(requests.HTTPError):
+                service.call_api_with_retry([{"role": "user", "content": "x"}])
+
+        self.assertEqual(service.get_rate_limit_stats()['ollama']['concurrency_limit'], 4)
+        self.assertEqual(service.get_rate_limit_stats()['ollama']['in_flight'], 0)
+
+    def test_default_limits_leave_room_to_grow(self):
+        """기본 설정에서 적응형 동시성 한도가 시작값보다 높아 늘어날 여지가 있음"""
+        keys = ('MAX_WORKERS', 'MAX_CONCURRENCY', 'ADAPTIVE_CONCURRENCY', 'CONCURRENCY_INITIAL', 'CONCURRENCY_MAX')
+        with mock.patch.dict(os.environ, {key: '' for key in keys}):
+            for key in keys:
+                del os.environ[key]
+            config = LLMConfig()
+
+        self.assertLess(config.concurrency_initial, config.concurrency_max)
+        self.assertEqual(config.max_concurrency, config.concurrency_max)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+실행 통계 테스트
+"""
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Entity.flashcard import Flashcard
+from src.Utils.run_stats import RunStatistics, ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRunStatistics(unittest.TestCase):
+    """RunStatistics 클래스 테스트"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.stats = RunStatistics(clock=self.clock)
+
+    def test_running_aggregates(self):
+        """평균 길이, 태그 분포, 통과/제외 수를 누적"""
+        self.stats.section_finished(10, [Flashcard("ab", "abcd", ["x", "y"]), Flashcard("abcd", "ab", ["x"])])
+        self.stats.section_finished(10, None)
+        self.stats.record_rejected(2)
+
+        snapshot = self.stats.snapshot()
+        self.assertEqual(snapshot['total_cards'], 2)
+        self.assertEqual(snapshot['rejected_cards'], 2)
+        self.assertEqual(snapshot['acceptance_rate'], 0.5)
+        self.assertEqual(snapshot['avg_question_length'], 3.0)
+        self.assertEqual(snapshot['avg_answer_length'], 3.0)
+        self.assertEqual(snapshot['tags_distribution'], {'x': 2, 'y': 1})
+        self.assertEqual((snapshot['sections_done'], snapshot['sections_failed']), (2, 1))
+
+    def test_progress_and_eta(self):
+        """처리한 텍스트 비율로 진행률, 남은 섹션 수, 예상 남은 시간 계산"""
+        self.stats.add_files(1)
+        self.stats.add_text(1000)
+        for _ in range(3):
+            self.stats.section_queued(100)
+        self.stats.section_finished(100, [Flashcard("q", "a")])
+        self.stats.section_finished(100, [])
+        self.clock.now += 20
+
+        snapshot = self.stats.snapshot()
+        self.assertAlmostEqual(snapshot['progress'], 0.2)
+        # 분할된 1개 + 아직 분할되지 않은 700자 / 섹션당 100자
+        self.assertEqual(snapshot['sections_remaining'], 8)
+        self.assertAlmostEqual(snapshot['eta_seconds'], 80.0)
+        self.assertAlmostEqual(snapshot['cards_per_second'], 0.05)
+        self.assertIn("진행률 20.0%", self.stats.format_progress())
+        self.assertIn("파일 0/1", self.stats.format_progress())
+
+    def test_clock_starts_with_first_file(self):
+        """객체를 만든 뒤 처리 시작 전까지 흐른 시간은 경과 시간에 포함하지 않음"""
+        self.clock.now += 300  # 예: 대화형 메뉴에서 입력을 기다린 시간
+        self.stats.add_files(1)
+        self.stats.add_text(100)
+        self.stats.section_queued(100)
+        self.clock.now += 10
+        self.stats.section_finished(100, [Flashcard("q", "a")] * 5)
+
+        snapshot = self.stats.snapshot()
+        self.assertAlmostEqual(snapshot['elapsed_seconds'], 10.0)
+        self.assertAlmostEqual(snapshot['cards_per_second'], 0.5)
+
+    def test_empty_snapshot(self):
+        """처리 전에는 0과 None"""
+        snapshot = self.stats.snapshot()
+        self.assertEqual(snapshot['progress'], 0.0)
+        self.assertIsNone(snapshot['eta_seconds'])
+        self.assertEqual(snapshot['avg_question_length'], 0.0)
+
+    def test_reporter_reports_final_state(self):
+        """보고기는 멈출 때 마지막 상태를 한 번 더 보고하고, 주기가 0이면 보고하지 않음"""
+        lines = []
+        with ProgressReporter(self.stats, interval=60, report=lines.append):
+            self.stats.section_finished(1, [Flashcard("q", "a")])
+        self.assertEqual(len(lines), 1)
+        self.assertIn("카드 1개", lines[0])
+
+        with ProgressReporter(self.stats, interval=0, report=lines.append):
+            pass
+        self.assertEqual(len(lines), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+섹션 묶음 처리기 테스트
+"""
+import unittest
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.section_packer import SectionPacker
+
+
+class TestSectionPacker(unittest.TestCase):
+    """SectionPacker 클래스 테스트"""
+
+    def setUp(self):
+        self.batches = []
+
+    async def send(self, sections):
+        self.batches.append(list(sections))
+        await asyncio.sleep(0)
+        return [section.upper() for section in sections]
+
+    def run_sections(self, packer, sections):
+        async def run():
+            return await asyncio.gather(*(packer.submit(text, tokens) for text, tokens in sections))
+        return asyncio.run(run())
+
+    def test_flush_on_section_count(self):
+        """섹션 수가 차면 바로 보내고 결과는 섹션별로 돌아감"""
+        packer = SectionPacker(self.send, max_tokens=1000, max_sections=2, linger_seconds=10)
+
+        results = self.run_sections(packer, [("a", 10), ("b", 10), ("c", 10), ("d", 10)])
+
+        self.assertEqual(results, ["A", "B", "C", "D"])
+        self.assertEqual(self.batches, [["a", "b"], ["c", "d"]])
+        self.assertEqual(packer.get_stats()['avg_sections_per_request'], 2.0)
+
+    def test_flush_before_exceeding_token_budget(self):
+        """예산을 넘기게 되는 섹션은 다음 묶음으로"""
+        packer = SectionPacker(self.send, max_tokens=100, max_sections=10, linger_seconds=0.01)
+
+        self.run_sections(packer, [("a", 40), ("b", 40), ("c", 40)])
+
+        self.assertEqual(self.batches, [["a", "b"], ["c"]])
+
+    def test_linger_sends_partial_pack(self):
+        packer = SectionPacker(self.send, max_tokens=1000, max_sections=10, linger_seconds=0.01)
+
+        self.assertEqual(self.run_sections(packer, [("a", 10)]), ["A"])
+        self.assertEqual(self.batches, [["a"]])
+
+    def test_accepts_only_small_sections(self):
+        packer = SectionPacker(self.send, max_tokens=1000)
+        self.assertTrue(packer.accepts(500))
+        self.assertFalse(packer.accepts(501))
+
+    def test_failure_propagates_to_every_section(self):
+        async def failing_send(sections):
+            raise RuntimeError("요청 실패")
+
+        packer = SectionPacker(failing_send, max_tokens=1000, max_sections=2, linger_seconds=10)
+
+        async def run():
+            return await asyncio.gather(packer.submit("a", 1), packer.submit("b", 1), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
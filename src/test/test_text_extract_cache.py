@@ -0,0 +1,96 @@
+"""
+추출 텍스트 캐시 테스트
+"""
+import unittest
+import sys
+import os
+import tempfile
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.Utils.text_extract_cache import ExtractedTextCache
+
+
+class TestExtractedTextCache(unittest.TestCase):
+    """ExtractedTextCache 클래스 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = os.path.join(self.tmp_dir.name, 'text.sqlite')
+        self.doc_path = self.write_doc('doc.pdf', b'%PDF original content')
+
+    def write_doc(self, name, data):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_hit_and_miss(self):
+        """저장한 페이지와 메타데이터를 그대로 반환 (경로별 값은 저장하지 않음)"""
+        cache = ExtractedTextCache(self.cache_path)
+        self.addCleanup(cache.close)
+
+        self.assertIsNone(cache.get(self.doc_path))
+        pages = ["첫 페이지", "", "셋째 페이지"]
+        cache.set(self.doc_path, pages, {'title': '제목', 'author': '저자', 'pages': 3, 'file_name': 'doc.pdf'})
+
+        self.assertEqual(cache.get(self.doc_path), (pages, {'title': '제목', 'author': '저자', 'pages': 3}))
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+
+    def test_size_and_mtime_precheck_skips_hashing(self):
+        """크기와 수정 시각이 같으면 파일을 다시 해시하지 않음"""
+        cache = ExtractedTextCache(self.cache_path)
+        self.addCleanup(cache.close)
+        cache.set(self.doc_path, ["a"], {'pages': 1})
+
+        with mock.patch('hashlib.sha256') as sha256:
+            cache.get(self.doc_path)
+            cache.get(self.doc_path)
+        sha256.assert_not_called()
+        self.assertEqual(cache.get_stats()['hashes_computed'], 1)
+
+    def test_keyed_by_content(self):
+        """내용이 바뀌면 미스, 같은 내용의 다른 파일은 적중"""
+        cache = ExtractedTextCache(self.cache_path)
+        self.addCleanup(cache.close)
+        cache.set(self.doc_path, ["a"], {'pages': 1})
+
+        copy_path = self.write_doc('copy.pdf', b'%PDF original content')
+        self.assertEqual(cache.get(copy_path)[0], ["a"])
+
+        self.write_doc('doc.pdf', b'%PDF changed content!')
+        os.utime(self.doc_path, ns=(0, 10 ** 9))
+        self.assertIsNone(cache.get(self.doc_path))
+
+    def test_persistence(self):
+        """다시 연 캐시에서도 조회 가능"""
+        cache = ExtractedTextCache(self.cache_path)
+        cache.set(self.doc_path, ["a", "b"], {'pages': 2})
+        cache.close()
+
+        reopened = ExtractedTextCache(self.cache_path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get(self.doc_path)[0], ["a", "b"])
+
+    def test_eviction_by_total_size(self):
+        """전체 크기가 한도를 넘으면 가장 오래 사용되지 않은 문서부터 삭제"""
+        cache = ExtractedTextCache(self.cache_path, max_size_mb=0.004)
+        self.addCleanup(cache.close)
+        random_page = os.urandom(3000).hex()  # 압축해도 약 3KB인 텍스트
+
+        first = self.write_doc('first.pdf', b'first')
+        second = self.write_doc('second.pdf', b'second')
+        cache.set(first, [random_page], {'pages': 1})
+        cache.set(second, [random_page[::-1]], {'pages': 1})
+
+        self.assertIsNone(cache.get(first))
+        self.assertIsNotNone(cache.get(second))
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@
 import unittest
 import sys
 import os
+import re
+from unittest import mock
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -36,5 +38,96 @@ class TestTextProcessor(unittest.TestCase):
         self.assertTrue(all(isinstance(s, str) for s in sections))
 
 
+
+class WhitespaceEncoding:
+    """공백 단위로 토큰을 세는 테스트용 인코딩 (tiktoken 인코딩 다운로드 불필요)"""
+    
+    def __init__(self):
+        self.encode_calls = 0
+        self.batch_calls = 0
+    
+    def encode(self, text):
+        self.encode_calls += 1
+        return text.split()
+    
+    def encode_batch(self, texts, num_threads=8):
+        self.batch_calls += 1
+        return [text.split() for text in texts]
+
+
+def legacy_divide_text(text, encoding, max_tokens=1500):
+    """문장마다 토큰 수를 따로 세던 기존 분할 알고리즘 (비교 기준)"""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sections, current_section, current_tokens = [], [], 0
+    for sentence in sentences:
+        sentence_tokens = len(encoding.encode(sentence))
+        if current_tokens + sentence_tokens > max_tokens and current_section:
+            sections.append(' '.join(current_section))
+            current_section, current_tokens = [sentence], sentence_tokens
+        else:
+            current_section.append(sentence)
+            current_tokens += sentence_tokens
+    if current_section:
+        sections.append(' '.join(current_section))
+    return sections
+
+
+class TestTokenOffsetChunker(unittest.TestCase):
+    """배치 토큰화 기반 분할 테스트"""
+    
+    def setUp(self):
+        self.encoding = WhitespaceEncoding()
+        patcher = mock.patch.object(TextProcessor, '_get_encoding', return_value=self.encoding)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_identical_to_legacy_sections(self):
+        """기존 알고리즘과 같은 섹션 생성"""
+        text = " ".join(
+            f"Sentence {i} has {'word ' * (i % 7)}content{'!' if i % 3 else '?'}" for i in range(500)
+        ) + " Trailing words without end"
+        for max_tokens in (1, 5, 17, 50, 1500):
+            self.assertEqual(
+                TextProcessor.smart_divide_text(text, max_tokens=max_tokens),
+                legacy_divide_text(text, self.encoding, max_tokens=max_tokens)
+            )
+    
+    def test_chunked_input_matches_whole_text(self):
+        """조각으로 나뉜 입력도 전체 텍스트와 같은 섹션 생성"""
+        text = " ".join(f"Sentence {i} is here{'.' if i % 4 else '?'}  " for i in range(300))
+        expected = TextProcessor.smart_divide_text(text, max_tokens=20)
+        for size in (1, 7, 64, len(text)):
+            chunks = (text[i:i + size] for i in range(0, len(text), size))
+            self.assertEqual(list(TextProcessor.iter_divide_text(chunks, max_tokens=20)), expected)
+    
+    def test_long_sentence_scanned_once(self):
+        """여러 조각에 걸친 긴 문장도 이미 확인한 부분은 다시 훑지 않음 (조각 경계의 구분자도 찾음)"""
+        boundary = TextProcessor.SENTENCE_BOUNDARY
+        scanned = []
+
+        class CountingPattern:
+            def finditer(self, string, pos=0):
+                scanned.append(len(string) - pos)
+                return boundary.finditer(string, pos)
+
+        chunks = ["x" * 100] * 2000 + ["end.", " Next", " one!", " "]
+        with mock.patch.object(TextProcessor, 'SENTENCE_BOUNDARY', CountingPattern()):
+            sentences = list(TextProcessor.iter_sentences(iter(chunks)))
+
+        self.assertEqual(sentences, ["x" * 200000 + "end.", "Next one!", ""])
+        self.assertLess(sum(scanned), 2 * len("".join(chunks)))
+
+    def test_empty_text(self):
+        """빈 텍스트도 기존과 같은 결과"""
+        self.assertEqual(TextProcessor.smart_divide_text(""), legacy_divide_text("", self.encoding))
+    
+    def test_batched_encoding(self):
+        """문장마다 encode를 호출하지 않고 배치로 토큰화"""
+        text = "A b. " * 5000
+        TextProcessor.smart_divide_text(text, max_tokens=100)
+        self.assertEqual(self.encoding.encode_calls, 0)
+        self.assertEqual(self.encoding.batch_calls, -(-5000 // TextProcessor.ENCODE_BATCH_SIZE))
+
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file